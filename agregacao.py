@@ -0,0 +1,212 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Union
+import numpy as np
+import pandas as pd
+from esquema import MEDIDAS
+from filtros import ATRIBUTO_DONO, Selecao
+
+# Chave em attrs com a identidade dos dados filtrados (ver identidade)
+ATRIBUTO_CHAVE = "chave_agregacao"
+
+# Quantidade máxima de agregações guardadas; as menos usadas recentemente saem primeiro
+TAMANHO_MEMO = 256
+
+_memo: "OrderedDict[Hashable, pd.DataFrame]" = OrderedDict()
+_trava = threading.Lock()
+
+
+def identidade(versao: Optional[str], origem: str, filtros: Optional[Dict[str, object]] = None) -> dict:
+    """
+    Monta os attrs que identificam dados filtrados, para que as agregações sobre eles sejam
+    reaproveitadas entre os gráficos, os reruns e as sessões. Sem versão, não há identidade.
+
+    Args:
+        versao (Optional[str]): Hash do dataset de origem
+        origem (str): Conjunto de onde os dados vieram (ex.: um agregado do cubo)
+        filtros (Optional[Dict[str, object]]): Filtros aplicados
+
+    Returns:
+        dict: attrs para a Selecao ou o DataFrame filtrado (ver filtros.definir_attrs)
+    """
+    if versao is None:
+        return {}
+    return {ATRIBUTO_CHAVE: (versao, origem, tuple(sorted((filtros or {}).items())))}
+
+
+def chave_de(dados: Union[pd.DataFrame, Selecao]) -> Optional[Hashable]:
+    """
+    Identidade dos dados (ver identidade), usada como chave pelos caches das agregações e dos gráficos.
+
+    Uma Selecao tem a identidade com que foi criada. Um DataFrame (ou Series) só tem a que foi definida
+    nele mesmo (ver filtros.definir_attrs): a herdada pelo pandas de outro DataFrame, do qual ele foi
+    filtrado ou copiado, não identifica o seu conteúdo.
+
+    Args:
+        dados (Union[pd.DataFrame, Selecao]): Dados recebidos por uma agregação ou um gráfico
+
+    Returns:
+        Optional[Hashable]: Identidade, ou None se os dados não têm uma própria
+    """
+    attrs = getattr(dados, 'attrs', {})
+    if not isinstance(dados, Selecao):
+        dono = attrs.get(ATRIBUTO_DONO)
+        if dono is None or dono() is not dados:
+            return None
+    return attrs.get(ATRIBUTO_CHAVE)
+
+
+def somar_por(dados: Union[pd.DataFrame, Selecao], dimensao: str) -> pd.DataFrame:
+    """
+    Soma todas as medidas em R$ por valor da dimensão em um único groupby. Para uma Selecao
+    agrupada por uma coluna categórica, soma direto pelos códigos das linhas selecionadas, sem copiá-las.
+
+    Para dados marcados com identidade, o resultado é guardado por (versão do dataset, filtros, dimensão)
+    e devolvido pronto a quem pedir a mesma combinação. O resultado é compartilhado: não deve ser alterado.
+
+    Args:
+        dados (Union[pd.DataFrame, Selecao]): Linhas ou agregados filtrados
+        dimensao (str): Coluna de agrupamento (ex.: 'Vendedor', 'Região', 'Período')
+
+    Returns:
+        pd.DataFrame: Uma linha por valor da dimensão, com a dimensão e as medidas presentes
+    """
+    identidade = chave_de(dados)
+    chave = (identidade, dimensao) if identidade is not None else None
+    if chave is not None:
+        with _trava:
+            if chave in _memo:
+                _memo.move_to_end(chave)
+                return _memo[chave]
+
+    medidas = [c for c in MEDIDAS if c in dados.columns]
+    if isinstance(dados, Selecao) and isinstance(dados.base[dimensao].dtype, pd.CategoricalDtype):
+        resultado = _somar_por_codigos(dados, dimensao, medidas)
+    else:
+        if isinstance(dados, Selecao):
+            dados = dados.dataframe([dimensao] + medidas)
+        resultado = dados.groupby(dimensao, observed=True)[medidas].sum().reset_index()
+    resultado.attrs = {}
+
+    if chave is not None:
+        with _trava:
+            _memo[chave] = resultado
+            while len(_memo) > TAMANHO_MEMO:
+                _memo.popitem(last=False)
+    return resultado
+
+
+def serie_mensal(dados: Union[pd.DataFrame, Selecao]) -> pd.DataFrame:
+    """
+    Soma as medidas por mês, com a rentabilidade percentual de cada mês calculada de uma vez sobre a série.
+
+    Sobre o agregado cubo.AGREGADO_SERIE, que já vem por mês, soma só as linhas selecionadas.
+    Linhas com datas dentro do mês (ex.: os dados de um vendedor) são levadas ao primeiro dia do mês.
+
+    Args:
+        dados (Union[pd.DataFrame, Selecao]): Série mensal ou linhas filtradas, com 'Período'
+
+    Returns:
+        pd.DataFrame: Uma linha por mês, em ordem cronológica, com 'Período', as medidas e
+            'Rentabilidade (%)' (0 nos meses sem vendas) quando houver margem e vendas
+    """
+    serie = somar_por(dados, 'Período')
+    meses = serie['Período'].dt.to_period('M').dt.to_timestamp()
+    if not meses.equals(serie['Período']):
+        medidas = [c for c in serie.columns if c != 'Período']
+        serie = serie[medidas].groupby(meses.rename('Período')).sum().reset_index()
+
+    if 'Prec_Ven_Total' in serie.columns and 'R$_Marg_Contribuicao' in serie.columns:
+        vendas = serie['Prec_Ven_Total'].to_numpy(dtype='float64')
+        margem = serie['R$_Marg_Contribuicao'].to_numpy(dtype='float64')
+        rentabilidade = np.divide(margem, vendas, out=np.zeros_like(vendas), where=vendas != 0) * 100
+        serie = serie.assign(**{'Rentabilidade (%)': rentabilidade})
+    return serie
+
+
+def _somar_por_codigos(selecao: Selecao, dimensao: str, medidas: List[str]) -> pd.DataFrame:
+    """Equivale ao groupby(observed=True) da seleção, somando com np.bincount pelos códigos da categoria."""
+    coluna = selecao.base[dimensao]
+    codigos = coluna.cat.codes.to_numpy()
+    if selecao.linhas is not None:
+        codigos = codigos[selecao.linhas]
+    # Nulos (ex.: medida ausente em uma das planilhas unidas) não entram na soma, como no groupby
+    valores = np.nan_to_num(selecao[medidas].to_numpy(dtype='float64'), nan=0.0, posinf=np.inf, neginf=-np.inf)
+
+    validos = codigos >= 0
+    codigos, valores = codigos[validos], valores[validos]
+    categorias = len(coluna.cat.categories)
+    presentes = np.flatnonzero(np.bincount(codigos, minlength=categorias))
+
+    resultado = {dimensao: pd.Categorical.from_codes(presentes, dtype=coluna.dtype)}
+    for j, medida in enumerate(medidas):
+        resultado[medida] = np.bincount(codigos, weights=valores[:, j], minlength=categorias)[presentes]
+    return pd.DataFrame(resultado)
+
+
+@dataclass(frozen=True)
+class TopN:
+    """Maiores membros de uma dimensão por uma medida e o total somado dos demais membros."""
+    dimensao: str
+    medida: str
+    rotulos: List[object]  # Em ordem decrescente de valor; empates na ordem dos membros
+    valores: np.ndarray
+    resto: float
+
+    def dataframe(self, rotulo_resto: Optional[str] = None) -> pd.DataFrame:
+        """
+        Monta o DataFrame do gráfico: os maiores membros e, se pedido, uma linha com o resto.
+
+        Args:
+            rotulo_resto (Optional[str]): Rótulo da linha com o resto (ex.: 'Outros'); sem ele, a linha não é incluída
+
+        Returns:
+            pd.DataFrame: Colunas dimensao e medida, uma linha por membro
+        """
+        rotulos, valores = list(self.rotulos), self.valores.tolist()
+        if rotulo_resto is not None:
+            rotulos.append(rotulo_resto)
+            valores.append(self.resto)
+        return pd.DataFrame({self.dimensao: pd.Series(rotulos, dtype=object), self.medida: pd.Series(valores, dtype='float64')})
+
+
+def top_n(agregado: pd.DataFrame, dimensao: str, medida: str, n: int, total: Optional[float] = None) -> TopN:
+    """
+    Seleciona os n maiores membros de um agregado por dimensão sem ordenar todos os membros:
+    np.partition acha o n-ésimo maior valor e só os membros a partir dele são ordenados.
+
+    Empates são desfeitos pela ordem dos membros no agregado (a ordem das categorias, em
+    somar_por), igual ao nlargest(keep='first'): o mesmo filtro sempre mostra os mesmos membros.
+    Membros com valor nulo ficam fora dos maiores, também como no nlargest, e do resto.
+
+    Args:
+        agregado (pd.DataFrame): Uma linha por membro, como o retorno de somar_por
+        dimensao (str): Coluna com os membros
+        medida (str): Coluna usada na ordenação
+        n (int): Quantidade de membros
+        total (Optional[float]): Total da medida a partir do qual o resto é calculado (total - maiores);
+            por padrão, o resto é a soma dos membros fora dos n maiores
+
+    Returns:
+        TopN: Rótulos e valores dos maiores membros e o resto
+    """
+    valores = agregado[medida].to_numpy(dtype='float64')
+    validos = np.flatnonzero(~np.isnan(valores))
+    k = max(0, min(n, len(validos)))
+    if 0 < k < len(validos):
+        limiar = np.partition(valores[validos], len(validos) - k)[len(validos) - k]
+        candidatos = validos[valores[validos] >= limiar]
+    else:
+        candidatos = validos[:k]  # nenhum ou todos os membros
+    # Decrescente por valor e, no empate, crescente pela posição do membro
+    escolhidos = candidatos[np.lexsort((candidatos, -valores[candidatos]))][:k]
+
+    if total is not None:
+        resto = float(total - valores[escolhidos].sum())
+    else:
+        fora = np.ones(len(valores), dtype=bool)
+        fora[escolhidos] = False
+        resto = float(np.nansum(valores[fora]))
+    rotulos = agregado[dimensao].to_numpy(dtype=object)[escolhidos].tolist()
+    return TopN(dimensao, medida, rotulos, valores[escolhidos], resto)
@@ -0,0 +1,183 @@
+"""
+Mede a inicialização do dashboard: o tempo de import de cada módulo e o tempo até a primeira
+renderização completa (primeira pintura) das páginas.
+
+Cada medida roda em um processo novo, sem nada importado nem em cache, como no primeiro acesso
+depois de subir o servidor. As páginas rodam pelo AppTest do Streamlit, sem navegador.
+
+Uso:
+    python benchmark_inicializacao.py
+    python benchmark_inicializacao.py --repeticoes 5 --paginas home3.py
+"""
+import time
+
+# Início do processo, antes dos imports pesados, para a medida da primeira pintura
+_INICIO = time.perf_counter()
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+DIRETORIO = Path(__file__).parent
+
+# Módulos do projeto, na ordem em que as páginas os importam
+MODULOS = (
+    "esquema", "registro", "agregacao", "filtros", "cubo", "dados", "recalculo", "indicadores",
+    "serializacao", "recursos", "paineis", "minigraficos", "cache_graficos", "figuras", "graficos", "chats",
+    "grafico_vendedor",
+)
+PAGINAS = ("home3.py", "pages/vendedor.py")
+# Bibliotecas de gráfico e de leitura das planilhas (só usada no registro, ver tarefas) que não deveriam
+# ser carregadas só por importar os módulos. O pacote plotly em si sempre aparece: o próprio Streamlit
+# o importa (streamlit.elements.plotly_chart)
+BIBLIOTECAS_PESADAS = ("plotly.express", "matplotlib.pyplot", "openpyxl")
+# Tempo máximo de uma execução de página no AppTest, em segundos
+TEMPO_LIMITE = 300
+
+# Linha do -X importtime: "import time:  self [us] | cumulative | imported package"
+_LINHA_IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class TempoImport:
+    """Tempo de import de um módulo em um processo novo."""
+    modulo: str
+    segundos: float  # Tempo cumulativo, com as dependências
+    bibliotecas: List[str]  # Bibliotecas de BIBLIOTECAS_PESADAS carregadas pelo import
+    erro: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class PrimeiraPintura:
+    """Tempos de uma página, do início do processo ao fim da primeira execução e de um rerun."""
+    pagina: str
+    primeira: float  # Início do processo até o fim da primeira execução, com os imports
+    execucao: float  # Só a primeira execução do script
+    rerun: float  # Segunda execução, com os módulos e caches já carregados
+    bibliotecas: List[str]  # Bibliotecas de BIBLIOTECAS_PESADAS carregadas ao fim da primeira execução
+    erro: Optional[str] = None
+
+
+def medir_import(modulo: str) -> TempoImport:
+    """
+    Importa um módulo em um processo novo com -X importtime.
+
+    Args:
+        modulo (str): Nome do módulo
+
+    Returns:
+        TempoImport: Tempo cumulativo do import e bibliotecas pesadas carregadas
+    """
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=DIRETORIO, capture_output=True, text=True, timeout=TEMPO_LIMITE,
+    )
+    cumulativos: Dict[str, int] = {}
+    for linha in processo.stderr.splitlines():
+        encontrado = _LINHA_IMPORTTIME.match(linha)
+        if encontrado:
+            cumulativos[encontrado.group(4)] = int(encontrado.group(2))
+    erro = None
+    if processo.returncode != 0:
+        erro = (processo.stderr.strip().splitlines() or ["erro"])[-1]
+    return TempoImport(
+        modulo,
+        cumulativos.get(modulo, 0) / 1e6,
+        [biblioteca for biblioteca in BIBLIOTECAS_PESADAS if biblioteca in cumulativos],
+        erro,
+    )
+
+
+def _executar_pagina(pagina: str) -> PrimeiraPintura:
+    """Roda a página no processo atual (chamado pelo --pagina em um processo novo)."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(DIRETORIO / pagina), default_timeout=TEMPO_LIMITE)
+    antes = time.perf_counter()
+    app.run()
+    depois = time.perf_counter()
+    erro = "; ".join(str(excecao.value) for excecao in app.exception) or None
+    bibliotecas = [biblioteca for biblioteca in BIBLIOTECAS_PESADAS if biblioteca in sys.modules]
+
+    inicio_rerun = time.perf_counter()
+    app.run()
+    rerun = time.perf_counter() - inicio_rerun
+    return PrimeiraPintura(pagina, depois - _INICIO, depois - antes, rerun, bibliotecas, erro)
+
+
+def medir_pagina(pagina: str) -> PrimeiraPintura:
+    """
+    Mede a primeira pintura de uma página em um processo novo.
+
+    Args:
+        pagina (str): Caminho do script da página, relativo ao projeto
+
+    Returns:
+        PrimeiraPintura: Tempos da primeira execução e do rerun
+    """
+    processo = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--pagina", pagina],
+        cwd=DIRETORIO, capture_output=True, text=True, timeout=TEMPO_LIMITE * 2,
+    )
+    if processo.returncode != 0:
+        erro = (processo.stderr.strip().splitlines() or ["erro"])[-1]
+        return PrimeiraPintura(pagina, 0.0, 0.0, 0.0, [], erro)
+    # O resultado é a última linha da saída; as anteriores são logs da página
+    return PrimeiraPintura(**json.loads(processo.stdout.strip().splitlines()[-1]))
+
+
+def _mediana(valores: Sequence[float]) -> float:
+    return statistics.median(valores) if valores else 0.0
+
+
+def relatorio(modulos: Sequence[str], paginas: Sequence[str], repeticoes: int) -> str:
+    """
+    Mede os imports e as páginas e monta o relatório em texto, com a mediana das repetições.
+
+    Args:
+        modulos (Sequence[str]): Módulos a importar
+        paginas (Sequence[str]): Páginas a executar
+        repeticoes (int): Processos novos por medida
+
+    Returns:
+        str: Tabelas de imports e de primeira pintura
+    """
+    linhas = [f"Imports (mediana de {repeticoes}, processo novo a cada vez)",
+              f"{'módulo':<20}{'ms':>10}  bibliotecas pesadas"]
+    for modulo in modulos:
+        medidas = [medir_import(modulo) for _ in range(repeticoes)]
+        ultima = medidas[-1]
+        detalhe = ultima.erro or (", ".join(ultima.bibliotecas) or "-")
+        linhas.append(f"{modulo:<20}{_mediana([m.segundos for m in medidas]) * 1000:>10.1f}  {detalhe}")
+
+    linhas += ["", f"Primeira pintura (mediana de {repeticoes})",
+               f"{'página':<20}{'primeira (s)':>14}{'execução (s)':>14}{'rerun (s)':>12}  bibliotecas pesadas"]
+    for pagina in paginas:
+        medidas = [medir_pagina(pagina) for _ in range(repeticoes)]
+        ultima = medidas[-1]
+        detalhe = ultima.erro or (", ".join(ultima.bibliotecas) or "-")
+        linhas.append(
+            f"{pagina:<20}{_mediana([m.primeira for m in medidas]):>14.2f}"
+            f"{_mediana([m.execucao for m in medidas]):>14.2f}{_mediana([m.rerun for m in medidas]):>12.2f}  {detalhe}"
+        )
+    return "\n".join(linhas)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tempo de import dos módulos e de primeira pintura das páginas")
+    parser.add_argument("--repeticoes", type=int, default=3, help="processos novos por medida")
+    parser.add_argument("--modulos", nargs="*", default=list(MODULOS), help="módulos a importar")
+    parser.add_argument("--paginas", nargs="*", default=list(PAGINAS), help="páginas a executar")
+    parser.add_argument("--pagina", help=argparse.SUPPRESS)  # Uso interno: mede uma página neste processo
+    argumentos = parser.parse_args()
+
+    if argumentos.pagina:
+        print(json.dumps(_executar_pagina(argumentos.pagina).__dict__))
+    else:
+        print(relatorio(argumentos.modulos, argumentos.paginas, argumentos.repeticoes))
@@ -0,0 +1,188 @@
+import functools
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+from agregacao import chave_de
+
+# Orçamento padrão do cache; ao passar de qualquer um dos limites, saem os gráficos usados há mais tempo
+MAX_ENTRADAS = 512
+MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class EstatisticasCache:
+    """Ocupação e contadores do cache de gráficos desde o início do processo (ou do último limpar)."""
+    entradas: int
+    bytes: int
+    acertos: int
+    falhas: int
+    descartes: int  # Entradas removidas para respeitar o orçamento
+
+    @property
+    def taxa_acertos(self) -> float:
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else 0.0
+
+
+class CacheGraficos:
+    """
+    Resultados dos gráficos (HTML, figuras, imagens) compartilhados entre todas as sessões.
+
+    As entradas ficam em ordem de uso e saem as usadas há mais tempo quando o cache passa do
+    número de entradas ou do total de bytes. Os valores guardados são devolvidos sem cópia:
+    quem os recebe não deve alterá-los.
+    """
+
+    def __init__(self, max_entradas: int = MAX_ENTRADAS, max_bytes: int = MAX_BYTES):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._entradas: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._acertos = 0
+        self._falhas = 0
+        self._descartes = 0
+        self._trava = threading.Lock()
+
+    def obter(self, chave: Hashable) -> Tuple[bool, Any]:
+        """
+        Procura um resultado guardado e conta o acerto ou a falha.
+
+        Args:
+            chave (Hashable): Chave do gráfico
+
+        Returns:
+            Tuple[bool, Any]: Se a chave foi encontrada e o valor guardado (None se não foi)
+        """
+        with self._trava:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+                self._acertos += 1
+                return True, self._entradas[chave][0]
+            self._falhas += 1
+            return False, None
+
+    def guardar(self, chave: Hashable, valor: Any) -> None:
+        """
+        Guarda um resultado. Valores maiores que o orçamento inteiro de bytes não são guardados.
+
+        Args:
+            chave (Hashable): Chave do gráfico
+            valor (Any): Resultado do gráfico
+        """
+        tamanho = _tamanho(valor)
+        if tamanho > self.max_bytes:
+            return
+        with self._trava:
+            if chave in self._entradas:
+                self._bytes -= self._entradas.pop(chave)[1]
+            self._entradas[chave] = (valor, tamanho)
+            self._bytes += tamanho
+            self._ajustar()
+
+    def configurar(self, max_entradas: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """
+        Altera o orçamento do cache, descartando o que passar dos novos limites.
+
+        Args:
+            max_entradas (Optional[int]): Número máximo de gráficos guardados
+            max_bytes (Optional[int]): Total máximo de bytes guardados
+        """
+        with self._trava:
+            if max_entradas is not None:
+                self.max_entradas = max_entradas
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._ajustar()
+
+    def limpar(self) -> None:
+        """Remove todas as entradas e zera os contadores."""
+        with self._trava:
+            self._entradas.clear()
+            self._bytes = self._acertos = self._falhas = self._descartes = 0
+
+    def estatisticas(self) -> EstatisticasCache:
+        """
+        Retorna a ocupação e os contadores de acertos e falhas.
+
+        Returns:
+            EstatisticasCache: Situação atual do cache
+        """
+        with self._trava:
+            return EstatisticasCache(len(self._entradas), self._bytes, self._acertos, self._falhas, self._descartes)
+
+    def _ajustar(self) -> None:
+        while self._entradas and (len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes):
+            _, (_, tamanho) = self._entradas.popitem(last=False)
+            self._bytes -= tamanho
+            self._descartes += 1
+
+
+def _tamanho(valor: Any) -> int:
+    """Estimativa dos bytes ocupados por um resultado: o texto codificado ou o valor serializado."""
+    if isinstance(valor, str):
+        return len(valor.encode('utf-8'))
+    if isinstance(valor, bytes):
+        return len(valor)
+    try:
+        return len(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(valor)
+
+
+_cache: Optional[CacheGraficos] = None
+_trava = threading.Lock()
+
+
+def cache_graficos() -> CacheGraficos:
+    """
+    Retorna o cache de gráficos do processo, criando-o no primeiro uso.
+
+    Returns:
+        CacheGraficos: Cache compartilhado por todas as sessões
+    """
+    global _cache
+    with _trava:
+        if _cache is None:
+            _cache = CacheGraficos()
+        return _cache
+
+
+def em_cache(funcao: Callable) -> Callable:
+    """
+    Guarda o resultado de uma função de gráfico no cache compartilhado entre as sessões.
+
+    A chave é a função (incluindo seu código, para que uma versão recarregada não reaproveite resultados
+    antigos), a identidade dos dados recebidos no primeiro argumento (versão do dataset, origem e filtros,
+    ver agregacao.chave_de) e os demais argumentos, e não o conteúdo dos dados.
+    Dados sem identidade ou argumentos que não podem ser chave (ex.: um container do Streamlit)
+    fazem a função ser executada normalmente, sem cache.
+
+    Args:
+        funcao (Callable): Função que recebe os dados filtrados e retorna o gráfico
+
+    Returns:
+        Callable: Função com o resultado em cache
+    """
+    @functools.wraps(funcao)
+    def envolvida(dados, *args, **kwargs):
+        identidade = chave_de(dados)
+        if identidade is None:
+            return funcao(dados, *args, **kwargs)
+        chave = (funcao.__module__, funcao.__qualname__, funcao.__code__, identidade, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(chave)
+        except TypeError:
+            return funcao(dados, *args, **kwargs)
+
+        cache = cache_graficos()
+        encontrado, valor = cache.obter(chave)
+        if encontrado:
+            return valor
+        valor = funcao(dados, *args, **kwargs)
+        cache.guardar(chave, valor)
+        return valor
+
+    return envolvida
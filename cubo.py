@@ -0,0 +1,154 @@
+from typing import Dict, List, Optional
+import pandas as pd
+from agregacao import identidade
+from filtros import IndiceFacetas, IndiceFiltros, Selecao
+from esquema import MEDIDAS, aplicar_esquema
+
+# Filtros da barra lateral do dashboard; todos os agregados são quebrados por eles
+DIMENSOES_FILTRO = ['Ano', 'Mês_Num', 'Região', 'Marca']
+
+# Colunas filtráveis dos agregados: 'Mês' é derivado de 'Mês_Num' na carga
+COLUNAS_FILTRO = ['Ano', 'Mês', 'Região', 'Marca']
+
+# Dimensões dos gráficos de ranking, cada uma em um agregado próprio junto com os filtros
+DIMENSOES_CUBO = ['Vendedor', 'Médico', 'Parceiro', 'Grupo', 'Linha']
+
+# Agregado base: só os filtros. Atende os cards, as pizzas por região e o ranking de marcas
+AGREGADO_BASE = ""
+
+# Série mensal: filtros + 'Período' no primeiro dia do mês. Atende os gráficos de evolução
+AGREGADO_SERIE = "Série"
+
+# Quantidade de linhas dos dados somadas em cada linha dos agregados (contagem das opções dos filtros)
+LINHAS = "Linhas"
+
+
+def agregar(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Soma as medidas em R$ de um conjunto de linhas em cada agregado do cubo.
+
+    O resultado fica em formato longo, um agregado abaixo do outro: a coluna 'Dimensao' indica
+    o agregado (AGREGADO_BASE, AGREGADO_SERIE ou uma das DIMENSOES_CUBO) e 'Membro' guarda o valor da dimensão.
+    Linhas sem valor em uma dimensão também são somadas, para os totais baterem com os dados.
+    Cada linha dos agregados guarda também quantas linhas dos dados somou (coluna LINHAS).
+
+    Args:
+        df (pd.DataFrame): Linhas já preparadas, com 'Ano' e 'Mês_Num'
+
+    Returns:
+        pd.DataFrame: Agregados em formato longo
+    """
+    filtros = [c for c in DIMENSOES_FILTRO if c in df.columns]
+    medidas = [c for c in MEDIDAS if c in df.columns]
+    partes = []
+
+    base = _somar(df, filtros, medidas)
+    base['Dimensao'] = AGREGADO_BASE
+    base['Membro'] = None
+    partes.append(base)
+
+    if 'Período' in df.columns:
+        meses = df['Período'].dt.to_period('M').dt.to_timestamp()
+        serie = df[filtros + medidas].assign(**{'Período': meses})
+        serie = _somar(serie, filtros + ['Período'], medidas)
+        serie['Dimensao'] = AGREGADO_SERIE
+        serie['Membro'] = None
+        partes.append(serie)
+
+    for dimensao in DIMENSOES_CUBO:
+        if dimensao not in df.columns:
+            continue
+        agregado = _somar(df, filtros + [dimensao], medidas)
+        membros = agregado.pop(dimensao).astype(object)
+        agregado['Dimensao'] = dimensao
+        agregado['Membro'] = membros.where(membros.isna(), membros.astype(str))
+        partes.append(agregado)
+
+    return pd.concat(partes, ignore_index=True)
+
+
+def _somar(df: pd.DataFrame, chaves: List[str], medidas: List[str]) -> pd.DataFrame:
+    """Soma as medidas por chave e conta as linhas de cada grupo na coluna LINHAS."""
+    grupos = df.groupby(chaves, observed=True, dropna=False)
+    agregado = grupos[medidas].sum()
+    agregado[LINHAS] = grupos.size()
+    return agregado.reset_index()
+
+
+def consolidar(partes: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Junta agregados parciais (ex.: de lotes diferentes do mesmo mês) somando as linhas repetidas.
+
+    Args:
+        partes (List[pd.DataFrame]): Resultados de agregar
+
+    Returns:
+        pd.DataFrame: Agregados em formato longo, sem chaves repetidas
+    """
+    longo = pd.concat(partes, ignore_index=True)
+    valores = [c for c in MEDIDAS + [LINHAS] if c in longo.columns]
+    chaves = [c for c in longo.columns if c not in valores]
+    return longo.groupby(chaves, dropna=False, sort=False)[valores].sum().reset_index()
+
+
+class Cubo:
+    """
+    Agregados pré-calculados do dataset, consultados pelo dashboard no lugar das linhas.
+
+    Cada fatia tem as mesmas colunas das linhas originais (filtros, a dimensão e as medidas),
+    então os gráficos que agrupam e somam as linhas funcionam igual sobre ela. Os filtros
+    são resolvidos por um índice de cada agregado (ver filtros.IndiceFiltros), e as opções
+    de cada filtro, pelas facetas do agregado base (ver filtros.IndiceFacetas).
+    """
+
+    def __init__(self, longo: pd.DataFrame, versao: Optional[str] = None):
+        self.versao = versao
+        self.agregados: Dict[str, pd.DataFrame] = {}
+        self.indices: Dict[str, IndiceFiltros] = {}
+        self.facetas = IndiceFacetas(pd.DataFrame(), COLUNAS_FILTRO)
+        if longo.empty:
+            return
+        for dimensao, agregado in longo.groupby('Dimensao', observed=True, sort=False):
+            agregado = agregado.drop(columns='Dimensao')
+            if dimensao == AGREGADO_BASE:
+                agregado = agregado.drop(columns=['Membro', 'Período'], errors='ignore')
+            elif dimensao == AGREGADO_SERIE:
+                agregado = agregado.drop(columns='Membro')
+            else:
+                agregado = agregado.drop(columns='Período').rename(columns={'Membro': dimensao})
+            agregado = aplicar_esquema(agregado.reset_index(drop=True))
+            self.agregados[str(dimensao)] = agregado
+            self.indices[str(dimensao)] = IndiceFiltros(agregado, COLUNAS_FILTRO)
+            if dimensao == AGREGADO_BASE:
+                self.facetas = IndiceFacetas(agregado, COLUNAS_FILTRO, LINHAS if LINHAS in agregado.columns else None)
+
+    def selecionar(self, dimensao: str = AGREGADO_BASE, filtros: Optional[Dict[str, object]] = None,
+                   anterior: Optional[Selecao] = None) -> Selecao:
+        """
+        Seleciona as linhas de um agregado que atendem aos filtros, sem copiá-las.
+
+        Args:
+            dimensao (str): AGREGADO_BASE, AGREGADO_SERIE ou uma das DIMENSOES_CUBO
+            filtros (Optional[Dict[str, object]]): Valor exigido por coluna de COLUNAS_FILTRO (ex.: {'Ano': 2024, 'Mês': 'Março'})
+            anterior (Optional[Selecao]): Seleção anterior do mesmo agregado, refinada quando possível (ver IndiceFiltros.selecionar)
+
+        Returns:
+            Selecao: Linhas do agregado, com a identidade usada por agregacao.somar_por
+        """
+        attrs = identidade(self.versao, dimensao, filtros)
+        if dimensao not in self.indices:
+            return Selecao(pd.DataFrame(), None, attrs)
+        return self.indices[dimensao].selecionar(filtros, attrs, anterior)
+
+    def fatia(self, dimensao: str = AGREGADO_BASE, filtros: Optional[Dict[str, object]] = None) -> pd.DataFrame:
+        """
+        Retorna as linhas de um agregado que atendem aos filtros como DataFrame (ver selecionar).
+
+        Args:
+            dimensao (str): AGREGADO_BASE, AGREGADO_SERIE ou uma das DIMENSOES_CUBO
+            filtros (Optional[Dict[str, object]]): Valor exigido por coluna de COLUNAS_FILTRO
+
+        Returns:
+            pd.DataFrame: Linhas do agregado, com as colunas dos dados originais
+        """
+        return self.selecionar(dimensao, filtros).dataframe()
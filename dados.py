@@ -0,0 +1,327 @@
+import functools
+import glob
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+import registro
+from cubo import Cubo
+from esquema import DIMENSOES, aplicar_esquema, memoria_mb
+from filtros import IndiceFacetas, IndiceFiltros
+
+logger = logging.getLogger(__name__)
+
+# Planilhas da pasta db (ex.: uma por ano ou versão); são registradas juntas na primeira carga
+PADROES_PLANILHAS = ("*.xlsx", "*.xlsm")
+
+# Intervalo, em segundos, da consulta ao andamento do registro das planilhas da pasta db
+INTERVALO_CONSULTA = 1
+
+
+def planilhas_padrao() -> List[str]:
+    """
+    Lista as planilhas da pasta db usadas quando o registro ainda está vazio.
+
+    Returns:
+        List[str]: Caminhos das planilhas encontradas
+    """
+    return sorted(c for padrao in PADROES_PLANILHAS for c in glob.glob(os.path.join(registro.PASTA_DB, padrao)))
+
+
+# Colunas com índice de filtro sobre as linhas do dataset (filtros da página de vendedor)
+COLUNAS_INDICE = ['Vendedor', 'Ano', 'Mês', 'Região', 'Marca']
+
+# Filtros da página de vendedor, na ordem em que dependem uns dos outros
+COLUNAS_FACETAS = ['Vendedor', 'Ano', 'Mês']
+
+# Origem das seleções sobre as linhas na identidade usada pelos caches (ver agregacao.identidade)
+ORIGEM_LINHAS = "linhas"
+
+
+# Tarefa da fila de ingestão que registra as planilhas da pasta db (ver versao_ativa)
+_tarefa_registro: Optional[str] = None
+_trava_registro = threading.Lock()
+
+
+def versao_ativa() -> Optional[str]:
+    """
+    Retorna o hash do dataset ativo. Se o registro estiver vazio ou ilegível, ou se os arquivos do
+    dataset ativo não puderem ser usados (ex.: convertidos em um formato anterior), as planilhas da
+    pasta db são enviadas à fila de ingestão (ver tarefas.FilaIngestao), sem bloquear a página.
+
+    Returns:
+        Optional[str]: Hash do dataset ativo, ou None até o fim do registro ou se não houver planilha
+    """
+    versao = _versao_registrada(_estado_registro())
+    if versao is None:
+        _registrar_planilhas_padrao()
+    elif _tarefa_registro is not None:
+        _retirar_tarefa_registro()
+    return versao
+
+
+def _registrar_planilhas_padrao() -> None:
+    """Envia as planilhas da pasta db à fila de ingestão, uma única vez por processo."""
+    global _tarefa_registro
+    planilhas = planilhas_padrao()
+    if not planilhas:
+        return
+    # A fila importa a ingestão (openpyxl e o pool de processos), usada só neste caminho
+    from tarefas import fila_ingestao
+    with _trava_registro:
+        if _tarefa_registro is None or fila_ingestao().consultar(_tarefa_registro) is None:
+            _tarefa_registro = fila_ingestao().enviar_planilhas(planilhas)
+            logger.info("Registro das planilhas da pasta db enviado à fila: %s", ", ".join(planilhas))
+
+
+def _retirar_tarefa_registro() -> None:
+    """Retira da fila a tarefa de registro finalizada, quando o dataset já está disponível."""
+    global _tarefa_registro
+    from tarefas import fila_ingestao
+    with _trava_registro:
+        if _tarefa_registro is not None:
+            fila_ingestao().retirar(_tarefa_registro)
+            _tarefa_registro = None
+
+
+def tarefa_registro():
+    """
+    Retorna a tarefa que registra as planilhas da pasta db, se alguma foi enviada (ver versao_ativa).
+
+    Returns:
+        Optional[tarefas.TarefaIngestao]: A tarefa, com o estado e o progresso atuais
+    """
+    if _tarefa_registro is None:
+        return None
+    from tarefas import fila_ingestao
+    return fila_ingestao().consultar(_tarefa_registro)
+
+
+def _avisar_sem_dataset() -> None:
+    """Exibe o andamento do registro das planilhas da pasta db ou, sem registro em andamento, o erro."""
+    tarefa = tarefa_registro()
+    if tarefa is not None and not tarefa.finalizada:
+        _acompanhar_registro()
+    elif tarefa is not None and tarefa.erro is not None:
+        st.error(f"Erro ao registrar as planilhas da pasta db: {tarefa.erro}")
+    else:
+        st.error("Erro: Planilha não encontrada. Faça o upload da planilha de análise.")
+
+
+@st.fragment(run_every=INTERVALO_CONSULTA)
+def _acompanhar_registro() -> None:
+    """Mostra o progresso do registro e, ao fim, reexecuta a página inteira com o novo dataset."""
+    tarefa = tarefa_registro()
+    if tarefa is None or tarefa.finalizada:
+        st.rerun()
+    st.progress(tarefa.progresso, text=tarefa.mensagem)
+    st.caption("Registrando as planilhas da pasta db. O dashboard é exibido ao fim da conversão.")
+
+
+def _estado_registro() -> Optional[Tuple[int, int, int]]:
+    """Inode, tamanho e data de modificação do registro, que mudam a cada gravação (ver registro.gravar_registro)."""
+    try:
+        estado = os.stat(registro.ARQUIVO_REGISTRO)
+    except FileNotFoundError:
+        return None
+    return estado.st_ino, estado.st_size, estado.st_mtime_ns
+
+
+@functools.lru_cache(maxsize=1)
+def _versao_registrada(estado: Optional[Tuple[int, int, int]]) -> Optional[str]:
+    """
+    Hash do dataset ativo, se os seus arquivos puderem ser usados. Memorizado pelo estado do arquivo
+    de registro: as páginas chamam versao_ativa a cada rerun sem reler o registro nem as partições.
+    Um registro ilegível (ex.: gravado pela metade por uma versão anterior) conta como vazio.
+    """
+    try:
+        versao = registro.versao_ativa()
+        if versao is None or registro.buscar_dataset(versao) is None:
+            return None
+    except ValueError:
+        logger.warning("Registro de datasets ilegível: %s", registro.ARQUIVO_REGISTRO)
+        return None
+    return versao
+
+
+def unificar_esquemas(esquemas: Sequence[pa.Schema]) -> pa.Schema:
+    """
+    Concilia os esquemas de partições vindas de planilhas diferentes: uma coluna com o mesmo
+    tipo em todas mantém o tipo, números de tipos diferentes viram float64 e os demais conflitos viram texto.
+
+    Args:
+        esquemas (Sequence[pa.Schema]): Esquemas das partições
+
+    Returns:
+        pa.Schema: Esquema com todas as colunas, na ordem em que aparecem
+    """
+    tipos: Dict[str, list] = {}
+    for esquema in esquemas:
+        for campo in esquema:
+            tipos.setdefault(campo.name, []).append(campo.type)
+
+    campos = []
+    for nome, lista in tipos.items():
+        tipo = lista[0]
+        if any(t != tipo for t in lista):
+            numericos = all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in lista)
+            tipo = pa.float64() if numericos else pa.string()
+        campos.append(pa.field(nome, tipo))
+    return pa.schema(campos)
+
+
+def ajustar_tabela(tabela: pa.Table, esquema: pa.Schema) -> pa.Table:
+    """Converte uma partição para o esquema unificado, criando como nulas as colunas que ela não tem."""
+    colunas = [
+        tabela.column(campo.name).cast(campo.type) if campo.name in tabela.column_names
+        else pa.nulls(tabela.num_rows, campo.type)
+        for campo in esquema
+    ]
+    return pa.Table.from_arrays(colunas, schema=esquema)
+
+
+def ler_versao(versao: Optional[str]) -> pd.DataFrame:
+    """
+    Lê os dados de vendas de uma versão registrada a partir da cópia colunar,
+    já com o esquema compacto (dimensões categóricas, calendário em inteiros pequenos).
+
+    Args:
+        versao (Optional[str]): Hash do dataset
+
+    Returns:
+        pd.DataFrame: Dados preparados da aba DADOS
+    """
+    entrada = registro.buscar_dataset(versao) if versao else None
+    if entrada is None:
+        raise FileNotFoundError(f"Dataset não encontrado: {versao}")
+
+    # As partições mensais são lidas e concatenadas no esquema unificado; colunas ausentes
+    # em alguma delas ficam nulas. As dimensões são lidas direto como dicionário,
+    # sem criar uma string Python por linha
+    tabelas = []
+    for particao in entrada["particoes"].values():
+        colunas = pq.read_schema(particao["arquivo"]).names
+        tabelas.append(pq.read_table(
+            particao["arquivo"], memory_map=True, read_dictionary=[c for c in DIMENSOES if c in colunas]
+        ))
+    esquema = unificar_esquemas([t.schema for t in tabelas])
+    tabela = pa.concat_tables([ajustar_tabela(t, esquema) for t in tabelas])
+    df = aplicar_esquema(tabela.to_pandas())
+
+    memoria = entrada.get("memoria", {})
+    logger.info(
+        "Dataset %s carregado: %.1f MB (estimativa sem esquema: %s MB)",
+        versao[:12], memoria_mb(df), memoria.get("antes_mb", "?")
+    )
+    return df
+
+
+def ler_cubo(versao: Optional[str]) -> Cubo:
+    """
+    Lê os agregados pré-calculados de uma versão registrada (ver cubo.agregar).
+
+    Args:
+        versao (Optional[str]): Hash do dataset
+
+    Returns:
+        Cubo: Agregados de todas as partições mensais
+    """
+    entrada = registro.buscar_dataset(versao) if versao else None
+    if entrada is None:
+        raise FileNotFoundError(f"Dataset não encontrado: {versao}")
+
+    tabelas = [
+        pq.read_table(particao["cubo"], memory_map=True, read_dictionary=["Dimensao", "Membro"])
+        for particao in entrada["particoes"].values()
+    ]
+    esquema = unificar_esquemas([t.schema for t in tabelas])
+    tabela = pa.concat_tables([ajustar_tabela(t, esquema) for t in tabelas])
+    return Cubo(tabela.to_pandas(), versao)
+
+
+@st.cache_resource(max_entries=1)
+def _dataset_compartilhado(versao: Optional[str]) -> pd.DataFrame:
+    """Mantém uma única instância do dataset ativo por processo, compartilhada por páginas e sessões."""
+    return ler_versao(versao)
+
+
+@st.cache_resource(max_entries=1)
+def _cubo_compartilhado(versao: Optional[str]) -> Cubo:
+    """Mantém uma única instância do cubo do dataset ativo por processo."""
+    return ler_cubo(versao)
+
+
+def carregar_cubo() -> Cubo:
+    """
+    Retorna o cubo de agregados do dataset ativo, compartilhado entre todas as páginas e sessões.
+
+    Returns:
+        Cubo: Agregados do dataset, ou um cubo vazio se não houver planilha registrada (ou enquanto as da pasta db são registradas)
+    """
+    try:
+        return _cubo_compartilhado(versao_ativa())
+    except FileNotFoundError:
+        _avisar_sem_dataset()
+        return Cubo(pd.DataFrame())
+
+
+@st.cache_resource(max_entries=1)
+def _indice_compartilhado(versao: Optional[str]) -> IndiceFiltros:
+    """Mantém um único índice de filtros sobre as linhas do dataset ativo por processo."""
+    return IndiceFiltros(_dataset_compartilhado(versao), COLUNAS_INDICE, versao)
+
+
+def carregar_indice() -> IndiceFiltros:
+    """
+    Retorna o índice de filtros sobre as linhas do dataset ativo (ver filtros.IndiceFiltros).
+
+    Returns:
+        IndiceFiltros: Índice compartilhado, ou um índice vazio se não houver planilha registrada
+    """
+    try:
+        return _indice_compartilhado(versao_ativa())
+    except FileNotFoundError:
+        return IndiceFiltros(pd.DataFrame(), COLUNAS_INDICE)
+
+
+@st.cache_resource(max_entries=1)
+def _facetas_compartilhadas(versao: Optional[str]) -> IndiceFacetas:
+    """Mantém um único índice de facetas sobre as linhas do dataset ativo por processo."""
+    return IndiceFacetas(_dataset_compartilhado(versao), COLUNAS_FACETAS)
+
+
+def carregar_facetas() -> IndiceFacetas:
+    """
+    Retorna as opções dos filtros da página de vendedor, com a quantidade de linhas de cada uma (ver filtros.IndiceFacetas).
+
+    Returns:
+        IndiceFacetas: Facetas compartilhadas, ou vazias se não houver planilha registrada
+    """
+    try:
+        return _facetas_compartilhadas(versao_ativa())
+    except FileNotFoundError:
+        return IndiceFacetas(pd.DataFrame(), COLUNAS_FACETAS)
+
+
+def carregar_dados() -> pd.DataFrame:
+    """
+    Retorna o dataset ativo, compartilhado entre todas as páginas e sessões sem cópia dos dados.
+
+    Cada chamada recebe uma cópia rasa: adicionar ou substituir colunas nela não afeta o dataset
+    compartilhado. As páginas ligam o copy-on-write do pandas, com o qual também as escritas nos
+    valores de um DataFrame derivado copiam os dados antes; os gráficos não alteram os dados recebidos
+    (ver tests/test_dados_compartilhados.py).
+
+    Returns:
+        pd.DataFrame: Dados de vendas, ou um DataFrame vazio se não houver planilha registrada (ou enquanto as da pasta db são registradas)
+    """
+    try:
+        df = _dataset_compartilhado(versao_ativa())
+    except FileNotFoundError:
+        _avisar_sem_dataset()
+        return pd.DataFrame()
+    return df.copy(deep=False)
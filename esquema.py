@@ -0,0 +1,80 @@
+import os
+from typing import Dict
+import pandas as pd
+
+# Colunas de dimensão usadas nos filtros e agrupamentos dos gráficos
+DIMENSOES = ['Vendedor', 'Marca', 'Região', 'Grupo', 'Linha', 'Médico', 'Parceiro', 'Produto']
+
+# Colunas de valores em R$ somadas nos cards e gráficos
+MEDIDAS = [
+    'Prec_Ven_Total', 'R$_Tot_Imposto', 'Cus_Total', 'R$_Frete',
+    'R$_Despesa', 'R$_Comissao', 'R$_Inc_Venda', 'R$_Marg_Contribuicao'
+]
+
+NOMES_MESES = [
+    'Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+    'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'
+]
+
+# Tipos inteiros das colunas de calendário
+TIPOS_INTEIROS = {'Ano': 'int16', 'Mês_Num': 'int8', 'Trimestre': 'int8', 'Semana': 'int8'}
+
+# Guarda as medidas em float32 (metade da memória, menos precisão nas somas)
+MEDIDAS_FLOAT32 = os.environ.get("ANALISE_MEDIDAS_FLOAT32") == "1"
+
+
+def aplicar_esquema(df: pd.DataFrame, medidas_float32: bool = MEDIDAS_FLOAT32) -> pd.DataFrame:
+    """
+    Aplica os tipos compactos do dataset: dimensões categóricas (em ordem alfabética), colunas de calendário
+    em inteiros pequenos e 'Mês' como categoria ordenada a partir de 'Mês_Num'.
+
+    Args:
+        df (pd.DataFrame): Dados lidos do arquivo colunar ou de um lote da planilha
+        medidas_float32 (bool): Converte as medidas em R$ para float32
+
+    Returns:
+        pd.DataFrame: Os mesmos dados com os tipos do esquema
+    """
+    tipos = {coluna: 'category' for coluna in DIMENSOES if coluna in df.columns}
+    tipos.update({coluna: tipo for coluna, tipo in TIPOS_INTEIROS.items() if coluna in df.columns})
+    if medidas_float32:
+        tipos.update({coluna: 'float32' for coluna in MEDIDAS if coluna in df.columns})
+    df = df.astype(tipos)
+
+    # Categorias em ordem alfabética, como nos agrupamentos por texto: a ordem não depende
+    # da ordem em que os valores aparecem nas partições
+    for coluna in DIMENSOES:
+        if coluna in df.columns and not df[coluna].cat.categories.is_monotonic_increasing:
+            df[coluna] = df[coluna].cat.reorder_categories(df[coluna].cat.categories.sort_values())
+
+    if 'Mês_Num' in df.columns:
+        df['Mês'] = pd.Categorical.from_codes(df['Mês_Num'].to_numpy() - 1, categories=NOMES_MESES, ordered=True)
+    return df
+
+
+def memoria_mb(df: pd.DataFrame) -> float:
+    """
+    Retorna a memória ocupada pelo DataFrame, incluindo o conteúdo das strings.
+
+    Args:
+        df (pd.DataFrame): Dados a medir
+
+    Returns:
+        float: Memória em MB
+    """
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def relatorio_memoria(antes_mb: float, depois_mb: float) -> Dict[str, float]:
+    """
+    Monta o relatório de memória antes e depois da aplicação do esquema.
+
+    Args:
+        antes_mb (float): Memória com colunas de texto como objetos Python
+        depois_mb (float): Memória com os tipos do esquema
+
+    Returns:
+        Dict[str, float]: Memória antes, depois e a redução percentual
+    """
+    reducao = (1 - depois_mb / antes_mb) * 100 if antes_mb else 0.0
+    return {"antes_mb": round(antes_mb, 2), "depois_mb": round(depois_mb, 2), "reducao_pct": round(reducao, 1)}
@@ -0,0 +1,136 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+# O plotly só é importado ao montar a primeira figura (ver _figura); aqui, apenas para as anotações.
+# O plotly.express, mais pesado, só é importado pelos gráficos ao montar os modelos
+if TYPE_CHECKING:
+    import plotly.graph_objs as go
+
+# Campos dos traços com os dados; o restante (cores, textos, hover) vem do modelo
+CAMPOS_DADOS = ('x', 'y', 'text', 'labels', 'values')
+# Coluna de valores dos dados de exemplo (ver exemplo_categorias)
+COLUNA_VALOR = 'Prec_Ven_Total'
+
+
+def _figura(figura: Dict[str, Any]) -> go.Figure:
+    """
+    Cria a figura do plotly a partir do dicionário (data e layout) montado sobre um ModeloFigura.
+
+    O modelo já foi validado pelo plotly ao ser criado (ver ModeloFigura.de_figura), e os dados dos traços
+    são arrays: o go.Figure é criado sem validar de novo cada traço e o template (_validate=False, como o
+    plotly faz com os templates registrados). O st.plotly_chart, por sua vez, só chama to_dict() de uma
+    figura do plotly e envia o JSON sem validá-lo.
+    """
+    import plotly.graph_objs as go
+    return go.Figure(figura, _validate=False)
+
+
+@dataclass(frozen=True)
+class ModeloFigura:
+    """
+    Gráfico Plotly montado e validado uma única vez, sem os dados: o layout (com o template) e os traços serializados.
+
+    A cada rerun, só os arrays dos traços (CAMPOS_DADOS) são trocados, sem o px nem a validação do plotly.
+    Os modelos são criados com dados de exemplo e memorizados por cada gráfico (functools.lru_cache).
+    """
+    layout: Dict[str, Any]
+    tracos: Tuple[Dict[str, Any], ...]
+
+    @classmethod
+    def de_figura(cls, fig: go.Figure) -> "ModeloFigura":
+        """
+        Cria o modelo a partir de uma figura de exemplo, descartando os dados dos traços.
+
+        Args:
+            fig (go.Figure): Figura montada com os mesmos parâmetros do gráfico real
+
+        Returns:
+            ModeloFigura: Layout e traços da figura, sem os campos de CAMPOS_DADOS
+        """
+        figura = fig.to_dict()
+        tracos = tuple({campo: valor for campo, valor in traco.items() if campo not in CAMPOS_DADOS} for traco in figura['data'])
+        return cls(figura['layout'], tracos)
+
+    def figura(self, *dados: Dict[str, Any]) -> go.Figure:
+        """
+        Monta a figura com os dados de cada traço sobre os traços do modelo.
+
+        Args:
+            *dados (Dict[str, Any]): Campos de cada traço (ex.: x, y, text, name). O traço i usa o
+                traço i do modelo, em ciclo quando há mais traços que no modelo (como as cores do px)
+
+        Returns:
+            go.Figure: Figura pronta para o st.plotly_chart
+        """
+        return self._montar(dados, self.layout)
+
+    def _montar(self, dados: Sequence[Dict[str, Any]], layout: Dict[str, Any]) -> go.Figure:
+        tracos = [
+            {**self.tracos[i % len(self.tracos)],
+             **{campo: _array(valor) if campo in CAMPOS_DADOS else valor for campo, valor in campos.items()}}
+            for i, campos in enumerate(dados)
+        ]
+        return _figura({'data': tracos, 'layout': layout})
+
+    def barras_por_categoria(self, categorias: Sequence[Any], valores: Sequence[float], texto: bool = True) -> go.Figure:
+        """
+        Monta barras com um traço por categoria, como o px.bar com color igual ao eixo x.
+
+        Args:
+            categorias (Sequence[Any]): Categorias do eixo x, na ordem das barras
+            valores (Sequence[float]): Valor de cada categoria
+            texto (bool): Repete o valor como texto da barra (text=... no px)
+
+        Returns:
+            go.Figure: Figura pronta para o st.plotly_chart
+        """
+        categorias, valores = list(categorias), list(valores)
+        layout = self.layout
+        eixo = layout.get('xaxis', {})
+        if eixo.get('categoryorder') == 'array':
+            # O px fixa no eixo x a ordem das categorias, que muda com os dados
+            layout = {**layout, 'xaxis': {**eixo, 'categoryarray': categorias}}
+        return self._montar([
+            {'name': str(categoria), 'legendgroup': str(categoria), 'offsetgroup': str(categoria),
+             'x': [categoria], 'y': [valor], **({'text': [valor]} if texto else {})}
+            for categoria, valor in zip(categorias, valores)
+        ], layout)
+
+
+def _array(valor: Any) -> np.ndarray:
+    """Converte os dados de um traço para array; datas viram Timestamp, que o plotly serializa em ISO."""
+    if isinstance(valor, (pd.Series, pd.Index)):
+        if pd.api.types.is_datetime64_any_dtype(valor.dtype):
+            valor = valor.astype(object)
+        return valor.to_numpy()
+    return np.asarray(valor)
+
+
+def exemplo_categorias(dimensao: str, quantidade: Optional[int] = None) -> pd.DataFrame:
+    """
+    Dados de exemplo para montar o modelo de um gráfico por categoria: uma linha por cor da sequência.
+
+    Args:
+        dimensao (str): Coluna das categorias
+        quantidade (Optional[int]): Número de categorias; por padrão, o de cores do template do plotly
+
+    Returns:
+        pd.DataFrame: Colunas dimensao e COLUNA_VALOR, com os valores zerados
+    """
+    if quantidade is None:
+        quantidade = len(cores_padrao())
+    return pd.DataFrame({dimensao: [str(i) for i in range(quantidade)], COLUNA_VALOR: np.zeros(quantidade)})
+
+
+def cores_padrao() -> Tuple[str, ...]:
+    """
+    Sequência de cores do template padrão do plotly, a usada pelo px quando não recebe color_discrete_sequence.
+
+    Returns:
+        Tuple[str, ...]: Cores, na ordem em que são atribuídas aos traços
+    """
+    import plotly.io as pio
+    return tuple(pio.templates[pio.templates.default].layout.colorway)
@@ -0,0 +1,229 @@
+import itertools
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Chave em attrs com uma referência fraca ao DataFrame em que os attrs foram definidos (ver definir_attrs)
+ATRIBUTO_DONO = "dono_attrs"
+
+
+def definir_attrs(df: pd.DataFrame, attrs: dict) -> pd.DataFrame:
+    """
+    Define os attrs de um DataFrame, marcando-o como dono deles.
+
+    O pandas repassa os attrs aos objetos derivados (filtros, cópias, colunas), cujo conteúdo já não é
+    o mesmo; pela marca, quem lê os attrs sabe se foram definidos no próprio objeto (ver agregacao.chave_de).
+
+    Args:
+        df (pd.DataFrame): DataFrame a marcar
+        attrs (dict): Metadados (ex.: a identidade de agregacao.identidade)
+
+    Returns:
+        pd.DataFrame: O próprio df
+    """
+    df.attrs = {**attrs, ATRIBUTO_DONO: weakref.ref(df)}
+    return df
+
+
+class Selecao:
+    """
+    Seleção preguiçosa de linhas de um DataFrame: guarda só os números das linhas selecionadas.
+
+    As colunas são copiadas apenas quando pedidas (selecao['coluna'] ou selecao[['a', 'b']]),
+    e só nas linhas selecionadas. Tem columns e attrs como um DataFrame, então os gráficos e os
+    indicadores podem recebê-la no lugar dos dados filtrados.
+    """
+
+    def __init__(self, base: pd.DataFrame, linhas: Optional[np.ndarray] = None, attrs: Optional[dict] = None,
+                 filtros: Optional[Dict[str, object]] = None):
+        self.base = base
+        self.linhas = linhas  # None seleciona todas as linhas
+        self.attrs = dict(attrs or {})
+        self.filtros = dict(filtros or {})  # Filtros que produziram a seleção (ver IndiceFiltros.selecionar)
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.base.columns
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0 or len(self.base.columns) == 0
+
+    def __len__(self) -> int:
+        return len(self.base) if self.linhas is None else len(self.linhas)
+
+    def __getitem__(self, colunas: Union[str, List[str]]) -> Union[pd.Series, pd.DataFrame]:
+        dados = self.base[colunas]
+        return dados if self.linhas is None else dados.take(self.linhas)
+
+    def dataframe(self, colunas: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Materializa a seleção como DataFrame.
+
+        Args:
+            colunas (Optional[Sequence[str]]): Colunas a copiar; por padrão, todas
+
+        Returns:
+            pd.DataFrame: Linhas selecionadas, com os attrs da seleção (ver definir_attrs)
+        """
+        df = self[list(colunas) if colunas is not None else list(self.base.columns)]
+        return definir_attrs(df, self.attrs)
+
+
+class IndiceFiltros:
+    """
+    Índice das linhas por valor das colunas de filtro, calculado uma vez por conjunto de dados.
+
+    Para cada coluna, guarda os números das linhas de cada valor em listas ordenadas, lado a lado
+    em um único array (ordem) com os limites de cada valor. Um filtro combinado parte da menor
+    lista e confere as demais colunas só nessas linhas, sem copiar o DataFrame.
+    """
+
+    def __init__(self, df: pd.DataFrame, colunas: Sequence[str], versao: Optional[str] = None):
+        self.df = df
+        self.versao = versao  # Hash do dataset indexado, para a identidade das seleções
+        self._codigos: Dict[str, np.ndarray] = {}
+        self._valores: Dict[str, pd.Index] = {}
+        self._ordem: Dict[str, np.ndarray] = {}
+        self._limites: Dict[str, np.ndarray] = {}
+        for coluna in colunas:
+            if coluna not in df.columns:
+                continue
+            serie = df[coluna]
+            if isinstance(serie.dtype, pd.CategoricalDtype):
+                codigos, valores = serie.cat.codes.to_numpy(), serie.cat.categories
+            else:
+                codigos, valores = pd.factorize(serie, sort=True)
+            codigos = codigos.astype(np.int32)
+
+            # Ordenação estável: dentro de cada valor, as linhas ficam em ordem crescente.
+            # Linhas sem valor (código -1) ficam no início e são descartadas
+            ordem = np.argsort(codigos, kind='stable').astype(np.int32)
+            ordem = ordem[np.count_nonzero(codigos < 0):]
+            contagens = np.bincount(codigos[codigos >= 0], minlength=len(valores))
+
+            self._codigos[coluna] = codigos
+            self._valores[coluna] = valores
+            self._ordem[coluna] = ordem
+            self._limites[coluna] = np.concatenate([[0], np.cumsum(contagens)])
+
+    def linhas(self, coluna: str, valor: object) -> np.ndarray:
+        """
+        Retorna os números das linhas com o valor na coluna, em ordem crescente.
+
+        Args:
+            coluna (str): Coluna indexada
+            valor (object): Valor procurado
+
+        Returns:
+            np.ndarray: Números das linhas; vazio se o valor não existir
+        """
+        codigo = self._codigo(coluna, valor)
+        if codigo < 0:
+            return np.empty(0, dtype=np.int32)
+        limites = self._limites[coluna]
+        return self._ordem[coluna][limites[codigo]:limites[codigo + 1]]
+
+    def selecionar(self, filtros: Optional[Dict[str, object]] = None, attrs: Optional[dict] = None,
+                   anterior: Optional[Selecao] = None) -> Selecao:
+        """
+        Seleciona as linhas que atendem a todos os filtros.
+
+        Com a seleção anterior da sessão, os filtros que não mudaram não são refeitos: se os novos
+        filtros só acrescentam colunas aos anteriores, as linhas anteriores são refinadas por elas
+        quando isso percorre menos linhas que partir do índice; se são os mesmos, as linhas são reaproveitadas.
+
+        Args:
+            filtros (Optional[Dict[str, object]]): Valor exigido por coluna indexada
+            attrs (Optional[dict]): Metadados repassados à seleção
+            anterior (Optional[Selecao]): Seleção anterior sobre os mesmos dados, se houver
+
+        Returns:
+            Selecao: Seleção das linhas, sem cópia dos dados
+        """
+        filtros = filtros or {}
+        if not filtros:
+            return Selecao(self.df, None, attrs, filtros)
+
+        codigos = {coluna: self._codigo(coluna, valor) for coluna, valor in filtros.items()}
+        if any(codigo < 0 for codigo in codigos.values()):
+            return Selecao(self.df, np.empty(0, dtype=np.int32), attrs, filtros)
+        tamanhos = {c: self._limites[c][codigos[c] + 1] - self._limites[c][codigos[c]] for c in codigos}
+
+        if anterior is not None and anterior.base is self.df and anterior.linhas is not None \
+                and all(c in filtros and filtros[c] == v for c, v in anterior.filtros.items()):
+            novas = [c for c in filtros if c not in anterior.filtros]
+            if not novas:
+                return Selecao(self.df, anterior.linhas, attrs, filtros)
+            if len(anterior.linhas) <= min(tamanhos[c] for c in novas):
+                linhas = anterior.linhas
+                for coluna in novas:
+                    linhas = linhas[self._codigos[coluna][linhas] == codigos[coluna]]
+                return Selecao(self.df, linhas, attrs, filtros)
+
+        # Parte da lista mais curta e confere as outras colunas apenas nessas linhas
+        colunas = sorted(codigos, key=tamanhos.get)
+        linhas = self.linhas(colunas[0], filtros[colunas[0]])
+        for coluna in colunas[1:]:
+            linhas = linhas[self._codigos[coluna][linhas] == codigos[coluna]]
+        return Selecao(self.df, linhas, attrs, filtros)
+
+    def _codigo(self, coluna: str, valor: object) -> int:
+        if coluna not in self._valores:
+            raise KeyError(f"Coluna sem índice de filtro: {coluna}")
+        return int(self._valores[coluna].get_indexer([valor])[0])
+
+
+class IndiceFacetas:
+    """
+    Opções de cada filtro que têm dados e a quantidade de linhas de cada uma, para qualquer
+    combinação de valores dos demais filtros.
+
+    As opções são calculadas uma vez, a partir das combinações de valores presentes nos dados:
+    para cada coluna e cada subconjunto das outras colunas, um groupby sobre essas combinações.
+    Depois, consultar as opções de um filtro é um acesso a dicionário, sem percorrer os dados.
+    """
+
+    def __init__(self, df: pd.DataFrame, colunas: Sequence[str], contagem: Optional[str] = None):
+        self.colunas = [c for c in colunas if c in df.columns]
+        self._opcoes: Dict[Tuple[str, tuple], Dict[object, int]] = {}
+        if not self.colunas or df.empty:
+            return
+
+        # Linhas por combinação de valores; a coluna de contagem é usada quando os dados já são agregados
+        pesos = df[contagem] if contagem is not None else pd.Series(1, index=df.index)
+        combinacoes = pesos.groupby([df[c] for c in self.colunas], observed=True).sum()
+        combinacoes = combinacoes[combinacoes > 0].rename('_linhas').reset_index()
+
+        for coluna in self.colunas:
+            outras = [c for c in self.colunas if c != coluna]
+            for tamanho in range(len(outras) + 1):
+                for grupo in itertools.combinations(outras, tamanho):
+                    somas = combinacoes.groupby(list(grupo) + [coluna], observed=True)['_linhas'].sum()
+                    for chave, linhas in somas.items():
+                        chave = tuple(_valor(v) for v in (chave if isinstance(chave, tuple) else (chave,)))
+                        opcoes = self._opcoes.setdefault((coluna, tuple(zip(grupo, chave[:-1]))), {})
+                        opcoes[chave[-1]] = int(linhas)
+
+    def opcoes(self, coluna: str, filtros: Optional[Dict[str, object]] = None) -> Dict[object, int]:
+        """
+        Retorna as opções de um filtro que têm dados com os demais filtros aplicados.
+
+        Args:
+            coluna (str): Coluna do filtro
+            filtros (Optional[Dict[str, object]]): Valores selecionados nas outras colunas; o filtro da própria coluna é ignorado
+
+        Returns:
+            Dict[object, int]: Quantidade de linhas por opção, na ordem dos valores (compartilhado: não deve ser alterado)
+        """
+        if coluna not in self.colunas:
+            raise KeyError(f"Coluna sem índice de facetas: {coluna}")
+        filtros = filtros or {}
+        chave = tuple((c, filtros[c]) for c in self.colunas if c != coluna and c in filtros)
+        return self._opcoes.get((coluna, chave), {})
+
+
+def _valor(valor: object) -> object:
+    """Converte escalares numpy (ex.: o ano em int16) para o tipo Python equivalente usado nos filtros."""
+    return valor.item() if isinstance(valor, np.generic) else valor
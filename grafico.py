@@ -1,14 +1,18 @@
 import streamlit as st
 import pandas as pd
+import functools
 import locale
-import plotly.express as px
-import plotly.graph_objs as go
-import matplotlib.pyplot as plt
 import numpy as np
 import json  # Importação necessária
-import io
-import base64
 import streamlit.components.v1 as components
+from agregacao import serie_mensal, top_n
+from recursos import script_apexcharts
+from serializacao import para_json
+from dados import carregar_dados
+
+# Copy-on-write do pandas, ligado ao iniciar a página: filtros e cópias rasas compartilham os dados do
+# dataset (ver dados.carregar_dados) e qualquer escrita em um DataFrame derivado cria uma cópia própria
+pd.set_option("mode.copy_on_write", True)
 
 st.set_page_config(
     page_title="Análise de Vendas", 
@@ -22,48 +26,42 @@ st.set_page_config(
     }
 )
 
-locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
+# Configuração regional só na primeira formatação, e apenas para moeda: no import, o setlocale
+# alterava o processo inteiro e falhava onde o pt_BR não está instalado
+@functools.lru_cache(maxsize=1)
+def _locale_brasileiro():
+    try:
+        locale.setlocale(locale.LC_MONETARY, 'pt_BR.UTF-8')
+        return True
+    except locale.Error:
+        return False
 
 def formatar_real(valor):
-    return locale.currency(valor, grouping=True, symbol=True)
+    if _locale_brasileiro():
+        return locale.currency(valor, grouping=True, symbol=True)
+    return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
 
-@st.cache_data
-def carregar_dados():
-    try:
-        df = pd.read_excel(r"./db/1. Análise Resultado Vendas_Suplen 2024 v09.xlsm", sheet_name="DADOS")
-        return df
-    except FileNotFoundError:
-        st.error("Erro: Planilha não encontrada. Verifique o caminho e o nome do arquivo.")
-        return pd.DataFrame()
     
 
 def criar_grafico_evolucao_vendas_apexcharts(df):
     if 'Período' in df.columns and 'Prec_Ven_Total' in df.columns and 'R$_Marg_Contribuicao' in df.columns:
-        df['Período'] = pd.to_datetime(df['Período'], errors='coerce')
-        vendas_por_periodo = df.groupby('Período').agg({
-            'Prec_Ven_Total': 'sum',
-            'R$_Marg_Contribuicao': 'sum'
-        }).reset_index()
-        
-        vendas_por_periodo['Rentabilidade (%)'] = (
-            vendas_por_periodo['R$_Marg_Contribuicao'] / vendas_por_periodo['Prec_Ven_Total'] * 100
-        ).fillna(0)
+        vendas_por_periodo = serie_mensal(df)
 
         periodos = vendas_por_periodo['Período'].dt.strftime('%Y-%m-%d').tolist()
         vendas = [venda / 1_000_000 for venda in vendas_por_periodo['Prec_Ven_Total']]
         rentabilidade = vendas_por_periodo['Rentabilidade (%)'].tolist()
         
         apex_chart = f"""
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <div id="chart-evolucao-vendas"></div>
         <script>
         var options = {{
             chart: {{ type: 'line', height: 350 }},
             series: [
-                {{ name: 'Vendas (R$ milhões)', type: 'column', data: {vendas} }},
-                {{ name: 'Rentabilidade (%)', type: 'line', data: {rentabilidade} }}
+                {{ name: 'Vendas (R$ milhões)', type: 'column', data: {para_json(vendas)} }},
+                {{ name: 'Rentabilidade (%)', type: 'line', data: {para_json(rentabilidade)} }}
             ],
-            xaxis: {{ categories: {periodos}, title: {{ text: 'Período' }} }},
+            xaxis: {{ categories: {para_json(periodos)}, title: {{ text: 'Período' }} }},
             yaxis: [
                 {{
                     title: {{ text: 'Vendas (R$ milhões)' }},
@@ -100,24 +98,20 @@ def criar_grafico_evolucao_vendas_apexcharts(df):
 def criar_grafico_distribuicao_grupo(df):
     if 'Grupo' in df.columns and 'Prec_Ven_Total' in df.columns:
         venda_total = df['Prec_Ven_Total'].sum()
-        df_grupos = df.groupby('Grupo').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        df_top_grupos = df_grupos.nlargest(6, 'Prec_Ven_Total')
-        df_restante = df_grupos[~df_grupos['Grupo'].isin(df_top_grupos['Grupo'])]
-        
-        outros = pd.DataFrame({'Grupo': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
-        df_final = pd.concat([df_top_grupos, outros], ignore_index=True)
+        df_grupos = df.groupby('Grupo', observed=True).agg({'Prec_Ven_Total': 'sum'}).reset_index()
+        df_final = top_n(df_grupos, 'Grupo', 'Prec_Ven_Total', 6).dataframe('Outros')
         
         labels = df_final['Grupo'].tolist()
         valores = df_final['Prec_Ven_Total'].tolist()
         
         html_code = f"""
         <div id="chart-distribuicao-grupo" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{ type: 'pie', width: '100%', height: '400px' }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{ text: 'Vendas por Grupo', align: 'center' }},
             legend: {{ position: 'bottom', fontSize: '14px' }},
             dataLabels: {{
@@ -144,11 +138,11 @@ def criar_grafico_distribuicao_grupo(df):
 def criar_grafico_top_marcas(df):
     if 'Marca' in df.columns and 'Prec_Ven_Total' in df.columns:
         total_vendas = df['Prec_Ven_Total'].sum()
-        top_marcas = df.groupby('Marca').agg({'Prec_Ven_Total': 'sum'}).nlargest(7, 'Prec_Ven_Total').reset_index()
-        restante_vendas = total_vendas - top_marcas['Prec_Ven_Total'].sum()
-        demais_marcas = pd.DataFrame({'Marca': ['Demais Marcas'], 'Prec_Ven_Total': [restante_vendas]})
-        df_final = pd.concat([top_marcas, demais_marcas], ignore_index=True)
+        vendas_marcas = df.groupby('Marca', observed=True).agg({'Prec_Ven_Total': 'sum'}).reset_index()
+        df_final = top_n(vendas_marcas, 'Marca', 'Prec_Ven_Total', 7, total_vendas).dataframe('Demais Marcas')
 
+        # Importação tardia: o plotly só é carregado quando um gráfico dele é desenhado
+        import plotly.express as px
         fig = px.bar(df_final, x='Marca', y='Prec_Ven_Total', title="Top 7 Marcas por Vendas", text='Prec_Ven_Total', color='Marca')
         fig.update_layout(yaxis_title="Vendas (R$)", xaxis_title="Marca", showlegend=False)
         fig.update_traces(texttemplate='R$ %{text:,.2f}', textposition='inside')
@@ -158,8 +152,8 @@ def criar_grafico_top_marcas(df):
 
 def criar_mini_grafico_evolucao_vendas(df):
     if 'Período' in df.columns and 'Prec_Ven_Total' in df.columns:
-        df['Período'] = pd.to_datetime(df['Período'], errors='coerce')
-        vendas_por_periodo = df.groupby('Período').agg({'Prec_Ven_Total': 'sum'}).reset_index()
+        vendas_por_periodo = serie_mensal(df)
+        import plotly.graph_objs as go
         fig = go.Figure(go.Scatter(x=vendas_por_periodo['Período'], y=vendas_por_periodo['Prec_Ven_Total'], mode='lines', line=dict(color='#003CA6', width=2)))
         fig.update_layout(margin=dict(l=0, r=0, t=0, b=0), xaxis=dict(visible=False), yaxis=dict(visible=False), height=60)
         st.plotly_chart(fig, use_container_width=True)
@@ -167,14 +161,19 @@ def criar_mini_grafico_evolucao_vendas(df):
         st.warning("Colunas 'Período' ou 'Prec_Ven_Total' não encontradas nos dados.")
 
 def criar_grafico_vendas_por_vendedor(df):
-    vendas_por_vendedor = df.groupby('Vendedor')['Prec_Ven_Total'].sum().reset_index()
+    vendas_por_vendedor = df.groupby('Vendedor', observed=True)['Prec_Ven_Total'].sum().reset_index()
+    import plotly.express as px
     fig = px.bar(vendas_por_vendedor, x='Vendedor', y='Prec_Ven_Total', title='Vendas por Vendedor', labels={'Prec_Ven_Total': 'Total de Vendas (R$)'}, color='Vendedor', text='Prec_Ven_Total')
     fig.update_traces(texttemplate='R$ %{y:,.2f}', textposition='outside')
     fig.update_layout(xaxis_tickangle=-45, yaxis_title='Total de Vendas (R$)', xaxis_title='Vendedor')
     st.plotly_chart(fig)
 
 def criar_mini_grafico(df):
-    vendas_por_periodo = df.groupby('Período')['Prec_Ven_Total'].sum()
+    vendas_por_periodo = serie_mensal(df).set_index('Período')['Prec_Ven_Total']
+    # O matplotlib (o mais pesado dos imports) só é carregado por este gráfico
+    import base64
+    import io
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots(figsize=(3, 1))
     ax.plot(vendas_por_periodo.index, vendas_por_periodo.values, color='#003CA6')
     ax.fill_between(vendas_por_periodo.index, vendas_por_periodo.values, color='#003CA6', alpha=0.3)
@@ -188,14 +187,14 @@ def criar_mini_grafico(df):
 
 def criar_grafico_apex_tops(df, categoria, titulo):
     if categoria in df.columns and 'Prec_Ven_Total' in df.columns:
-        vendas_categoria = df.groupby(categoria)['Prec_Ven_Total'].sum().reset_index()
-        top_categoria = vendas_categoria.nlargest(5, 'Prec_Ven_Total')
-        labels = top_categoria[categoria].tolist()
-        valores = top_categoria['Prec_Ven_Total'].tolist()
+        vendas_categoria = df.groupby(categoria, observed=True)['Prec_Ven_Total'].sum().reset_index()
+        top_categoria = top_n(vendas_categoria, categoria, 'Prec_Ven_Total', 5)
+        labels = top_categoria.rotulos
+        valores = top_categoria.valores.tolist()
 
         html_code = f"""
         <div id="chart-{categoria}" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -203,8 +202,8 @@ def criar_grafico_apex_tops(df, categoria, titulo):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: '{titulo}',
                 align: 'center'
@@ -238,14 +237,14 @@ def criar_grafico_apex_tops(df, categoria, titulo):
 def criar_grafico_top_5_vendedores(df):
 
     if 'Vendedor' in df.columns and 'Prec_Ven_Total' in df.columns:
-        vendas_vendedor = df.groupby('Vendedor')['Prec_Ven_Total'].sum().reset_index()
-        top_vendedores = vendas_vendedor.nlargest(5, 'Prec_Ven_Total')
-        labels = top_vendedores['Vendedor'].tolist()
-        valores = top_vendedores['Prec_Ven_Total'].tolist()
+        vendas_vendedor = df.groupby('Vendedor', observed=True)['Prec_Ven_Total'].sum().reset_index()
+        top_vendedores = top_n(vendas_vendedor, 'Vendedor', 'Prec_Ven_Total', 5)
+        labels = top_vendedores.rotulos
+        valores = top_vendedores.valores.tolist()
 
         html_code = f"""
         <div id="chart-vendedores" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -253,8 +252,8 @@ def criar_grafico_top_5_vendedores(df):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},  // Valores correspondentes
-            labels: {labels},  // Etiquetas correspondentes aos vendedores
+            series: {para_json(valores)},  // Valores correspondentes
+            labels: {para_json(labels)},  // Etiquetas correspondentes aos vendedores
             title: {{
                 text: 'Top 5 Vendedores por Vendas',
                 align: 'center'
@@ -308,22 +307,19 @@ def criar_grafico_top_5_vendedores(df):
 def criar_grafico_distribuicao_vendedor(df, coluna="Vendedor"):
     if 'Vendedor' in df.columns and 'Prec_Ven_Total' in df.columns:
         venda_total = df['Prec_Ven_Total'].sum()
-        df_vendedor = df.groupby('Vendedor').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        df_top_vendedor = df_vendedor.nlargest(6, 'Prec_Ven_Total')
-        df_restante = df_vendedor[~df_vendedor['Vendedor'].isin(df_top_vendedor['Vendedor'])]
+        df_vendedor = df.groupby('Vendedor', observed=True).agg({'Prec_Ven_Total': 'sum'}).reset_index()
         
-        # Agrupar o restante dos grupos como "Outros"
-        outros = pd.DataFrame({'Vendedor': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
-        df_final = pd.concat([df_top_vendedor, outros], ignore_index=True)
+        # Top 6 e o restante dos grupos como "Outros"
+        df_final = top_n(df_vendedor, 'Vendedor', 'Prec_Ven_Total', 6).dataframe('Outros')
         
         # Extrair os rótulos (nomes dos vendedores) e valores para o gráfico
-        labels = json.dumps(df_final['Vendedor'].tolist())  # JSON para uso no JS
+        labels = df_final['Vendedor'].tolist()
         valores = df_final['Prec_Ven_Total'].tolist()
         
         # Criar o gráfico usando ApexCharts
         html_code = f"""
         <div id="chart-distribuicao-vendedor" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -331,8 +327,8 @@ def criar_grafico_distribuicao_vendedor(df, coluna="Vendedor"):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: 'Vendas por Vendedor',
                 align: 'center'
@@ -379,22 +375,19 @@ def criar_grafico_distribuicao_vendedor(df, coluna="Vendedor"):
 def criar_grafico_distribuicao_medico(df, coluna="Médico"):
     if 'Médico' in df.columns and 'Prec_Ven_Total' in df.columns:
         venda_total = df['Prec_Ven_Total'].sum()
-        df_medico = df.groupby('Médico').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        df_top_medico = df_medico.nlargest(5, 'Prec_Ven_Total')
-        df_restante = df_medico[~df_medico['Médico'].isin(df_top_medico['Médico'])]
+        df_medico = df.groupby('Médico', observed=True).agg({'Prec_Ven_Total': 'sum'}).reset_index()
         
-        # Agrupar o restante dos grupos como "Outros"
-        outros = pd.DataFrame({'Médico': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
-        df_final = pd.concat([df_top_medico, outros], ignore_index=True)
+        # Top 5 e o restante dos grupos como "Outros"
+        df_final = top_n(df_medico, 'Médico', 'Prec_Ven_Total', 5).dataframe('Outros')
         
         # Extrair os rótulos (nomes dos Medicos) e valores para o gráfico
-        labels = json.dumps(df_final['Médico'].tolist())  # JSON para uso no JS
+        labels = df_final['Médico'].tolist()
         valores = df_final['Prec_Ven_Total'].tolist()
         
         # Criar o gráfico usando ApexCharts
         html_code = f"""
         <div id="chart-distribuicao-medico" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -402,8 +395,8 @@ def criar_grafico_distribuicao_medico(df, coluna="Médico"):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: 'Vendas por Médico',
                 align: 'center'
@@ -450,22 +443,19 @@ def criar_grafico_distribuicao_medico(df, coluna="Médico"):
 def criar_grafico_distribuicao_parceiro(df, coluna="Parceiro"):
     if 'Parceiro' in df.columns and 'Prec_Ven_Total' in df.columns:
         venda_total = df['Prec_Ven_Total'].sum()
-        df_parceiro = df.groupby('Parceiro').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        df_top_parceiro = df_parceiro.nlargest(5, 'Prec_Ven_Total')
-        df_restante = df_parceiro[~df_parceiro['Parceiro'].isin(df_top_parceiro['Parceiro'])]
+        df_parceiro = df.groupby('Parceiro', observed=True).agg({'Prec_Ven_Total': 'sum'}).reset_index()
         
-        # Agrupar o restante dos grupos como "Outros"
-        outros = pd.DataFrame({'Parceiro': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
-        df_final = pd.concat([df_top_parceiro, outros], ignore_index=True)
+        # Top 5 e o restante dos grupos como "Outros"
+        df_final = top_n(df_parceiro, 'Parceiro', 'Prec_Ven_Total', 5).dataframe('Outros')
         
         # Extrair os rótulos (nomes dos parceiro) e valores para o gráfico
-        labels = json.dumps(df_final['Parceiro'].tolist())  # JSON para uso no JS
+        labels = df_final['Parceiro'].tolist()
         valores = df_final['Prec_Ven_Total'].tolist()
         
         # Criar o gráfico usando ApexCharts
         html_code = f"""
         <div id="chart-distribuicao-parceiro" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -473,8 +463,8 @@ def criar_grafico_distribuicao_parceiro(df, coluna="Parceiro"):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: 'Vendas por Parceiro',
                 align: 'center'
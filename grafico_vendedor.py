@@ -1,12 +1,178 @@
+from __future__ import annotations
+import functools
 import streamlit as st
 import pandas as pd
-from typing import Optional
-import plotly.express as px
-import plotly.graph_objs as go
+from typing import TYPE_CHECKING, Optional
 import numpy as np
+from agregacao import serie_mensal, top_n
+from cache_graficos import em_cache
+from figuras import ModeloFigura, exemplo_categorias
 #import locale
-from typing import Optional
 
+# O plotly é importado dentro de cada gráfico, só quando ele é desenhado; aqui, apenas para as anotações
+if TYPE_CHECKING:
+    import plotly.graph_objs as go
+
+# Modelos dos gráficos: montados pelo plotly uma única vez (ver figuras.ModeloFigura); a cada filtro,
+# os gráficos só trocam os dados dos traços
+
+@functools.lru_cache(maxsize=None)
+def _modelo_evolucao_vendas() -> ModeloFigura:
+    import plotly.express as px
+    exemplo = pd.DataFrame({'Período': pd.to_datetime(['2024-01-01']), 'Prec_Ven_Total': [0.0]})
+    fig = px.line(exemplo, 
+                 x='Período', 
+                 y='Prec_Ven_Total',
+                 title='Evolução das Vendas',
+                 labels={'Período': 'Data',
+                        'Prec_Ven_Total': 'Total de Vendas (R$)'})
+    
+    fig.update_layout(
+        xaxis_title="Data",
+        yaxis_title="Total de Vendas (R$)",
+        hovermode='x unified'
+    )
+    
+    # Formatação dos valores em reais
+    fig.update_traces(
+        hovertemplate='Data: %{x}<br>Vendas: R$ %{y:,.2f}<extra></extra>'
+    )
+    return ModeloFigura.de_figura(fig)
+
+
+@functools.lru_cache(maxsize=None)
+def _modelo_top_marcas() -> ModeloFigura:
+    import plotly.graph_objs as go
+    # Criar gráfico de pizza 3D
+    fig = go.Figure(data=[go.Pie(
+        hole=0.4,
+        pull=0.05,
+        textinfo='label+percent',
+        textposition='inside',
+        marker=dict(line=dict(color='#FFFFFF', width=1))
+    )])
+    
+    fig.update_layout(
+        title="Top 7 Marcas por Vendas",
+        annotations=[dict(text='', x=0.5, y=0.5, font_size=20, showarrow=False)],
+        showlegend=False
+    )
+    return ModeloFigura.de_figura(fig)
+
+
+@functools.lru_cache(maxsize=None)
+def _modelo_top_grupos() -> ModeloFigura:
+    import plotly.express as px
+    # Criar gráfico de rosca
+    fig = px.pie(exemplo_categorias('Grupo', 1), 
+                 names='Grupo', 
+                 values='Prec_Ven_Total', 
+                 title="Top 7 Grupos por Vendas",
+                 hole=0.4,  # Define o tamanho do "furo" no centro para criar o efeito de rosca
+                 color_discrete_sequence=px.colors.qualitative.Set3)
+    
+    # Ajustes para exibir rótulos diretamente no gráfico
+    fig.update_traces(
+        textinfo='percent+label',
+        textposition='inside',
+        hovertemplate='Grupo: %{label}<br>Vendas: R$ %{value:,.2f}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        showlegend=False,  # Remove a legenda lateral
+        hoverlabel=dict(bgcolor="white")
+    )
+    return ModeloFigura.de_figura(fig)
+
+
+@functools.lru_cache(maxsize=None)
+def _modelo_distribuicao_grupo(coluna: str) -> ModeloFigura:
+    import plotly.express as px
+    # Uma categoria de exemplo por cor: cada barra é um traço, com a cor da sua posição
+    fig = px.bar(exemplo_categorias(coluna, len(px.colors.qualitative.Set3)),
+                x=coluna,
+                y='Prec_Ven_Total',
+                title=f"Distribuição de Vendas por {coluna}",
+                color=coluna,
+                color_discrete_sequence=px.colors.qualitative.Set3,
+                text='Prec_Ven_Total')
+    
+    fig.update_layout(
+        xaxis_title=coluna,
+        yaxis_title="Total de Vendas (R$)",
+        showlegend=False,
+        hoverlabel=dict(bgcolor="white"),
+        hovermode='x unified'
+    )
+    
+    # Formatação dos valores em reais
+    fig.update_traces(
+        texttemplate='R$ %{text:,.2f}',
+        textposition='inside',
+        hovertemplate=f'{coluna}: %{{x}}<br>Vendas: R$ %{{y:,.2f}}<extra></extra>'
+    )
+    return ModeloFigura.de_figura(fig)
+
+
+@functools.lru_cache(maxsize=None)
+def _modelo_vendas_por_vendedor() -> ModeloFigura:
+    import plotly.express as px
+    fig = px.bar(exemplo_categorias('Vendedor'),
+                x='Vendedor',
+                y='Prec_Ven_Total',
+                title='Vendas por Vendedor',
+                color='Vendedor',
+                text='Prec_Ven_Total')
+    
+    fig.update_layout(
+        xaxis_title="Vendedor",
+        yaxis_title="Total de Vendas (R$)",
+        showlegend=False,
+        hoverlabel=dict(bgcolor="white")
+    )
+    
+    fig.update_traces(
+        texttemplate='R$ %{text:,.2f}',
+        textposition='inside',
+        hovertemplate='Vendedor: %{x}<br>Vendas: R$ %{y:,.2f}<extra></extra>'
+    )
+    return ModeloFigura.de_figura(fig)
+
+
+@functools.lru_cache(maxsize=None)
+def _modelo_vendas_menos_incentivo() -> ModeloFigura:
+    import plotly.graph_objs as go
+    # Cria um gráfico de barras para visualizar as vendas e incentivos
+    fig = go.Figure()
+    
+    # Adiciona uma barra para as vendas
+    fig.add_trace(go.Bar(
+        name='Vendas (R$)',
+        marker_color='lightskyblue'
+    ))
+    
+    # Adiciona uma barra para os incentivos
+    fig.add_trace(go.Bar(
+        name='Incentivo (R$)',
+        marker_color='lightcoral'
+    ))
+    
+    # Configurações adicionais do gráfico
+    fig.update_layout(
+        title="Top 10 Produtos com Maior Vendas e Menor Incentivo",
+        xaxis_title="Produto",
+        yaxis_title="Valores (R$)",
+        barmode='group',
+        hovermode='x unified'
+    )
+    
+    fig.update_traces(
+        hovertemplate='Produto: %{x}<br>Valor: R$ %{y:,.2f}<extra></extra>'
+    )
+    return ModeloFigura.de_figura(fig)
+
+
+@em_cache
 def criar_grafico_evolucao_vendas(dados: pd.DataFrame) -> Optional[go.Figure]:
     """
     Cria um gráfico de linha mostrando a evolução das vendas ao longo do tempo.
@@ -18,28 +184,11 @@ def criar_grafico_evolucao_vendas(dados: pd.DataFrame) -> Optional[go.Figure]:
         Optional[go.Figure]: Objeto do gráfico ou None se as colunas necessárias não existirem
     """
     if 'Período' in dados.columns and 'Prec_Ven_Total' in dados.columns:
-        dados_agrupados = dados.groupby('Período')['Prec_Ven_Total'].sum().reset_index()
-        fig = px.line(dados_agrupados, 
-                     x='Período', 
-                     y='Prec_Ven_Total',
-                     title='Evolução das Vendas',
-                     labels={'Período': 'Data',
-                            'Prec_Ven_Total': 'Total de Vendas (R$)'})
-        
-        fig.update_layout(
-            xaxis_title="Data",
-            yaxis_title="Total de Vendas (R$)",
-            hovermode='x unified'
-        )
-        
-        # Formatação dos valores em reais
-        fig.update_traces(
-            hovertemplate='Data: %{x}<br>Vendas: R$ %{y:,.2f}<extra></extra>'
-        )
-        
-        return fig
+        dados_agrupados = serie_mensal(dados)
+        return _modelo_evolucao_vendas().figura({'x': dados_agrupados['Período'], 'y': dados_agrupados['Prec_Ven_Total']})
     return None
 
+@em_cache
 def criar_grafico_top_marcas(df: pd.DataFrame, coluna: str) -> Optional[go.Figure]:
     """
     Cria um gráfico de pizza 3D com as top 7 marcas por vendas.
@@ -54,40 +203,15 @@ def criar_grafico_top_marcas(df: pd.DataFrame, coluna: str) -> Optional[go.Figur
     if 'Marca' in df.columns and 'Prec_Ven_Total' in df.columns:
         # Agrupar por marca e obter o total de vendas
         total_vendas = df['Prec_Ven_Total'].sum()
-        top_marcas = (df.groupby('Marca')
-                     .agg({'Prec_Ven_Total': 'sum'})
-                     .nlargest(7, 'Prec_Ven_Total')
-                     .reset_index())
-        
-        # Calcular e adicionar "Demais Marcas"
-        restante_vendas = total_vendas - top_marcas['Prec_Ven_Total'].sum()
-        demais_marcas = pd.DataFrame({
-            'Marca': ['Demais Marcas'],
-            'Prec_Ven_Total': [restante_vendas]
-        })
+        vendas_marcas = df.groupby('Marca', observed=True)['Prec_Ven_Total'].sum().reset_index()
         
-        df_final = pd.concat([top_marcas, demais_marcas], ignore_index=True)
+        # Top 7 e "Demais Marcas" com o restante das vendas
+        df_final = top_n(vendas_marcas, 'Marca', 'Prec_Ven_Total', 7, total_vendas).dataframe('Demais Marcas')
         
-        # Criar gráfico de pizza 3D
-        fig = go.Figure(data=[go.Pie(
-            labels=df_final['Marca'],
-            values=df_final['Prec_Ven_Total'],
-            hole=0.4,
-            pull=0.05,
-            textinfo='label+percent',
-            textposition='inside',
-            marker=dict(line=dict(color='#FFFFFF', width=1))
-        )])
-        
-        fig.update_layout(
-            title="Top 7 Marcas por Vendas",
-            annotations=[dict(text='', x=0.5, y=0.5, font_size=20, showarrow=False)],
-            showlegend=False
-        )
-        
-        return fig
+        return _modelo_top_marcas().figura({'labels': df_final['Marca'], 'values': df_final['Prec_Ven_Total']})
     return None
 
+@em_cache
 def criar_grafico_top_grupos(df: pd.DataFrame) -> Optional[go.Figure]:
     """
     Cria um gráfico de rosca com os top 7 grupos por vendas, exibindo os rótulos diretamente no gráfico.
@@ -101,47 +225,19 @@ def criar_grafico_top_grupos(df: pd.DataFrame) -> Optional[go.Figure]:
     if 'Grupo' in df.columns and 'Prec_Ven_Total' in df.columns:
         # Agrupar por grupo e obter o total de vendas
         total_vendas = df['Prec_Ven_Total'].sum()
-        top_grupos = (df.groupby('Grupo')
-                     .agg({'Prec_Ven_Total': 'sum'})
-                     .nlargest(7, 'Prec_Ven_Total')
-                     .reset_index())
-        
-        # Calcular e adicionar "Demais Grupos"
-        restante_vendas = total_vendas - top_grupos['Prec_Ven_Total'].sum()
-        demais_grupos = pd.DataFrame({
-            'Grupo': ['Demais Grupos'],
-            'Prec_Ven_Total': [restante_vendas]
-        })
+        vendas_grupos = df.groupby('Grupo', observed=True)['Prec_Ven_Total'].sum().reset_index()
         
-        df_final = pd.concat([top_grupos, demais_grupos], ignore_index=True)
+        # Top 7 e "Demais Grupos" com o restante das vendas
+        df_final = top_n(vendas_grupos, 'Grupo', 'Prec_Ven_Total', 7, total_vendas).dataframe('Demais Grupos')
         
-        # Criar gráfico de rosca
-        fig = px.pie(df_final, 
-                     names='Grupo', 
-                     values='Prec_Ven_Total', 
-                     title="Top 7 Grupos por Vendas",
-                     hole=0.4,  # Define o tamanho do "furo" no centro para criar o efeito de rosca
-                     color_discrete_sequence=px.colors.qualitative.Set3)
-        
-        # Ajustes para exibir rótulos diretamente no gráfico
-        fig.update_traces(
-            textinfo='percent+label',
-            textposition='inside',
-            hovertemplate='Grupo: %{label}<br>Vendas: R$ %{value:,.2f}<extra></extra>'
-        )
-        
-        fig.update_layout(
-            showlegend=False,  # Remove a legenda lateral
-            hoverlabel=dict(bgcolor="white")
-        )
-        
-        return fig
+        return _modelo_top_grupos().figura({'labels': df_final['Grupo'], 'values': df_final['Prec_Ven_Total']})
     return None
 
 
 
 
 
+@em_cache
 def criar_grafico_distribuicao_grupo(dados_filtrados: pd.DataFrame, coluna: str) -> Optional[go.Figure]:
     """
     Cria um gráfico de barras mostrando a distribuição de vendas por grupo.
@@ -154,37 +250,15 @@ def criar_grafico_distribuicao_grupo(dados_filtrados: pd.DataFrame, coluna: str)
         Optional[go.Figure]: Objeto do gráfico ou None se as colunas necessárias não existirem
     """
     if coluna in dados_filtrados.columns and 'Prec_Ven_Total' in dados_filtrados.columns:
-        dados_agrupados = (dados_filtrados.groupby(coluna)['Prec_Ven_Total']
+        dados_agrupados = (dados_filtrados.groupby(coluna, observed=True)['Prec_Ven_Total']
                           .sum()
                           .reset_index()
                           .sort_values('Prec_Ven_Total', ascending=False))
         
-        fig = px.bar(dados_agrupados,
-                    x=coluna,
-                    y='Prec_Ven_Total',
-                    title=f"Distribuição de Vendas por {coluna}",
-                    color=coluna,
-                    color_discrete_sequence=px.colors.qualitative.Set3,
-                    text='Prec_Ven_Total')
-        
-        fig.update_layout(
-            xaxis_title=coluna,
-            yaxis_title="Total de Vendas (R$)",
-            showlegend=False,
-            hoverlabel=dict(bgcolor="white"),
-            hovermode='x unified'
-        )
-        
-        # Formatação dos valores em reais
-        fig.update_traces(
-            texttemplate='R$ %{text:,.2f}',
-            textposition='inside',
-            hovertemplate=f'{coluna}: %{{x}}<br>Vendas: R$ %{{y:,.2f}}<extra></extra>'
-        )
-        
-        return fig
+        return _modelo_distribuicao_grupo(coluna).barras_por_categoria(dados_agrupados[coluna], dados_agrupados['Prec_Ven_Total'])
     return None
 
+@em_cache
 def criar_grafico_vendas_por_vendedor(dados: pd.DataFrame) -> Optional[go.Figure]:
     """
     Cria um gráfico de barras mostrando as vendas por vendedor.
@@ -196,35 +270,16 @@ def criar_grafico_vendas_por_vendedor(dados: pd.DataFrame) -> Optional[go.Figure
         Optional[go.Figure]: Objeto do gráfico ou None se as colunas necessárias não existirem
     """
     if 'Vendedor' in dados.columns and 'Prec_Ven_Total' in dados.columns:
-        dados_agrupados = (dados.groupby('Vendedor')['Prec_Ven_Total']
+        dados_agrupados = (dados.groupby('Vendedor', observed=True)['Prec_Ven_Total']
                           .sum()
                           .reset_index()
                           .sort_values('Prec_Ven_Total', ascending=False))
         
-        fig = px.bar(dados_agrupados,
-                    x='Vendedor',
-                    y='Prec_Ven_Total',
-                    title='Vendas por Vendedor',
-                    color='Vendedor',
-                    text='Prec_Ven_Total')
-        
-        fig.update_layout(
-            xaxis_title="Vendedor",
-            yaxis_title="Total de Vendas (R$)",
-            showlegend=False,
-            hoverlabel=dict(bgcolor="white")
-        )
-        
-        fig.update_traces(
-            texttemplate='R$ %{text:,.2f}',
-            textposition='inside',
-            hovertemplate='Vendedor: %{x}<br>Vendas: R$ %{y:,.2f}<extra></extra>'
-        )
-        
-        return fig
+        return _modelo_vendas_por_vendedor().barras_por_categoria(dados_agrupados['Vendedor'], dados_agrupados['Prec_Ven_Total'])
     return None
 
 
+@em_cache
 def criar_grafico_vendas_menos_incentivo(dados: pd.DataFrame) -> Optional[go.Figure]:
     """
     Cria um gráfico mostrando os produtos com mais vendas e menor incentivo.
@@ -238,7 +293,7 @@ def criar_grafico_vendas_menos_incentivo(dados: pd.DataFrame) -> Optional[go.Fig
     # Verifica se as colunas necessárias estão no DataFrame
     if 'Produto' in dados.columns and 'Prec_Ven_Total' in dados.columns and 'R$_Inc_Venda' in dados.columns:
         # Agrupa os dados por produto, somando o total de vendas e incentivo por produto
-        dados_agrupados = (dados.groupby('Produto')
+        dados_agrupados = (dados.groupby('Produto', observed=True)
                            .agg({'Prec_Ven_Total': 'sum', 'R$_Inc_Venda': 'sum'})
                            .reset_index())
         
@@ -249,37 +304,9 @@ def criar_grafico_vendas_menos_incentivo(dados: pd.DataFrame) -> Optional[go.Fig
         # Seleciona os top 10 produtos com mais vendas e menor incentivo
         top_produtos = dados_agrupados.head(10)
         
-        # Cria um gráfico de barras para visualizar as vendas e incentivos
-        fig = go.Figure()
-        
-        # Adiciona uma barra para as vendas
-        fig.add_trace(go.Bar(
-            x=top_produtos['Produto'],
-            y=top_produtos['Prec_Ven_Total'],
-            name='Vendas (R$)',
-            marker_color='lightskyblue'
-        ))
-        
-        # Adiciona uma barra para os incentivos
-        fig.add_trace(go.Bar(
-            x=top_produtos['Produto'],
-            y=top_produtos['R$_Inc_Venda'],
-            name='Incentivo (R$)',
-            marker_color='lightcoral'
-        ))
-        
-        # Configurações adicionais do gráfico
-        fig.update_layout(
-            title="Top 10 Produtos com Maior Vendas e Menor Incentivo",
-            xaxis_title="Produto",
-            yaxis_title="Valores (R$)",
-            barmode='group',
-            hovermode='x unified'
+        # Uma barra para as vendas e outra para os incentivos
+        return _modelo_vendas_menos_incentivo().figura(
+            {'x': top_produtos['Produto'], 'y': top_produtos['Prec_Ven_Total']},
+            {'x': top_produtos['Produto'], 'y': top_produtos['R$_Inc_Venda']}
         )
-        
-        fig.update_traces(
-            hovertemplate='Produto: %{x}<br>Valor: R$ %{y:,.2f}<extra></extra>'
-        )
-        
-        return fig
     return None
@@ -1,13 +1,15 @@
+import functools
 import streamlit as st
 import pandas as pd
 #import locale
-import plotly.express as px
-import plotly.graph_objs as go
-import matplotlib.pyplot as plt
 import numpy as np
-import io
-import base64
 import streamlit.components.v1 as components
+from agregacao import serie_mensal, somar_por, top_n
+from cache_graficos import em_cache
+from figuras import ModeloFigura, exemplo_categorias
+from recursos import script_apexcharts
+from serializacao import para_json
+from dados import carregar_dados
 
 
 
@@ -18,35 +20,11 @@ import streamlit.components.v1 as components
 def formatar_real(valor):
     return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
 
-@st.cache_data
-def carregar_dados():
-    try:
-        df = pd.read_excel(r"./db/1. Análise Resultado Vendas_Suplen 2024 v10_1.xlsx", sheet_name="DADOS")
-        if 'Período' in df.columns:
-            df['Período'] = pd.to_datetime(df['Período'], errors='coerce', dayfirst=True)
-            df = df.dropna(subset=['Período'])
-        df['Ano'] = df['Período'].dt.year
-        df['Mês'] = df['Período'].dt.strftime('%B')
-        return df
-    except FileNotFoundError:
-        st.error("Erro: Planilha não encontrada. Verifique o caminho e o nome do arquivo.")
-        return pd.DataFrame()
 
 def criar_grafico_evolucao_vendas_apexcharts(df, coluna):
     if 'Período' in df.columns and 'Prec_Ven_Total' in df.columns and 'R$_Marg_Contribuicao' in df.columns:
-        # Convertendo 'Período' para datetime
-        df['Período'] = pd.to_datetime(df['Período'], errors='coerce')
-        
-        # Agrupando e somando os dados
-        vendas_por_periodo = df.groupby('Período').agg({
-            'Prec_Ven_Total': 'sum',
-            'R$_Marg_Contribuicao': 'sum'
-        }).reset_index()
-        
-        # Calculando a porcentagem de rentabilidade para cada período
-        vendas_por_periodo['Rentabilidade (%)'] = (
-            vendas_por_periodo['R$_Marg_Contribuicao'] / vendas_por_periodo['Prec_Ven_Total'] * 100
-        ).fillna(0)  # Preenchendo com 0 se a divisão for inválida
+        # Série mensal já somada, com a porcentagem de rentabilidade de cada período
+        vendas_por_periodo = serie_mensal(df)
 
         # Preparando dados para o gráfico
         periodos = vendas_por_periodo['Período'].dt.strftime('%Y-%m-%d').tolist()
@@ -55,7 +33,7 @@ def criar_grafico_evolucao_vendas_apexcharts(df, coluna):
         
         # Código HTML com ApexCharts embutido
         apex_chart = f"""
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <div id="chart"></div>
         <script>
         var options = {{
@@ -67,16 +45,16 @@ def criar_grafico_evolucao_vendas_apexcharts(df, coluna):
                 {{
                     name: 'Vendas',
                     type: 'column',
-                    data: {vendas}
+                    data: {para_json(vendas)}
                 }},
                 {{
                     name: 'Rentabilidade',
                     type: 'line',
-                    data: {rentabilidade}
+                    data: {para_json(rentabilidade)}
                 }}
             ],
             xaxis: {{
-                categories: {periodos},
+                categories: {para_json(periodos)},
                 title: {{ text: 'Período' }}
             }},
             yaxis: [
@@ -130,13 +108,8 @@ def criar_grafico_evolucao_vendas_apexcharts(df, coluna):
 def criar_grafico_distribuicao_grupo(df, coluna):
     if 'Grupo' in df.columns and 'Prec_Ven_Total' in df.columns:
         venda_total = df['Prec_Ven_Total'].sum()
-        df_grupos = df.groupby('Grupo').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        df_top_grupos = df_grupos.nlargest(6, 'Prec_Ven_Total')
-        df_restante = df_grupos[~df_grupos['Grupo'].isin(df_top_grupos['Grupo'])]
-        
-        # Agrupar o restante dos grupos como "Outros"
-        outros = pd.DataFrame({'Grupo': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
-        df_final = pd.concat([df_top_grupos, outros], ignore_index=True)
+        # Top 6 grupos e o restante dos grupos como "Outros"
+        df_final = top_n(somar_por(df, 'Grupo'), 'Grupo', 'Prec_Ven_Total', 6).dataframe('Outros')
         
         # Extrair os rótulos (nomes dos grupos) e valores para o gráfico
         labels = df_final['Grupo'].tolist()
@@ -145,7 +118,7 @@ def criar_grafico_distribuicao_grupo(df, coluna):
         # Criar o gráfico usando ApexCharts
         html_code = f"""
         <div id="chart-distribuicao-grupo" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -153,8 +126,8 @@ def criar_grafico_distribuicao_grupo(df, coluna):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: 'Vendas por Grupo',
                 align: 'center'
@@ -198,25 +171,37 @@ def criar_grafico_distribuicao_grupo(df, coluna):
         coluna.warning("Colunas 'Grupo' ou 'Prec_Ven_Total' não encontradas nos dados.")
 
 
+@functools.lru_cache(maxsize=None)
+def _modelo_top(dimensao, titulo):
+    """Modelo das barras de figura_top, montado pelo px uma única vez por dimensão e título."""
+    # Importação tardia: o plotly só é carregado quando um gráfico dele é desenhado
+    import plotly.express as px
+    fig = px.bar(exemplo_categorias(dimensao), x=dimensao, y='Prec_Ven_Total', title=titulo, text='Prec_Ven_Total', color=dimensao)
+    fig.update_layout(yaxis_title="", xaxis_title=dimensao, showlegend=False)
+    fig.update_traces(texttemplate='R$ %{text:,.2f}', textposition='inside')
+    return ModeloFigura.de_figura(fig)
+
+
+@em_cache
+def figura_top(df, dimensao, rotulo_resto, titulo):
+    """Barras com os 7 maiores membros da dimensão e o restante das vendas; compartilhada entre as sessões."""
+    total_vendas = df['Prec_Ven_Total'].sum()
+    df_final = top_n(somar_por(df, dimensao), dimensao, 'Prec_Ven_Total', 7, total_vendas).dataframe(rotulo_resto)
+    # Só as barras mudam a cada filtro; o layout e as cores vêm do modelo
+    return _modelo_top(dimensao, titulo).barras_por_categoria(df_final[dimensao], df_final['Prec_Ven_Total'])
+
+
 def criar_grafico_top_marcas(df, coluna):
     if 'Marca' in df.columns and 'Prec_Ven_Total' in df.columns:
-        total_vendas = df['Prec_Ven_Total'].sum()
-        top_marcas = df.groupby('Marca').agg({'Prec_Ven_Total': 'sum'}).nlargest(7, 'Prec_Ven_Total').reset_index()
-        restante_vendas = total_vendas - top_marcas['Prec_Ven_Total'].sum()
-        demais_marcas = pd.DataFrame({'Marca': ['Demais Marcas'], 'Prec_Ven_Total': [restante_vendas]})
-        df_final = pd.concat([top_marcas, demais_marcas], ignore_index=True)
-
-        fig = px.bar(df_final, x='Marca', y='Prec_Ven_Total', title="Top vendas por marcas", text='Prec_Ven_Total', color='Marca')
-        fig.update_layout(yaxis_title="", xaxis_title="Marca", showlegend=False)
-        fig.update_traces(texttemplate='R$ %{text:,.2f}', textposition='inside')
+        fig = figura_top(df, 'Marca', 'Demais Marcas', "Top vendas por marcas")
         coluna.plotly_chart(fig, use_container_width=True)
     else:
         coluna.warning("Colunas 'Marca' ou 'Prec_Ven_Total' não encontradas nos dados.")
 
 def criar_mini_grafico_evolucao_vendas(df, coluna):
     if 'Período' in df.columns and 'Prec_Ven_Total' in df.columns:
-        df['Período'] = pd.to_datetime(df['Período'], errors='coerce')
-        vendas_por_periodo = df.groupby('Período').agg({'Prec_Ven_Total': 'sum'}).reset_index()
+        vendas_por_periodo = serie_mensal(df)
+        import plotly.graph_objs as go
         fig = go.Figure(go.Scatter(x=vendas_por_periodo['Período'], y=vendas_por_periodo['Prec_Ven_Total'], mode='lines', line=dict(color='#003CA6', width=2)))
         fig.update_layout(margin=dict(l=0, r=0, t=0, b=0), xaxis=dict(visible=False), yaxis=dict(visible=False), height=60)
         coluna.plotly_chart(fig, use_container_width=True)
@@ -224,132 +209,130 @@ def criar_mini_grafico_evolucao_vendas(df, coluna):
         coluna.warning("Colunas 'Período' ou 'Prec_Ven_Total' não encontradas nos dados.")
 
 def criar_grafico_vendas_por_vendedor(df, container):
-    vendas_por_vendedor = df.groupby('Vendedor')['Prec_Ven_Total'].sum().reset_index()
+    vendas_por_vendedor = somar_por(df, 'Vendedor')[['Vendedor', 'Prec_Ven_Total']]
+    import plotly.express as px
     fig = px.bar(vendas_por_vendedor, x='Vendedor', y='Prec_Ven_Total', title='Vendas por Vendedor', labels={'Prec_Ven_Total': 'Total de Vendas (R$)'}, color='Vendedor', text='Prec_Ven_Total')
     fig.update_traces(texttemplate='R$ %{y:,.2f}', textposition='outside')
     fig.update_layout(xaxis_tickangle=-45, yaxis_title='Total de Vendas (R$)', xaxis_title='Vendedor')
     container.plotly_chart(fig)
 
-def criar_mini_grafico(df):
-    vendas_por_periodo = df.groupby('Período')['Prec_Ven_Total'].sum()
-    fig, ax = plt.subplots(figsize=(3, 1))
-    ax.plot(vendas_por_periodo.index, vendas_por_periodo.values, color='#003CA6')
-    ax.fill_between(vendas_por_periodo.index, vendas_por_periodo.values, color='#003CA6', alpha=0.3)
-    ax.set_axis_off()
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png", bbox_inches='tight', transparent=True)
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig)
-    return img_base64
-
 def criar_grafico_apex_tops(df, categoria, titulo):
     if categoria in df.columns and 'Prec_Ven_Total' in df.columns:
-        vendas_categoria = df.groupby(categoria)['Prec_Ven_Total'].sum().reset_index()
-        top_categoria = vendas_categoria.nlargest(5, 'Prec_Ven_Total')
-        labels = top_categoria[categoria].tolist()
-        valores = top_categoria['Prec_Ven_Total'].tolist()
-
-        html_code = f"""
-        <div id="chart-{categoria}" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
-        <script>
-        var options = {{
-            chart: {{
-                type: 'pie',
-                width: '100%',
-                height: '400px'
-            }},
-            series: {valores},
-            labels: {labels},
-            title: {{
-                text: '{titulo}',
-                align: 'center'
-            }},
-            legend: {{
-                position: 'bottom',  // Legenda abaixo do gráfico
-                fontSize: '14px'     // Tamanho da fonte da legenda
-            }},
-            responsive: [{{
-                breakpoint: 480,
-                options: {{
-                    chart: {{
-                        width: 300
-                    }},
-                    legend: {{
-                        position: 'bottom',
-                        fontSize: '12px'   // Tamanho da fonte ajustado para dispositivos menores
-                    }}
-                }}
-            }}]
-        }};
-        var chart = new ApexCharts(document.querySelector("#chart-{categoria}"), options);
-        chart.render();
-        </script>
-        """
-        return html_code
+        return _html_apex_tops(df, categoria, titulo)
     else:
         st.warning(f"Coluna '{categoria}' não encontrada nos dados.")
         return ""
 
-def criar_grafico_top_5_vendedores(df):
-    if 'Vendedor' in df.columns and 'Prec_Ven_Total' in df.columns:
-        vendas_vendedor = df.groupby('Vendedor')['Prec_Ven_Total'].sum().reset_index()
-        top_vendedores = vendas_vendedor.nlargest(5, 'Prec_Ven_Total')
-        labels = [f"<strong>{vendedor} :: R$ {valor:,.2f}</strong>" for vendedor, valor in zip(top_vendedores['Vendedor'], top_vendedores['Prec_Ven_Total'])]
-        valores = top_vendedores['Prec_Ven_Total'].tolist()
 
-        html_code = f"""
-        <div id="chart-vendedores" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
-        <script>
-        var options = {{
-            chart: {{
-                type: 'donut',
-                width: '100%',
-                height: '400px'
-            }},
-            series: {valores},
-            labels: {labels},
-            title: {{
-                text: 'Top 5 Vendedores por Vendas',
-                align: 'center'
-            }},
-            legend: {{
-                position: 'bottom',
-                fontSize: '14px'
-            }},
-            tooltip: {{
-                y: {{
-                    formatter: function(value) {{
-                        return 'R$ ' + value.toLocaleString('pt-BR', {{ minimumFractionDigits: 2, maximumFractionDigits: 2 }});
-                    }}
+@em_cache
+def _html_apex_tops(df, categoria, titulo):
+    """HTML da pizza com os 5 maiores membros da categoria; compartilhado entre as sessões (o aviso fica em criar_grafico_apex_tops)."""
+    top_categoria = top_n(somar_por(df, categoria), categoria, 'Prec_Ven_Total', 5)
+    labels = top_categoria.rotulos
+    valores = top_categoria.valores.tolist()
+
+    html_code = f"""
+    <div id="chart-{categoria}" style="height: 400px;"></div>
+    {script_apexcharts()}
+    <script>
+    var options = {{
+        chart: {{
+            type: 'pie',
+            width: '100%',
+            height: '400px'
+        }},
+        series: {para_json(valores)},
+        labels: {para_json(labels)},
+        title: {{
+            text: '{titulo}',
+            align: 'center'
+        }},
+        legend: {{
+            position: 'bottom',  // Legenda abaixo do gráfico
+            fontSize: '14px'     // Tamanho da fonte da legenda
+        }},
+        responsive: [{{
+            breakpoint: 480,
+            options: {{
+                chart: {{
+                    width: 300
+                }},
+                legend: {{
+                    position: 'bottom',
+                    fontSize: '12px'   // Tamanho da fonte ajustado para dispositivos menores
                 }}
-            }},
+            }}
+        }}]
+    }};
+    var chart = new ApexCharts(document.querySelector("#chart-{categoria}"), options);
+    chart.render();
+    </script>
+    """
+    return html_code
 
-            responsive: [{{
-                breakpoint: 480,
-                options: {{
-                    chart: {{
-                        width: 300
-                    }},
-                    legend: {{
-                        position: 'bottom',
-                        fontSize: '12px'
-                    }}
-                }}
-            }}]
-        }};
-        var chart = new ApexCharts(document.querySelector("#chart-vendedores"), options);
-        chart.render();
-        </script>
-        """
-        return html_code
+def criar_grafico_top_5_vendedores(df):
+    if 'Vendedor' in df.columns and 'Prec_Ven_Total' in df.columns:
+        return _html_top_5_vendedores(df)
     else:
         st.warning("Colunas 'Vendedor' ou 'Prec_Ven_Total' não foram encontradas nos dados.")
         return ""
 
 
+@em_cache
+def _html_top_5_vendedores(df):
+    """HTML da rosca com os 5 maiores vendedores; compartilhado entre as sessões (o aviso fica em criar_grafico_top_5_vendedores)."""
+    top_vendedores = top_n(somar_por(df, 'Vendedor'), 'Vendedor', 'Prec_Ven_Total', 5)
+    labels = [f"<strong>{vendedor} :: R$ {valor:,.2f}</strong>" for vendedor, valor in zip(top_vendedores.rotulos, top_vendedores.valores)]
+    valores = top_vendedores.valores.tolist()
+
+    html_code = f"""
+    <div id="chart-vendedores" style="height: 400px;"></div>
+    {script_apexcharts()}
+    <script>
+    var options = {{
+        chart: {{
+            type: 'donut',
+            width: '100%',
+            height: '400px'
+        }},
+        series: {para_json(valores)},
+        labels: {para_json(labels)},
+        title: {{
+            text: 'Top 5 Vendedores por Vendas',
+            align: 'center'
+        }},
+        legend: {{
+            position: 'bottom',
+            fontSize: '14px'
+        }},
+        tooltip: {{
+            y: {{
+                formatter: function(value) {{
+                    return 'R$ ' + value.toLocaleString('pt-BR', {{ minimumFractionDigits: 2, maximumFractionDigits: 2 }});
+                }}
+            }}
+        }},
+
+        responsive: [{{
+            breakpoint: 480,
+            options: {{
+                chart: {{
+                    width: 300
+                }},
+                legend: {{
+                    position: 'bottom',
+                    fontSize: '12px'
+                }}
+            }}
+        }}]
+    }};
+    var chart = new ApexCharts(document.querySelector("#chart-vendedores"), options);
+    chart.render();
+    </script>
+    """
+    return html_code
+
+
 
     
 #Novo grafico vendedor:
@@ -357,13 +340,8 @@ def criar_grafico_top_5_vendedores(df):
 def criar_grafico_distribuicao_vendedor(df, coluna):
     if 'Vendedor' in df.columns and 'Prec_Ven_Total' in df.columns:
         venda_total = df['Prec_Ven_Total'].sum()
-        df_vendedor = df.groupby('Vendedor').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        df_top_vendedor = df_vendedor.nlargest(5, 'Prec_Ven_Total')
-        df_restante = df_vendedor[~df_vendedor['Vendedor'].isin(df_top_vendedor['Vendedor'])]
-        
-        # Agrupar o restante dos grupos como "Outros"
-        outros = pd.DataFrame({'Vendedor': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
-        df_final = pd.concat([df_top_vendedor, outros], ignore_index=True)
+        # Top 5 vendedores e o restante como "Outros"
+        df_final = top_n(somar_por(df, 'Vendedor'), 'Vendedor', 'Prec_Ven_Total', 5).dataframe('Outros')
         
         # Extrair os rótulos (nomes dos vendedores) e valores para o gráfico
         labels = df_final['Vendedor'].tolist()
@@ -372,7 +350,7 @@ def criar_grafico_distribuicao_vendedor(df, coluna):
         # Criar o gráfico usando ApexCharts
         html_code = f"""
         <div id="chart-distribuicao-grupo" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -380,8 +358,8 @@ def criar_grafico_distribuicao_vendedor(df, coluna):
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: 'Vendas por Vendedor',
                 align: 'center'
@@ -430,17 +408,10 @@ def criar_grafico_distribuicao_medicos(df, container, titulo='Distribuição de
     
     if 'Médico' in df.columns and 'Prec_Ven_Total' in df.columns:
         # Agrupar por médico e somar o total de vendas
-        df_medicos = df.groupby('Médico').agg({'Prec_Ven_Total': 'sum'}).reset_index()
-        
-        # Obter os 5 melhores médicos
-        df_top_medicos = df_medicos.nlargest(5, 'Prec_Ven_Total')
-        
-        # Obter os restantes como "Outros"
-        df_restante = df_medicos[~df_medicos['Médico'].isin(df_top_medicos['Médico'])]
-        outros = pd.DataFrame({'Médico': ['Outros'], 'Prec_Ven_Total': [df_restante['Prec_Ven_Total'].sum()]})
+        df_medicos = somar_por(df, 'Médico')
         
-        # Combinar os dados
-        df_final = pd.concat([df_top_medicos, outros], ignore_index=True)
+        # Obter os 5 melhores médicos e os restantes como "Outros"
+        df_final = top_n(df_medicos, 'Médico', 'Prec_Ven_Total', 5).dataframe('Outros')
         
         # Extrair rótulos e valores para o gráfico
         labels = df_final['Médico'].tolist()
@@ -449,7 +420,7 @@ def criar_grafico_distribuicao_medicos(df, container, titulo='Distribuição de
         # Criar o gráfico usando ApexCharts
         html_code = f"""
         <div id="chart-distribuicao-medicos" style="height: 400px;"></div>
-        <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+        {script_apexcharts()}
         <script>
         var options = {{
             chart: {{
@@ -457,8 +428,8 @@ def criar_grafico_distribuicao_medicos(df, container, titulo='Distribuição de
                 width: '100%',
                 height: '400px'
             }},
-            series: {valores},
-            labels: {labels},
+            series: {para_json(valores)},
+            labels: {para_json(labels)},
             title: {{
                 text: '{titulo}',
                 align: 'center'
@@ -505,15 +476,7 @@ def criar_grafico_distribuicao_medicos(df, container, titulo='Distribuição de
 #Grafico linha
 def criar_grafico_top_linha(df, coluna):
     if 'Linha' in df.columns and 'Prec_Ven_Total' in df.columns:
-        total_vendas = df['Prec_Ven_Total'].sum()
-        top_linha = df.groupby('Linha').agg({'Prec_Ven_Total': 'sum'}).nlargest(7, 'Prec_Ven_Total').reset_index()
-        restante_vendas = total_vendas - top_linha['Prec_Ven_Total'].sum()
-        demais_linha = pd.DataFrame({'Linha': ['Demais Linhas'], 'Prec_Ven_Total': [restante_vendas]})
-        df_final = pd.concat([top_linha, demais_linha], ignore_index=True)
-
-        fig = px.bar(df_final, x='Linha', y='Prec_Ven_Total', title="Top vendas por linhas", text='Prec_Ven_Total', color='Linha')
-        fig.update_layout(yaxis_title="", xaxis_title="Linha", showlegend=False)
-        fig.update_traces(texttemplate='R$ %{text:,.2f}', textposition='inside')
+        fig = figura_top(df, 'Linha', 'Demais Linhas', "Top vendas por linhas")
         coluna.plotly_chart(fig, use_container_width=True)
     else:
         coluna.warning("Colunas 'Linha' ou 'Prec_Ven_Total' não encontradas nos dados.")
@@ -522,15 +485,7 @@ def criar_grafico_top_linha(df, coluna):
 
 def criar_grafico_top_grupo(df, coluna):
     if 'Grupo' in df.columns and 'Prec_Ven_Total' in df.columns:
-        total_vendas = df['Prec_Ven_Total'].sum()
-        top_grupo = df.groupby('Grupo').agg({'Prec_Ven_Total': 'sum'}).nlargest(7, 'Prec_Ven_Total').reset_index()
-        restante_vendas = total_vendas - top_grupo['Prec_Ven_Total'].sum()
-        demais_grupo = pd.DataFrame({'Grupo': ['Demais Grupo'], 'Prec_Ven_Total': [restante_vendas]})
-        df_final = pd.concat([top_grupo, demais_grupo], ignore_index=True)
-
-        fig = px.bar(df_final, x='Grupo', y='Prec_Ven_Total', title="Top vendas por grupos", text='Prec_Ven_Total', color='Grupo')
-        fig.update_layout(yaxis_title="", xaxis_title="Grupo", showlegend=False)
-        fig.update_traces(texttemplate='R$ %{text:,.2f}', textposition='inside')
+        fig = figura_top(df, 'Grupo', 'Demais Grupo', "Top vendas por grupos")
         coluna.plotly_chart(fig, use_container_width=True)
     else:
         coluna.warning("Colunas 'Linha' ou 'Prec_Ven_Total' não encontradas nos dados.")
@@ -7,7 +7,15 @@ from io import BytesIO
 import numpy as np
 from streamlit_extras.metric_cards import style_metric_cards
 import streamlit.components.v1 as components
-from graficos import (criar_mini_grafico, criar_grafico_top_marcas, criar_grafico_top_linha, criar_grafico_top_grupo)
+from cubo import AGREGADO_BASE, AGREGADO_SERIE
+from dados import carregar_cubo
+from recalculo import Recalculo
+from recursos import avisar_recursos_ausentes, links_estilos
+from paineis import renderizar_paineis
+from indicadores import calcular_indicadores
+from agregacao import serie_mensal
+from minigraficos import tendencias_indicadores
+from graficos import (criar_grafico_top_marcas, criar_grafico_top_linha, criar_grafico_top_grupo)
 from chats import (criar_grafico_top_5_vendedores, 
                     criar_grafico_top_5_medicos, 
                     criar_grafico_top_5_parceiros, 
@@ -20,6 +28,10 @@ from chats import (criar_grafico_top_5_vendedores,
 
 
 
+# Copy-on-write do pandas, ligado ao iniciar a página: filtros e cópias rasas compartilham os dados do
+# dataset (ver dados.carregar_dados) e qualquer escrita em um DataFrame derivado cria uma cópia própria
+pd.set_option("mode.copy_on_write", True)
+
 # Configuração da página do Streamlit
 st.set_page_config(
     page_title="Análise de Vendas",
@@ -35,10 +47,9 @@ st.logo(logo, icon_image=icon)
 
 
 
-# Adicionar o link do CDN do Font Awesome
-st.markdown('<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.min.css">', unsafe_allow_html=True)
-st.markdown('<link rel="stylesheet" href="https://maxcdn.bootstrapcdn.com/font-awesome/4.7.0/css/font-awesome.min.css">', unsafe_allow_html=True)
-st.markdown('<link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.2.1/css/bootstrap.min.css">', unsafe_allow_html=True)
+# Ícones dos cards e Bootstrap, servidos localmente (ver recursos.py)
+st.markdown(links_estilos(), unsafe_allow_html=True)
+avisar_recursos_ausentes()
 
 # Configuração regional para formato brasileiro
 #locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
@@ -51,23 +62,19 @@ st.markdown('<link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/boo
 def formatar_real(valor):
     return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
 
-# Carregar dados e cachear
-@st.cache_data
-def carregar_dados():
-    try:
-        df = pd.read_excel(r"./db/1. Análise Resultado Vendas_Suplen 2024 v10_1.xlsx", sheet_name="DADOS")
-        if 'Período' in df.columns:
-            df['Período'] = pd.to_datetime(df['Período'], errors='coerce', dayfirst=True)
-            df = df.dropna(subset=['Período'])
-        df['Ano'] = df['Período'].dt.year
-        df['Mês'] = df['Período'].dt.strftime('%B')
-        return df
-    except FileNotFoundError:
-        st.error("Erro: Planilha não encontrada. Verifique o caminho e o nome do arquivo.")
-        return pd.DataFrame()
-
-# Carregar dados
-df = carregar_dados()
+# Rótulo de uma opção dos filtros com a quantidade de linhas com dados
+def rotulo_opcao(valor, contagens):
+    if valor == "Todos":
+        return valor
+    return f"{valor} ({contagens[valor]:,})".replace(",", ".")
+
+
+# Carregar os agregados pré-calculados; o dashboard não percorre as linhas do dataset
+cubo = carregar_cubo()
+facetas = cubo.facetas
+# Sem dataset (nenhuma planilha, ou as da pasta db ainda em registro), carregar_cubo já avisou na página
+if not cubo.agregados:
+    st.stop()
 
 # CSS personalizado para reduzir o tamanho dos cards
 st.markdown("""
@@ -185,55 +192,56 @@ h1 {
 </style>
 """, unsafe_allow_html=True)
 
-# Adicionar filtros na barra lateral
+# Adicionar filtros na barra lateral. Cada filtro mostra só as opções com dados para as seleções
+# anteriores, com a quantidade de linhas de cada uma, consultadas nas facetas do cubo
+filtros = {}
 with st.sidebar:
     # Gera a lista de anos, começando com "Todos"
-    anos = np.append(["Todos"], df['Ano'].unique())
+    contagem_anos = facetas.opcoes('Ano')
+    anos = ["Todos", *contagem_anos]
     
     # Define o índice padrão para o ano de 2023, se estiver presente na lista
     if 2023 in anos:
-        index_padrao = list(anos).index(2023)
+        index_padrao = anos.index(2023)
     else:
         index_padrao = 0  # Se 2023 não estiver na lista, começa com "Todos"
     
     # Filtro de ano
-    ano_selecionado = st.selectbox("Ano", anos, index=index_padrao)
+    ano_selecionado = st.selectbox("Ano", anos, index=index_padrao, format_func=lambda v: rotulo_opcao(v, contagem_anos))
+    if ano_selecionado != "Todos":
+        filtros['Ano'] = int(ano_selecionado)
 
     # Filtro de mês (dependente do ano selecionado)
-    if ano_selecionado == "Todos":
-        meses = np.append(["Todos"], df['Mês'].unique())
-    else:
-        meses = np.append(["Todos"], df[df['Ano'] == int(ano_selecionado)]['Mês'].unique())
-    mes_selecionado = st.selectbox("Mês", meses)
-
-    # Filtro de Região (verificando se existe no DataFrame)
-    if 'Região' in df.columns:
-        regioes = np.append(["Todos"], df['Região'].unique())
-        regiao_selecionada = st.selectbox("Região", regioes)
+    contagem_meses = facetas.opcoes('Mês', filtros)
+    mes_selecionado = st.selectbox("Mês", ["Todos", *contagem_meses], format_func=lambda v: rotulo_opcao(v, contagem_meses))
+    if mes_selecionado != "Todos":
+        filtros['Mês'] = mes_selecionado
+
+    # Filtro de Região (verificando se existe nos dados; dependente do ano e do mês)
+    if 'Região' in facetas.colunas:
+        contagem_regioes = facetas.opcoes('Região', filtros)
+        regiao_selecionada = st.selectbox("Região", ["Todos", *contagem_regioes], format_func=lambda v: rotulo_opcao(v, contagem_regioes))
+        if regiao_selecionada != "Todos":
+            filtros['Região'] = regiao_selecionada
     else:
         st.warning("A coluna 'Região' não foi encontrada no DataFrame.")
 
-    # Filtro de Marca (verificando se existe no DataFrame)
-    if 'Marca' in df.columns:
-        marcas = np.append(["Todos"], df['Marca'].unique())
-        marca_selecionada = st.selectbox("Marca", marcas)
+    # Filtro de Marca (verificando se existe nos dados; dependente dos filtros acima)
+    if 'Marca' in facetas.colunas:
+        contagem_marcas = facetas.opcoes('Marca', filtros)
+        marca_selecionada = st.selectbox("Marca", ["Todos", *contagem_marcas], format_func=lambda v: rotulo_opcao(v, contagem_marcas))
+        if marca_selecionada != "Todos":
+            filtros['Marca'] = marca_selecionada
     else:
         st.warning("A coluna 'Marca' não foi encontrada no DataFrame.")
 
-# Aplicar os filtros automaticamente conforme as seleções
-dados_filtrados = df.copy()
-
-if ano_selecionado != "Todos":
-    dados_filtrados = dados_filtrados[dados_filtrados['Ano'] == int(ano_selecionado)]
-
-if mes_selecionado != "Todos":
-    dados_filtrados = dados_filtrados[dados_filtrados['Mês'] == mes_selecionado]
-
-if 'Região' in df.columns and regiao_selecionada != "Todos":
-    dados_filtrados = dados_filtrados[dados_filtrados['Região'] == regiao_selecionada]
-
-if 'Marca' in df.columns and marca_selecionada != "Todos":
-    dados_filtrados = dados_filtrados[dados_filtrados['Marca'] == marca_selecionada]
+# Cards, regiões e marcas usam o agregado base; a evolução, a série mensal; os rankings, o agregado
+# da sua dimensão. Todos com os quatro filtros. As seleções guardam só os números das linhas e não
+# copiam os agregados. Entre os reruns da sessão, as seleções partem das anteriores, e os gráficos feitos
+# sobre elas (em_cache) são reaproveitados quando os filtros voltam a uma combinação já calculada
+recalculo = Recalculo('home3', filtros, cubo.versao)
+dados_filtrados = recalculo.selecionar(AGREGADO_BASE, cubo.selecionar, AGREGADO_BASE, filtros)
+serie_filtrada = recalculo.selecionar(AGREGADO_SERIE, cubo.selecionar, AGREGADO_SERIE, filtros)
 
 
 
@@ -241,33 +249,20 @@ st.title("Dashboard de Vendas")
 # Layout para os cards lado a lado
 col1, col2, col3, col4, col5, col6, col7, col8 = st.columns(8)
 
-# Calcular métricas
-total_vendas = dados_filtrados['Prec_Ven_Total'].sum()
-total_imposto = dados_filtrados['R$_Tot_Imposto'].sum()
-total_custo = dados_filtrados['Cus_Total'].sum()
-total_frete = dados_filtrados['R$_Frete'].sum()
-total_despesa = dados_filtrados['R$_Despesa'].sum()
-total_comissao = dados_filtrados['R$_Comissao'].sum()
-total_incentivo = dados_filtrados['R$_Inc_Venda'].sum()
-total_rentabilidade = dados_filtrados['R$_Marg_Contribuicao'].sum()
-
-marg_imposto = (total_imposto / total_vendas) * 100 if total_vendas != 0 else 0
-marg_custo = (total_custo / total_vendas) * 100 if total_vendas != 0 else 0
-marg_frete = (total_frete / total_vendas) * 100 if total_vendas != 0 else 0
-marg_despesa = (total_despesa / total_vendas) * 100 if total_vendas != 0 else 0
-marg_comissao = (total_comissao / total_vendas) * 100 if total_vendas != 0 else 0
-marg_incentivo = (total_incentivo / total_vendas) * 100 if total_vendas != 0 else 0
-marg_rentabilidade = (total_rentabilidade / total_vendas) * 100 if total_vendas != 0 else 0
-
-mini_grafico_base64 = criar_mini_grafico(dados_filtrados)
+# Calcular métricas: totais e margens das oito medidas em uma única passada
+kpi = calcular_indicadores(dados_filtrados)
+
+# Tendência mensal de cada card, em SVG desenhado direto da série
+serie_mensal_filtrada = serie_mensal(serie_filtrada)
+tendencias = tendencias_indicadores(serie_mensal_filtrada)
 
 # Card de Venda total
 with col1:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-cash icon"></i> Total Vendas</h3>
-        <p>{formatar_real(total_vendas)}</p>
-        <img src="data:image/png;base64,{mini_grafico_base64}" alt="Mini Gráfico" style="margin-top: 10px; width: 50%;;">
+        <p>{formatar_real(kpi.vendas)}</p>
+        <div style="margin-top: 10px;">{tendencias['vendas']}</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -276,9 +271,9 @@ with col2:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-graph-up-arrow icon"></i> Impostos</h3>
-        <p style="color:#e60b0b;">-{formatar_real(total_imposto)}</p>
-        <p style="font-size: 20px; color: #003CA6;">({marg_imposto:.2f}%)</p>
-        <p></p> 
+        <p style="color:#e60b0b;">-{formatar_real(kpi.imposto)}</p>
+        <p style="font-size: 20px; color: #003CA6;">({kpi.margens['imposto']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['imposto']}</div> 
 
         
     </div>
@@ -289,9 +284,9 @@ with col3:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-wallet2 icon"></i> Custo</h3>
-        <p style="color:#e60b0b;">-{formatar_real(total_custo)}</p>
-        <p style="font-size: 20px; color: #003CA6;">({marg_custo:.2f}%)</p>
-        <p></p>
+        <p style="color:#e60b0b;">-{formatar_real(kpi.custo)}</p>
+        <p style="font-size: 20px; color: #003CA6;">({kpi.margens['custo']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['custo']}</div>
     </div>
     """, unsafe_allow_html=True) 
 
@@ -300,9 +295,9 @@ with col4:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-airplane icon"></i> Frete</h3>
-        <p style="color:#e60b0b;">-{formatar_real(total_frete)}</p>
-        <p style="font-size: 20px; color: #003CA6;">({marg_frete:.2f}%)</p>
-        <p></p>
+        <p style="color:#e60b0b;">-{formatar_real(kpi.frete)}</p>
+        <p style="font-size: 20px; color: #003CA6;">({kpi.margens['frete']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['frete']}</div>
     </div>
     """, unsafe_allow_html=True) 
 
@@ -311,9 +306,9 @@ with col5:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-clipboard2-data icon"></i> Despesas</h3>
-        <p style="color:#e60b0b;">-{formatar_real(total_despesa)}</p>
-        <p style="font-size: 20px; color: #003CA6;">({marg_despesa:.2f}%)</p>
-        <p></p>
+        <p style="color:#e60b0b;">-{formatar_real(kpi.despesa)}</p>
+        <p style="font-size: 20px; color: #003CA6;">({kpi.margens['despesa']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['despesa']}</div>
     </div>
     """, unsafe_allow_html=True) 
 
@@ -322,9 +317,9 @@ with col6:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-diagram-3 icon"></i> Comissão</h3>
-        <p style="color:#e60b0b;">-{formatar_real(total_comissao)}</p>
-        <p style="font-size: 20px; color: #003CA6;">({marg_comissao:.2f}%)</p>
-        <p></p>
+        <p style="color:#e60b0b;">-{formatar_real(kpi.comissao)}</p>
+        <p style="font-size: 20px; color: #003CA6;">({kpi.margens['comissao']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['comissao']}</div>
     </div>
     """, unsafe_allow_html=True) 
 
@@ -333,9 +328,9 @@ with col7:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-file-earmark-bar-graph icon"></i> Incentivo</h3>
-        <p style="color:#e60b0b;">-{formatar_real(total_incentivo)}</p>
-        <p style="font-size: 20px; color: #003CA6;">({marg_incentivo:.2f}%)</p>
-        <p></p>
+        <p style="color:#e60b0b;">-{formatar_real(kpi.incentivo)}</p>
+        <p style="font-size: 20px; color: #003CA6;">({kpi.margens['incentivo']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['incentivo']}</div>
     </div>
     """, unsafe_allow_html=True) 
 
@@ -344,9 +339,9 @@ with col8:
     st.markdown(f"""
     <div class="card">
         <h3><i class="bi bi-cash-coin icon"></i> Rentabilidade</h3>
-        <p>{formatar_real(total_rentabilidade)}</p>
-        <p style="font-size: 20px; color: #2ecc71;">({marg_rentabilidade:.2f}%)</p>
-        <p></p>
+        <p>{formatar_real(kpi.rentabilidade)}</p>
+        <p style="font-size: 20px; color: #2ecc71;">({kpi.margens['rentabilidade']:.2f}%)</p>
+        <div style="margin-top: 10px;">{tendencias['rentabilidade']}</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -354,57 +349,25 @@ with col8:
 st.markdown("###  ")
 
 # chamar grafico
-grafico_col1, grafico_col2, grafico_col3 = st.columns([0.9, 0.5, 0.5])
-
-grafico_venda = criar_grafico_evolucao_vendas_rentabilidade(dados_filtrados)
-with grafico_col1:
-    st.markdown('<div class="grafico-apex">',unsafe_allow_html=True)
-    components.html(grafico_venda, height=500, scrolling=True)  # Reduced height and enabled scrolling
-    st.markdown('</div>', unsafe_allow_html=True)
-
-
+grafico_venda = criar_grafico_evolucao_vendas_rentabilidade(serie_filtrada)
 grafico_regiao = criar_grafico_por_regiao_pie(dados_filtrados)
-with grafico_col2:
-    st.markdown('<div class="grafico-apex">', unsafe_allow_html=True)
-    components.html(grafico_regiao, height=500, scrolling=True)
-    st.markdown('</div>', unsafe_allow_html=True)
 grafico_regiao_retabilidade = criar_grafico_por_regiao_pie_rentabilidade(dados_filtrados)
-with grafico_col3:
-    st.markdown('<div class="grafico-apex">', unsafe_allow_html=True)
-    components.html(grafico_regiao_retabilidade, height=500, scrolling=True)
-    st.markdown('</div>', unsafe_allow_html=True)    
-      
-st.markdown("### ")
-
-col1, col2, col3, col4 = st.columns([0.5, 0.5, 0.5, 0.5])  
 
 # criar_grafico_top_5_vendedores is a function that generates your graph
-grafico_vendedores = criar_grafico_top_5_vendedores(dados_filtrados)
-with col1:
-    st.markdown('<div class="grafico-apex">', unsafe_allow_html=True)
-    components.html(grafico_vendedores, height=500, scrolling=True)  # Reduced height and enabled scrolling
-    st.markdown('</div>', unsafe_allow_html=True)
-
-grafico_rentabilidae = criar_grafico_rentabilidade_vendedores (dados_filtrados) 
-with col2:
-    st.markdown('<div class="grafico-apex">', unsafe_allow_html=True)
-    components.html(grafico_rentabilidae, height=500, scrolling=True)  # Reduced height and enabled scrolling
-    st.markdown('</div>', unsafe_allow_html=True)  
-
-# grafico de medico is a function that generates your graph
-grafico_medico = criar_grafico_top_5_medicos(dados_filtrados)
-with col3:
-    st.markdown('<div class="grafico-apex">', unsafe_allow_html=True)
-    components.html(grafico_medico, height=500, scrolling=True)  # Reduced height and enabled scrolling
-    st.markdown('</div>', unsafe_allow_html=True)
-
-# Assuming `grafico de parceiro` is a function that generates your graph
-grafico_parceiro = criar_grafico_top_5_parceiros(dados_filtrados)
-with col4:
-    st.markdown('<div class="grafico-apex">', unsafe_allow_html=True)
-    components.html(grafico_parceiro, height=500, scrolling=True)  # Reduced height and enabled scrolling
-    st.markdown('</div>', unsafe_allow_html=True)  
-
+vendas_vendedor = recalculo.selecionar('Vendedor', cubo.selecionar, 'Vendedor', filtros)
+grafico_vendedores = criar_grafico_top_5_vendedores(vendas_vendedor)
+grafico_rentabilidae = criar_grafico_rentabilidade_vendedores(vendas_vendedor)
+
+# grafico de medico e de parceiro
+grafico_medico = criar_grafico_top_5_medicos(recalculo.selecionar('Médico', cubo.selecionar, 'Médico', filtros))
+grafico_parceiro = criar_grafico_top_5_parceiros(recalculo.selecionar('Parceiro', cubo.selecionar, 'Parceiro', filtros))
+
+# Todos os gráficos ApexCharts em um único iframe, na grade das colunas de antes
+renderizar_paineis(
+    [[grafico_venda, grafico_regiao, grafico_regiao_retabilidade],
+     [grafico_vendedores, grafico_rentabilidae, grafico_medico, grafico_parceiro]],
+    larguras=[[0.9, 0.5, 0.5], [0.5, 0.5, 0.5, 0.5]]
+)
 
 grfcol1, grfcol2, grfcol3 = st.columns([0.8, 0.8, 0.8])
 
@@ -415,12 +378,12 @@ with grfcol1:
 
 with grfcol2:
     st.markdown('<div style="height:400px; margin-top: -400px;">', unsafe_allow_html=True)
-    criar_grafico_top_grupo(dados_filtrados, grfcol2)
+    criar_grafico_top_grupo(recalculo.selecionar('Grupo', cubo.selecionar, 'Grupo', filtros), grfcol2)
     st.markdown('</div>', unsafe_allow_html=True)
 
 with grfcol3:
     st.markdown('<div style="height:400px; margin-top: -400px;">', unsafe_allow_html=True)
-    criar_grafico_top_linha(dados_filtrados, grfcol3)
+    criar_grafico_top_linha(recalculo.selecionar('Linha', cubo.selecionar, 'Linha', filtros), grfcol3)
     st.markdown('</div>', unsafe_allow_html=True)
 
 # Adicionar o rodapé
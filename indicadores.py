@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from typing import Dict, Union
+import numpy as np
+import pandas as pd
+from esquema import MEDIDAS
+from filtros import Selecao
+
+# Campo do resultado correspondente a cada medida em R$, na ordem de esquema.MEDIDAS
+CAMPOS = {
+    'Prec_Ven_Total': 'vendas',
+    'R$_Tot_Imposto': 'imposto',
+    'Cus_Total': 'custo',
+    'R$_Frete': 'frete',
+    'R$_Despesa': 'despesa',
+    'R$_Comissao': 'comissao',
+    'R$_Inc_Venda': 'incentivo',
+    'R$_Marg_Contribuicao': 'rentabilidade',
+}
+
+
+@dataclass(frozen=True)
+class Indicadores:
+    """Totais das medidas em R$ e a participação de cada uma nas vendas, usados nos cards."""
+    vendas: float
+    imposto: float
+    custo: float
+    frete: float
+    despesa: float
+    comissao: float
+    incentivo: float
+    rentabilidade: float
+    margens: Dict[str, float]  # Percentual de cada campo sobre as vendas; 0 quando não há vendas
+
+
+def calcular_indicadores(df: Union[pd.DataFrame, Selecao]) -> Indicadores:
+    """
+    Calcula os totais das oito medidas e as margens sobre as vendas em uma única passada,
+    somando as colunas de um bloco numérico 2-D. Medidas ausentes nos dados contam como zero.
+
+    Args:
+        df (Union[pd.DataFrame, Selecao]): Linhas ou agregados filtrados, com as colunas de esquema.MEDIDAS
+
+    Returns:
+        Indicadores: Totais e margens
+    """
+    presentes = [i for i, medida in enumerate(MEDIDAS) if medida in df.columns]
+    totais = np.zeros(len(MEDIDAS))
+    if presentes:
+        bloco = df[[MEDIDAS[i] for i in presentes]].to_numpy(dtype='float64')
+        totais[presentes] = np.nansum(bloco, axis=0)
+
+    vendas = totais[MEDIDAS.index('Prec_Ven_Total')]
+    margens = totais / vendas * 100 if vendas != 0 else np.zeros(len(MEDIDAS))
+
+    campos = [CAMPOS[medida] for medida in MEDIDAS]
+    return Indicadores(
+        **{campo: float(total) for campo, total in zip(campos, totais)},
+        margens={campo: float(margem) for campo, margem in zip(campos, margens)}
+    )
@@ -0,0 +1,605 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+import registro
+from cubo import agregar, consolidar
+from esquema import MEDIDAS, TIPOS_INTEIROS, memoria_mb, relatorio_memoria
+
+logger = logging.getLogger(__name__)
+
+# Pasta dos módulos do projeto, para o import nos processos de conversão (ver _converter_em_processo)
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Aba da planilha com os dados de vendas
+ABA_DADOS = "DADOS"
+
+# Linhas lidas da planilha por lote; limita a memória usada na conversão
+TAMANHO_LOTE = 20_000
+
+# Bytes copiados por vez ao salvar o arquivo enviado
+TAMANHO_BLOCO = 1 << 20
+
+# Modos de registro de uma planilha
+MODO_SUBSTITUIR = "substituir"
+MODO_ANEXAR = "anexar"
+
+# Formatos de 'Período' em texto, na ordem em que são testados
+FORMATOS_DATA = ['%d/%m/%Y', '%d/%m/%Y %H:%M:%S', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d-%m-%Y', '%d.%m.%Y', '%m/%Y']
+
+# Linhas de texto usadas para detectar o formato das datas
+TAMANHO_AMOSTRA_DATAS = 200
+
+# Números de linha citados no log quando há linhas descartadas
+LINHAS_NO_LOG = 5
+
+# Dia zero das datas seriais do Excel (sistema de datas 1900)
+ORIGEM_EXCEL = pd.Timestamp('1899-12-30')
+
+# Recebe a fração já processada (0 a 1) durante a conversão
+Progresso = Callable[[float], None]
+
+
+@dataclass
+class ResultadoIngestao:
+    """Resultado do registro de uma planilha."""
+    versao: str
+    convertida: bool
+    alteradas: List[str] = field(default_factory=list)  # Partições novas ou alteradas em relação ao dataset ativo
+    mantidas: List[str] = field(default_factory=list)  # Partições reaproveitadas sem regravação
+
+
+def salvar_upload(arquivo: BinaryIO, destino: str, tamanho_bloco: int = TAMANHO_BLOCO) -> str:
+    """
+    Copia o arquivo enviado para o disco em blocos, calculando o hash do conteúdo no caminho.
+
+    Args:
+        arquivo (BinaryIO): Arquivo enviado pelo st.file_uploader
+        destino (str): Caminho final do arquivo
+        tamanho_bloco (int): Quantidade de bytes copiada por vez
+
+    Returns:
+        str: SHA-256 do conteúdo
+    """
+    sha = hashlib.sha256()
+    temporario = destino + ".tmp"
+    arquivo.seek(0)
+    with open(temporario, "wb") as f:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b""):
+            sha.update(bloco)
+            f.write(bloco)
+    os.replace(temporario, destino)
+    return sha.hexdigest()
+
+
+def detectar_formato(textos: pd.Series) -> Optional[str]:
+    """
+    Detecta o formato das datas em texto testando uma amostra contra os formatos conhecidos.
+
+    Args:
+        textos (pd.Series): Datas em texto
+
+    Returns:
+        Optional[str]: Formato que converte toda a amostra, ou None se nenhum servir
+    """
+    amostra = textos.dropna().head(TAMANHO_AMOSTRA_DATAS)
+    for formato in FORMATOS_DATA:
+        if pd.to_datetime(amostra, format=formato, errors='coerce').notna().all():
+            return formato
+    return None
+
+
+def converter_periodo(serie: pd.Series) -> pd.Series:
+    """
+    Converte a coluna 'Período' para datetime conforme o tipo de cada célula:
+    datas do Excel já vêm como datetime, números são datas seriais do Excel e
+    textos são convertidos com o formato detectado em uma amostra.
+
+    Args:
+        serie (pd.Series): Valores brutos de 'Período'
+
+    Returns:
+        pd.Series: Datas em datetime64[ns], com NaT nos valores inválidos
+    """
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie.astype('datetime64[ns]')
+
+    valores = serie.astype(object)
+    tipos = valores.map(type)
+    textos = tipos == str
+    numeros = pd.to_numeric(valores.where(~textos), errors='coerce')
+    seriais = numeros.notna()
+    datas = ~(textos | seriais) & valores.notna()
+
+    resultado = pd.Series(pd.NaT, index=serie.index, dtype='datetime64[ns]')
+    if datas.any():
+        resultado[datas] = pd.to_datetime(valores[datas], errors='coerce')
+    if seriais.any():
+        resultado[seriais] = ORIGEM_EXCEL + pd.to_timedelta(numeros[seriais], unit='D')
+    if textos.any():
+        texto = valores[textos].str.strip()
+        formato = detectar_formato(texto)
+        if formato is not None:
+            resultado[textos] = pd.to_datetime(texto, format=formato, errors='coerce')
+        else:
+            resultado[textos] = pd.to_datetime(texto, errors='coerce', dayfirst=True, format='mixed')
+    return resultado
+
+
+def preparar_dados(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converte a coluna 'Período' e cria as colunas inteiras de calendário
+    ('Ano', 'Mês_Num', 'Trimestre' e 'Semana'), para que os gráficos não precisem converter datas.
+    O nome do mês é derivado de 'Mês_Num' na carga (ver esquema.aplicar_esquema).
+
+    Linhas sem data válida em 'Período' são descartadas e contadas no log, com os números das primeiras.
+
+    Args:
+        df (pd.DataFrame): Dados brutos da aba DADOS, indexados pelo número da linha (ver ler_lotes)
+
+    Returns:
+        pd.DataFrame: Dados sem períodos inválidos e com as colunas derivadas
+
+    Raises:
+        ValueError: Se a aba não tiver a coluna 'Período'
+    """
+    if 'Período' not in df.columns:
+        raise ValueError(f"A aba '{ABA_DADOS}' não tem a coluna 'Período'.")
+    df['Período'] = converter_periodo(df['Período'])
+    invalidos = df['Período'].isna()
+    if invalidos.any():
+        logger.warning(
+            "%d linha(s) sem data válida em 'Período' descartada(s) (linhas %s)",
+            invalidos.sum(), ", ".join(str(numero) for numero in df.index[invalidos][:LINHAS_NO_LOG])
+        )
+        df = df[~invalidos].copy()
+    periodo = df['Período'].dt
+    df['Ano'] = periodo.year
+    df['Mês_Num'] = periodo.month
+    df['Trimestre'] = periodo.quarter
+    df['Semana'] = periodo.isocalendar().week.astype('int64')
+    return df
+
+
+def ler_lotes(
+    caminho_planilha: str,
+    tamanho_lote: int = TAMANHO_LOTE,
+    progresso: Optional[Progresso] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lê a aba DADOS em lotes de linhas com o openpyxl em modo somente leitura,
+    sem carregar a planilha inteira na memória.
+
+    Args:
+        caminho_planilha (str): Caminho da planilha .xlsx/.xlsm
+        tamanho_lote (int): Quantidade máxima de linhas por lote
+        progresso (Optional[Progresso]): Chamado após cada lote com a fração de linhas lidas
+
+    Yields:
+        pd.DataFrame: Lote de linhas com os nomes de coluna do cabeçalho, indexado pelo número da linha na aba
+    """
+    wb = load_workbook(caminho_planilha, read_only=True, data_only=True)
+    try:
+        planilha = wb[ABA_DADOS]
+        # Total de linhas pela dimensão declarada na aba; pode faltar em planilhas geradas por outros programas
+        total = (planilha.max_row or 0) - 1
+        linhas = planilha.iter_rows(values_only=True)
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        colunas = [str(nome) if nome is not None else f"Unnamed: {i}" for i, nome in enumerate(cabecalho)]
+
+        lote = []
+        numeros = []
+        lidas = 0
+        for linha in linhas:
+            lidas += 1
+            # Linhas totalmente vazias no fim da aba são ignoradas, como no pd.read_excel
+            if all(valor is None for valor in linha):
+                continue
+            lote.append(linha)
+            numeros.append(lidas + 1)  # O cabeçalho é a linha 1
+            if len(lote) == tamanho_lote:
+                yield pd.DataFrame(lote, columns=colunas, index=numeros)
+                lote, numeros = [], []
+                if progresso and total > 0:
+                    progresso(min(lidas / total, 1.0))
+        if lote:
+            yield pd.DataFrame(lote, columns=colunas, index=numeros)
+        if progresso:
+            progresso(1.0)
+    finally:
+        wb.close()
+
+
+class _ColunaComTexto(Exception):
+    """Texto em uma coluna que o primeiro lote definiu como número ou data (ver converter_planilha)."""
+
+    def __init__(self, coluna: str):
+        super().__init__(coluna)
+        self.coluna = coluna
+
+
+def _esquema_arrow(df: pd.DataFrame, colunas_texto: Sequence[str] = ()) -> pa.Schema:
+    """
+    Define o tipo de cada coluna a partir do primeiro lote: datas, números em float64 e o restante como texto.
+    As medidas são sempre float64, e as colunas_texto, sempre texto. Os lotes seguintes são convertidos
+    para este mesmo esquema.
+    """
+    campos = []
+    for coluna in df.columns:
+        serie = df[coluna]
+        if coluna in TIPOS_INTEIROS:
+            tipo = pa.from_numpy_dtype(np.dtype(TIPOS_INTEIROS[coluna]))
+        elif coluna in MEDIDAS:
+            tipo = pa.float64()
+        elif coluna in colunas_texto:
+            tipo = pa.string()
+        elif pd.api.types.is_datetime64_any_dtype(serie):
+            tipo = pa.timestamp("ns")
+        elif pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+            tipo = pa.float64()
+        else:
+            tipo = pa.string()
+        campos.append(pa.field(coluna, tipo))
+    return pa.schema(campos)
+
+
+def _normalizar_lote(df: pd.DataFrame, esquema: pa.Schema) -> pa.Table:
+    """
+    Converte um lote para o esquema do arquivo colunar.
+
+    Texto em uma medida é um erro da planilha (ValueError com a coluna e a linha); em outra coluna de
+    números ou datas, interrompe a conversão para que ela seja refeita com a coluna como texto.
+    """
+    colunas = {}
+    for campo in esquema:
+        bruta = df[campo.name] if campo.name in df.columns else pd.Series(None, index=df.index, dtype=object)
+        serie = bruta
+        if pa.types.is_timestamp(campo.type):
+            serie = pd.to_datetime(serie, errors='coerce')
+        elif pa.types.is_floating(campo.type):
+            serie = pd.to_numeric(serie, errors='coerce').astype('float64')
+        elif pa.types.is_string(campo.type):
+            # Códigos numéricos misturados com texto viram texto
+            serie = serie.astype(object).where(serie.isna(), serie.astype(str))
+        # Valores preenchidos que a conversão anulou; células só com espaços contam como vazias
+        anulados = bruta[serie.isna() & bruta.notna()]
+        anulados = anulados[anulados.astype(str).str.strip() != '']
+        if len(anulados):
+            if campo.name in MEDIDAS:
+                raise ValueError(
+                    f"Valor não numérico na coluna '{campo.name}', linha {anulados.index[0]} "
+                    f"da aba '{ABA_DADOS}': {anulados.iloc[0]!r}"
+                )
+            raise _ColunaComTexto(campo.name)
+        colunas[campo.name] = serie
+    return pa.Table.from_pandas(pd.DataFrame(colunas), schema=esquema, preserve_index=False)
+
+
+def _chaves_particao(df: pd.DataFrame) -> np.ndarray:
+    """Código AAAAMM do mês de cada linha, usado para separar as partições."""
+    return df['Ano'].to_numpy(dtype='int32') * 100 + df['Mês_Num'].to_numpy(dtype='int32')
+
+
+def converter_planilha(
+    caminho_planilha: str,
+    tamanho_lote: int = TAMANHO_LOTE,
+    progresso: Optional[Progresso] = None
+) -> Dict[str, dict]:
+    """
+    Converte a aba DADOS para Parquet lote a lote, separando as linhas em uma partição por mês.
+    A memória usada não depende do tamanho da planilha.
+
+    Cada partição recebe um checksum do seu conteúdo e é gravada em um arquivo endereçado por ele:
+    um mês que já existe com o mesmo conteúdo não é regravado. Os agregados do cubo
+    (ver cubo.agregar) de cada mês são calculados no mesmo passo e gravados ao lado da partição.
+
+    Os tipos das colunas vêm do primeiro lote. Se um lote seguinte tiver texto em uma coluna de
+    números ou datas, a conversão é refeita com ela como texto; texto em uma medida é um erro.
+
+    Args:
+        caminho_planilha (str): Caminho da planilha .xlsx/.xlsm
+        tamanho_lote (int): Quantidade máxima de linhas por lote
+        progresso (Optional[Progresso]): Chamado com a fração de linhas já convertidas
+
+    Returns:
+        Dict[str, dict]: Partições por chave AAAA-MM, com checksum, arquivo, cubo, linhas e memória estimada
+
+    Raises:
+        ValueError: Aba vazia, ou valor não numérico em uma medida (com a coluna e a linha)
+    """
+    colunas_texto: List[str] = []
+    while True:
+        try:
+            return _converter_lotes(caminho_planilha, tamanho_lote, progresso, colunas_texto)
+        except _ColunaComTexto as erro:
+            logger.info("Coluna '%s' com texto depois do primeiro lote; convertendo como texto", erro.coluna)
+            colunas_texto.append(erro.coluna)
+
+
+def _converter_lotes(
+    caminho_planilha: str,
+    tamanho_lote: int,
+    progresso: Optional[Progresso],
+    colunas_texto: Sequence[str]
+) -> Dict[str, dict]:
+    """Converte a planilha com o esquema do primeiro lote e as colunas_texto como texto (ver converter_planilha)."""
+    os.makedirs(registro.PASTA_PARTICOES, exist_ok=True)
+    esquema: Optional[pa.Schema] = None
+    escritores: Dict[str, pq.ParquetWriter] = {}
+    temporarios: Dict[str, str] = {}
+    checksums = {}
+    cubos: Dict[str, List[pd.DataFrame]] = {}
+    particoes: Dict[str, dict] = {}
+    try:
+        for lote in ler_lotes(caminho_planilha, tamanho_lote, progresso):
+            lote = preparar_dados(lote)
+            if esquema is None:
+                esquema = _esquema_arrow(lote, colunas_texto)
+            lote = _normalizar_lote(lote, esquema).to_pandas()
+
+            for codigo, grupo in lote.groupby(_chaves_particao(lote), sort=False):
+                chave = f"{codigo // 100:04d}-{codigo % 100:02d}"
+                if chave not in escritores:
+                    # Grava em arquivo temporário; só vira partição definitiva no final
+                    temporarios[chave] = os.path.join(registro.PASTA_PARTICOES, f".{chave}-{uuid.uuid4().hex}.tmp")
+                    escritores[chave] = pq.ParquetWriter(temporarios[chave], esquema)
+                    checksums[chave] = hashlib.sha256(",".join(esquema.names).encode())
+                    cubos[chave] = []
+                    particoes[chave] = {"linhas": 0, "antes_mb": 0.0, "depois_mb": 0.0}
+
+                tabela = pa.Table.from_pandas(grupo, schema=esquema, preserve_index=False)
+                escritores[chave].write_table(tabela)
+                checksums[chave].update(pd.util.hash_pandas_object(grupo, index=False).to_numpy().tobytes())
+                cubos[chave].append(agregar(grupo))
+
+                # Memória com strings em objetos Python e a da tabela gravada, com os tipos do esquema
+                particao = particoes[chave]
+                particao["linhas"] += len(grupo)
+                particao["antes_mb"] += memoria_mb(grupo)
+                particao["depois_mb"] += tabela.nbytes / 1024 ** 2
+    except BaseException:
+        for chave, escritor in escritores.items():
+            escritor.close()
+            os.remove(temporarios[chave])
+        raise
+    if esquema is None:
+        raise ValueError(f"A aba '{ABA_DADOS}' está vazia.")
+
+    for chave, escritor in escritores.items():
+        escritor.close()
+        checksum = checksums[chave].hexdigest()[:16]
+        destino = registro.caminho_particao(chave, checksum)
+        if os.path.exists(destino):
+            # Mesmo conteúdo de uma partição já gravada: nada a regravar
+            os.remove(temporarios[chave])
+        else:
+            os.replace(temporarios[chave], destino)
+
+        destino_cubo = registro.caminho_cubo(chave, checksum)
+        if not os.path.exists(destino_cubo):
+            temporario_cubo = temporarios[chave] + ".cubo"
+            pq.write_table(pa.Table.from_pandas(consolidar(cubos[chave]), preserve_index=False), temporario_cubo)
+            os.replace(temporario_cubo, destino_cubo)
+        particoes[chave].update(
+            checksum=checksum, arquivo=destino, cubo=destino_cubo,
+            antes_mb=round(particoes[chave]["antes_mb"], 3), depois_mb=round(particoes[chave]["depois_mb"], 3)
+        )
+    return dict(sorted(particoes.items()))
+
+
+def registrar_planilha(
+    caminho_planilha: str,
+    hash_planilha: Optional[str] = None,
+    modo: str = MODO_SUBSTITUIR,
+    progresso: Optional[Progresso] = None
+) -> ResultadoIngestao:
+    """
+    Registra uma planilha e torna o resultado o dataset ativo.
+
+    No modo "substituir", o dataset passa a ser exatamente o conteúdo da planilha.
+    No modo "anexar", os meses da planilha substituem ou complementam os do dataset ativo,
+    e os demais meses são mantidos. Nos dois modos, só as partições novas ou alteradas são gravadas.
+    Uma planilha já registrada com a mesma base não é lida novamente.
+
+    Args:
+        caminho_planilha (str): Caminho da planilha .xlsx/.xlsm
+        hash_planilha (Optional[str]): Hash já calculado ao salvar o arquivo
+        modo (str): MODO_SUBSTITUIR ou MODO_ANEXAR
+        progresso (Optional[Progresso]): Chamado com a fração da planilha já convertida
+
+    Returns:
+        ResultadoIngestao: Versão registrada e partições alteradas/mantidas
+    """
+    hash_planilha = hash_planilha or registro.calcular_hash(caminho_planilha)
+    versao_atual = registro.versao_ativa()
+    atual = registro.buscar_dataset(versao_atual) if versao_atual else None
+
+    base = atual if modo == MODO_ANEXAR else None
+    if base is None:
+        versao = hash_planilha
+    else:
+        versao = hashlib.sha256(f"{versao_atual}+{hash_planilha}".encode()).hexdigest()
+
+    if registro.buscar_dataset(versao):
+        registro.ativar_dataset(versao)
+        return ResultadoIngestao(versao, False)
+
+    novas = converter_planilha(caminho_planilha, progresso=progresso)
+    particoes = {**(base["particoes"] if base else {}), **novas}
+    return _registrar_particoes(
+        versao, caminho_planilha, particoes, novas, atual, {"base": versao_atual if base else None}
+    )
+
+
+def versao_planilha(caminho_planilha: str) -> Tuple[Tuple[int, ...], float]:
+    """
+    Chave de ordenação das planilhas da mais antiga para a mais nova:
+    o número de versão do nome do arquivo (ex.: "v09", "v10_1") e, no empate, a data de modificação.
+
+    Args:
+        caminho_planilha (str): Caminho da planilha
+
+    Returns:
+        Tuple[Tuple[int, ...], float]: Números da versão e data de modificação
+    """
+    encontrado = re.search(r"v(\d+(?:[._]\d+)*)", os.path.basename(caminho_planilha), re.IGNORECASE)
+    numeros = tuple(int(n) for n in re.split(r"[._]", encontrado.group(1))) if encontrado else ()
+    return numeros, os.path.getmtime(caminho_planilha)
+
+
+def _converter_em_processo(caminho_planilha: str) -> Dict[str, dict]:
+    """
+    Converte uma planilha (ver converter_planilha) em um processo novo, iniciado por `python -m ingestao`.
+
+    O multiprocessing não serve aqui: o Streamlit instala o script da página como módulo __main__,
+    e cada processo criado pelo multiprocessing (spawn ou forkserver) executaria a página de novo ao iniciar.
+    O processo novo recebe a pasta das partições e devolve as partições em JSON na saída padrão;
+    o log dele vai para a mesma saída de erros do servidor.
+
+    Args:
+        caminho_planilha (str): Caminho da planilha .xlsx/.xlsm
+
+    Returns:
+        Dict[str, dict]: Partições por chave AAAA-MM, como em converter_planilha
+
+    Raises:
+        ValueError: Erro nos dados da planilha, com a mensagem do processo
+        RuntimeError: Se o processo terminar sem resultado
+    """
+    ambiente = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [DIRETORIO, os.environ.get("PYTHONPATH")]))}
+    processo = subprocess.run(
+        [sys.executable, "-m", "ingestao", caminho_planilha, registro.PASTA_PARTICOES],
+        stdout=subprocess.PIPE, text=True, env=ambiente,
+    )
+    linhas = processo.stdout.strip().splitlines()
+    resposta = json.loads(linhas[-1]) if linhas else {}
+    if "erro" in resposta:
+        raise ValueError(resposta["erro"])
+    if processo.returncode != 0 or "particoes" not in resposta:
+        raise RuntimeError(
+            f"Falha ao converter {os.path.basename(caminho_planilha)} (código {processo.returncode}); veja o log do servidor"
+        )
+    return resposta["particoes"]
+
+
+def registrar_planilhas(
+    caminhos_planilhas: Sequence[str],
+    processos: Optional[int] = None,
+    progresso: Optional[Progresso] = None
+) -> ResultadoIngestao:
+    """
+    Registra um conjunto de planilhas (ex.: uma por ano ou por versão) como um único dataset particionado.
+
+    As planilhas são convertidas em paralelo, uma por processo. Quando mais de uma planilha tem o
+    mesmo mês, vale a da versão mais nova (ver versao_planilha). Colunas que só existem em
+    algumas planilhas ficam nulas nas demais, e tipos divergentes são conciliados na leitura
+    (ver dados.unificar_esquemas).
+
+    Args:
+        caminhos_planilhas (Sequence[str]): Caminhos das planilhas .xlsx/.xlsm
+        processos (Optional[int]): Quantidade máxima de processos; por padrão, um por CPU
+        progresso (Optional[Progresso]): Chamado com a fração de planilhas já convertidas
+
+    Returns:
+        ResultadoIngestao: Versão registrada e partições alteradas/mantidas
+    """
+    caminhos = sorted(caminhos_planilhas, key=versao_planilha)
+    if len(caminhos) == 1:
+        return registrar_planilha(caminhos[0], progresso=progresso)
+
+    hashes = [registro.calcular_hash(caminho) for caminho in caminhos]
+    versao = hashlib.sha256("+".join(hashes).encode()).hexdigest()
+    if registro.buscar_dataset(versao):
+        registro.ativar_dataset(versao)
+        return ResultadoIngestao(versao, False)
+
+    # Cada planilha em um processo próprio (ver _converter_em_processo); as threads só esperam por eles
+    with ThreadPoolExecutor(max_workers=processos or os.cpu_count()) as pool:
+        futuros = [pool.submit(_converter_em_processo, caminho) for caminho in caminhos]
+        for concluidas, _ in enumerate(as_completed(futuros), start=1):
+            if progresso:
+                progresso(concluidas / len(futuros))
+        convertidas = [futuro.result() for futuro in futuros]
+
+    # Da mais antiga para a mais nova: um mês repetido fica com a partição da planilha mais nova
+    novas: Dict[str, dict] = {}
+    for caminho, particoes_planilha in zip(caminhos, convertidas):
+        for chave, particao in particoes_planilha.items():
+            novas[chave] = {**particao, "planilha": os.path.basename(caminho)}
+
+    versao_atual = registro.versao_ativa()
+    atual = registro.buscar_dataset(versao_atual) if versao_atual else None
+    return _registrar_particoes(versao, caminhos[-1], novas, novas, atual, {"planilhas": caminhos})
+
+
+def _registrar_particoes(
+    versao: str,
+    arquivo: str,
+    particoes: Dict[str, dict],
+    novas: Dict[str, dict],
+    atual: Optional[dict],
+    metadados: dict
+) -> ResultadoIngestao:
+    """Registra as partições como dataset ativo, comparando as novas com as do dataset ativo anterior."""
+    particoes = dict(sorted(particoes.items()))
+    anteriores = atual["particoes"] if atual else {}
+    alteradas = [chave for chave, p in novas.items() if anteriores.get(chave, {}).get("checksum") != p["checksum"]]
+    mantidas = [chave for chave in particoes if chave not in alteradas]
+
+    memoria = relatorio_memoria(
+        sum(p["antes_mb"] for p in particoes.values()),
+        sum(p["depois_mb"] for p in particoes.values())
+    )
+    registro.adicionar_dataset(versao, arquivo, particoes, {"memoria": memoria, **metadados})
+    return ResultadoIngestao(versao, True, sorted(alteradas), mantidas)
+
+
+def previa(versao: str, linhas: int = 5) -> pd.DataFrame:
+    """
+    Lê apenas as primeiras linhas da primeira partição de uma versão.
+
+    Args:
+        versao (str): Identificador da versão
+        linhas (int): Quantidade de linhas
+
+    Returns:
+        pd.DataFrame: Primeiras linhas da aba DADOS convertida
+    """
+    entrada = registro.buscar_dataset(versao)
+    primeira = next(iter(entrada["particoes"].values()))
+    arquivo = pq.ParquetFile(primeira["arquivo"])
+    primeiro_lote = next(arquivo.iter_batches(batch_size=linhas), None)
+    if primeiro_lote is None:
+        return pd.DataFrame(columns=arquivo.schema_arrow.names)
+    return primeiro_lote.to_pandas()
+
+
+def _main(argumentos: Sequence[str]) -> int:
+    """Processo de conversão de uma planilha (ver _converter_em_processo): planilha e pasta das partições."""
+    caminho_planilha, registro.PASTA_PARTICOES = argumentos
+    try:
+        particoes = converter_planilha(caminho_planilha)
+    except ValueError as erro:
+        print(json.dumps({"erro": str(erro)}))
+        return 1
+    print(json.dumps({"particoes": particoes}))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(_main(sys.argv[1:]))
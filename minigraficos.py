@@ -0,0 +1,71 @@
+import functools
+from typing import Dict, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from indicadores import CAMPOS
+
+# Tamanho do desenho; o SVG se ajusta à largura do card
+LARGURA = 120
+ALTURA = 36
+# Cor da linha de cada card: vendas e rentabilidade como os valores dos cards, as despesas em vermelho
+CORES = {'vendas': '#003CA6', 'rentabilidade': '#2ecc71'}
+COR_PADRAO = '#e60b0b'
+
+
+def svg_tendencia(valores: Sequence[float], cor: str = CORES['vendas'], largura: int = LARGURA, altura: int = ALTURA) -> str:
+    """
+    Desenha uma série como mini gráfico de linha com a área preenchida até o zero, em SVG.
+
+    O SVG é montado direto dos valores, sem figura nem imagem, e memorizado pela série:
+    a mesma série (ex.: o mesmo filtro em outra sessão) não é desenhada de novo.
+
+    Args:
+        valores (Sequence[float]): Valores da série, em ordem
+        cor (str): Cor da linha e da área
+        largura (int): Largura do desenho
+        altura (int): Altura do desenho em px
+
+    Returns:
+        str: Elemento <svg> para embutir no HTML; vazio se a série não tiver valores
+    """
+    serie = np.nan_to_num(np.asarray(valores, dtype='float64'))
+    return _desenhar(tuple(serie.tolist()), cor, largura, altura)
+
+
+@functools.lru_cache(maxsize=1024)
+def _desenhar(valores: Tuple[float, ...], cor: str, largura: int, altura: int) -> str:
+    if not valores:
+        return ""
+    y = np.array(valores if len(valores) > 1 else valores * 2)  # Um ponto só vira uma linha reta
+
+    # Escala vertical com o zero, como o preenchimento até o eixo; 1px de margem para a linha
+    base, topo = min(0.0, y.min()), max(0.0, y.max())
+    escala = (altura - 2) / ((topo - base) or 1.0)
+    x = np.linspace(0, largura, len(y))
+    py = 1 + (topo - y) * escala
+    zero = 1 + topo * escala
+
+    linha = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(x, py))
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {largura} {altura}" width="100%" height="{altura}" '
+        f'preserveAspectRatio="none" role="img" aria-label="Tendência mensal">'
+        f'<polygon points="0,{zero:.1f} {linha} {largura},{zero:.1f}" fill="{cor}" fill-opacity="0.3"/>'
+        f'<polyline points="{linha}" fill="none" stroke="{cor}" stroke-width="1.5" vector-effect="non-scaling-stroke"/>'
+        f'</svg>'
+    )
+
+
+def tendencias_indicadores(serie: pd.DataFrame) -> Dict[str, str]:
+    """
+    Desenha a tendência mensal de cada medida dos cards.
+
+    Args:
+        serie (pd.DataFrame): Série mensal (ver agregacao.serie_mensal) com as colunas de esquema.MEDIDAS
+
+    Returns:
+        Dict[str, str]: SVG por campo de indicadores.Indicadores (vendas, imposto, ...); vazio para medidas ausentes
+    """
+    return {
+        campo: svg_tendencia(serie[medida].to_numpy(), CORES.get(campo, COR_PADRAO)) if medida in serie.columns else ""
+        for medida, campo in CAMPOS.items()
+    }
@@ -3,6 +3,10 @@ import pandas as pd
 #import locale
 import numpy as np
 from streamlit_extras.metric_cards import style_metric_cards
+from agregacao import identidade
+from dados import ORIGEM_LINHAS, carregar_dados, carregar_facetas, carregar_indice
+from recalculo import Recalculo
+from indicadores import calcular_indicadores
 from grafico_vendedor import (
     criar_grafico_top_grupos,
     criar_grafico_top_marcas,
@@ -10,6 +14,10 @@ from grafico_vendedor import (
     criar_grafico_vendas_menos_incentivo
 )
 
+# Copy-on-write do pandas, ligado ao iniciar a página: filtros e cópias rasas compartilham os dados do
+# dataset (ver dados.carregar_dados) e qualquer escrita em um DataFrame derivado cria uma cópia própria
+pd.set_option("mode.copy_on_write", True)
+
 # Configuração da página do Streamlit, com ícone de página e layout em modo "wide"
 st.set_page_config(
     page_title="Análise de Vendas por Vendedor",
@@ -26,27 +34,24 @@ st.logo(logo, icon_image=icon)
 # Função para formatar valores em Real manualmente
 def formatar_real(valor):
     return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+# Rótulo de uma opção dos filtros com a quantidade de linhas com dados
+def rotulo_opcao(valor, contagens):
+    if valor == "Todos":
+        return valor
+    return f"{valor} ({contagens[valor]:,})".replace(",", ".")
 # Função para formatar valores em Real
 #def formatar_real(valor):
 #    return locale.currency(valor, grouping=True, symbol=True)
 
-# Carregar dados e cachear
-@st.cache_data
-def carregar_dados():
-    try:
-        df = pd.read_excel(r"./db/1. Análise Resultado Vendas_Suplen 2024 v10_1.xlsx", sheet_name="DADOS")
-        if 'Período' in df.columns:
-            df['Período'] = pd.to_datetime(df['Período'], errors='coerce', dayfirst=True)
-            df = df.dropna(subset=['Período'])
-        df['Ano'] = df['Período'].dt.year
-        df['Mês'] = df['Período'].dt.strftime('%B')
-        return df
-    except FileNotFoundError:
-        st.error("Erro: Planilha não encontrada. Verifique o caminho e o nome do arquivo.")
-        return pd.DataFrame()
-
-# Carregar dados
+
+# Carregar dados, o índice de filtros e as opções dos filtros (facetas) sobre as linhas
 df = carregar_dados()
+# Sem dataset (nenhuma planilha, ou as da pasta db ainda em registro), carregar_dados já avisou na página
+if df.empty:
+    st.stop()
+indice = carregar_indice()
+facetas = carregar_facetas()
 
 # CSS personalizado para reduzir o tamanho dos cards
 st.markdown("""
@@ -119,55 +124,46 @@ if 'Vendedor' not in df.columns:
     st.error("A coluna 'Vendedor' não foi encontrada na tabela DADOS.")
 else:
 
-    # Filtro de Vendedor
-    vendedores = df['Vendedor'].unique()
-    vendedor_selecionado = st.sidebar.selectbox("Vendedor", vendedores)
+    # Filtro de Vendedor; cada filtro seguinte mostra só as opções com dados para as seleções anteriores
+    contagem_vendedores = facetas.opcoes('Vendedor')
+    vendedor_selecionado = st.sidebar.selectbox("Vendedor", list(contagem_vendedores), format_func=lambda v: rotulo_opcao(v, contagem_vendedores))
+    filtros = {'Vendedor': vendedor_selecionado}
 
     # Filtro de Ano
-    anos = np.append(["Todos"], df['Ano'].unique())
-    ano_selecionado = st.sidebar.selectbox("Ano", anos)
-
-    # Filtro de Mês
-    if ano_selecionado == "Todos":
-        meses = np.append(["Todos"], df['Mês'].unique())
-    else:
-        meses = np.append(["Todos"], df[df['Ano'] == int(ano_selecionado)]['Mês'].unique())
-    mes_selecionado = st.sidebar.selectbox("Mês", meses)
-
-    # Aplicar os filtros conforme as seleções
-    dados_filtrados = df[df['Vendedor'] == vendedor_selecionado]
-
+    contagem_anos = facetas.opcoes('Ano', filtros)
+    ano_selecionado = st.sidebar.selectbox("Ano", ["Todos", *contagem_anos], format_func=lambda v: rotulo_opcao(v, contagem_anos))
     if ano_selecionado != "Todos":
-        dados_filtrados = dados_filtrados[dados_filtrados['Ano'] == int(ano_selecionado)]
+        filtros['Ano'] = int(ano_selecionado)
 
+    # Filtro de Mês
+    contagem_meses = facetas.opcoes('Mês', filtros)
+    mes_selecionado = st.sidebar.selectbox("Mês", ["Todos", *contagem_meses], format_func=lambda v: rotulo_opcao(v, contagem_meses))
     if mes_selecionado != "Todos":
-        dados_filtrados = dados_filtrados[dados_filtrados['Mês'] == mes_selecionado]
+        filtros['Mês'] = mes_selecionado
+
+    # Aplicar os filtros conforme as seleções pelo índice, sem máscaras sobre o dataset inteiro
+    # A identidade (versão do dataset e filtros) permite reaproveitar os gráficos entre as sessões.
+    # Entre os reruns da sessão, as seleções partem das anteriores. O total geral depende só do ano;
+    # o restante, dos três filtros, e os gráficos (em_cache) só são refeitos quando um deles muda
+    recalculo = Recalculo('vendedor', filtros, indice.versao)
+    selecao = recalculo.selecionar('linhas', indice.selecionar, filtros, identidade(indice.versao, ORIGEM_LINHAS, filtros))
+    # Os gráficos do vendedor agrupam por várias colunas: as linhas selecionadas são copiadas uma vez
+    dados_filtrados = selecao.dataframe()
 
     # Layout de colunas para métricas e gráficos
     col_cards1, col_cards2, col_grafico, col_grafico2 = st.columns([0.5, 0.5, 0.9, 0.9])
 
-    def calcular_total_geral(df, ano_selecionado):
-        if ano_selecionado == "Todos":
-            return df['Prec_Ven_Total'].sum()
-        else:
-         dados_filtrados_ano = df[df['Ano'] == int(ano_selecionado)]
-        return dados_filtrados_ano['Prec_Ven_Total'].sum()
-
     with col_cards1:
-        tot_vendas = calcular_total_geral(df, ano_selecionado)
+        tot_vendas = recalculo.selecionar('ano', indice.selecionar, recalculo.filtros_de(['Ano']))['Prec_Ven_Total'].sum()
         st.metric(label="Total Geral", value=formatar_real(tot_vendas))
     
     
     with col_cards2:
-        total_vendas = dados_filtrados['Prec_Ven_Total'].sum()
-        total_incentivo = dados_filtrados['R$_Inc_Venda'].sum()
-        rentabilidade = dados_filtrados['R$_Marg_Contribuicao'].sum()
-        marg_Incentivo = (total_incentivo / total_vendas) * 100 if total_vendas != 0 else 0
-        marg_Rentabilidade = (rentabilidade / total_vendas) * 100 if total_vendas != 0 else 0
-
-        st.metric(label="Total Vendas do Vendedor", value=formatar_real(total_vendas))
-        st.metric(label="Incentivo", value=formatar_real(total_incentivo), delta=f"{marg_Incentivo:.2f}%")
-        st.metric(label="Rentabilidade", value=formatar_real(rentabilidade), delta=f"{marg_Rentabilidade:.2f}%")
+        kpi = calcular_indicadores(selecao)
+
+        st.metric(label="Total Vendas do Vendedor", value=formatar_real(kpi.vendas))
+        st.metric(label="Incentivo", value=formatar_real(kpi.incentivo), delta=f"{kpi.margens['incentivo']:.2f}%")
+        st.metric(label="Rentabilidade", value=formatar_real(kpi.rentabilidade), delta=f"{kpi.margens['rentabilidade']:.2f}%")
         style_metric_cards()
 
     with col_grafico:
@@ -195,7 +191,7 @@ else:
 
     # Tabela de detalhamento das vendas por Parceiro
     st.markdown("### Detalhamento das vendas por Parceiro:")
-    detalhamento_parceiro = dados_filtrados.groupby('Parceiro').agg({
+    detalhamento_parceiro = dados_filtrados.groupby('Parceiro', observed=True).agg({
         'Prec_Ven_Total': 'sum',
         'R$_Inc_Venda': 'sum'
     }).reset_index()
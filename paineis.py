@@ -0,0 +1,109 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import streamlit as st
+import streamlit.components.v1 as components
+from recursos import url_recurso
+from serializacao import CASAS_DECIMAIS, compactar, registrar_payload
+
+# Altura de cada linha de painéis, a mesma dos iframes individuais usados antes
+ALTURA_LINHA = 500
+# Espaço entre os painéis, em px
+ESPACO = 16
+# Prefixo das chaves em st.session_state com os modelos já enviados a cada componente
+PREFIXO_ESTADO = "paineis_"
+
+# Componente sem build: um index.html que desenha a grade e atualiza só os dados dos gráficos
+_componente = components.declare_component("paineis", path=str(Path(__file__).parent / "componentes" / "paineis"))
+
+
+@dataclass(frozen=True)
+class PainelApex:
+    """
+    Gráfico ApexCharts separado em modelo e dados.
+
+    O modelo (opcoes) são as opções do ApexCharts sem os dados, em JSON: os formatters são
+    referenciados pelo nome (ex.: 'formatter': 'moeda') e resolvidos no navegador (FORMATADORES em
+    componentes/paineis/index.html). Os dados são as séries, os rótulos e as categorias, que mudam com os filtros.
+    """
+    opcoes: Dict[str, Any]
+    series: List[Any]
+    labels: Optional[List[str]] = None  # Rótulos dos gráficos de pizza e rosca
+    categorias: Optional[List[str]] = None  # Categorias do eixo x
+    estilo: str = "height: 400px;"  # Estilo do contêiner do gráfico
+    casas: Optional[int] = CASAS_DECIMAIS  # Casas decimais dos números enviados; None mantém a precisão
+
+    @property
+    def nome(self) -> str:
+        """Título do gráfico, usado nas métricas de payload."""
+        return self.opcoes.get('title', {}).get('text') or self.modelo
+
+    @property
+    def modelo(self) -> str:
+        """Hash das opções, com o qual o navegador reconhece um modelo que já recebeu."""
+        return hashlib.sha1(json.dumps(self.opcoes, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+    def dados(self) -> Dict[str, Any]:
+        """Parte do gráfico que muda a cada filtro, com os números arredondados (ver serializacao.compactar)."""
+        return compactar({'series': self.series, 'labels': self.labels, 'categorias': self.categorias}, self.casas)
+
+
+# Conteúdo de uma célula: um painel ou a mensagem que os gráficos retornam quando faltam colunas
+Conteudo = Union[PainelApex, str]
+
+
+def renderizar_paineis(linhas: Sequence[Sequence[Conteudo]], larguras: Optional[Sequence[Sequence[float]]] = None,
+                       altura_linha: int = ALTURA_LINHA, key: str = "paineis") -> Optional[Dict[str, Any]]:
+    """
+    Desenha os painéis ApexCharts da página em um único componente, em grade.
+
+    O componente é montado uma vez e, a cada rerun, recebe só os dados dos gráficos, arredondados e com
+    o tamanho registrado por gráfico (serializacao.tamanhos_payload). Os modelos já enviados nesta
+    sessão ficam guardados no navegador e um gráfico com o mesmo modelo é atualizado
+    (updateSeries/updateOptions) em vez de desenhado de novo. Se o navegador não tiver algum modelo
+    (ex.: o iframe foi recriado), ele o pede de volta e o próximo rerun o envia.
+
+    Args:
+        linhas (Sequence[Sequence[Conteudo]]): Painéis de cada linha, da esquerda para a direita
+        larguras (Optional[Sequence[Sequence[float]]]): Proporção das colunas de cada linha, como em st.columns; por padrão, iguais
+        altura_linha (int): Altura de cada linha em px
+        key (str): Chave do componente; deve ser única na página
+
+    Returns:
+        Optional[Dict[str, Any]]: Último ponto clicado (linha, coluna, serie, ponto e rotulo), ou None
+    """
+    estado = st.session_state.setdefault(PREFIXO_ESTADO + key, {'modelos': set(), 'pedido': None})
+    valor = st.session_state.get(key) or {}
+    if valor.get('pedido') is not None and valor['pedido'] != estado['pedido']:
+        # Modelos que o navegador não tem mais voltam a ser enviados
+        estado['pedido'] = valor['pedido']
+        estado['modelos'].difference_update(valor.get('ausentes', []))
+
+    celulas: List[List[Dict[str, Any]]] = []
+    for linha in linhas:
+        celulas.append([])
+        for conteudo in linha:
+            if not isinstance(conteudo, PainelApex):
+                celulas[-1].append({'mensagem': str(conteudo)})
+                continue
+            celula = {'modelo': conteudo.modelo, 'estilo': conteudo.estilo, 'dados': conteudo.dados()}
+            if celula['modelo'] not in estado['modelos']:
+                celula['opcoes'] = conteudo.opcoes
+                estado['modelos'].add(celula['modelo'])
+            # O Streamlit serializa os argumentos do componente com json.dumps
+            registrar_payload(conteudo.nome, json.dumps(celula), {**celula, 'dados': {
+                'series': conteudo.series, 'labels': conteudo.labels, 'categorias': conteudo.categorias}})
+            celulas[-1].append(celula)
+
+    valor = _componente(
+        linhas=celulas,
+        larguras=[list(l) for l in larguras] if larguras is not None else None,
+        altura_linha=altura_linha,
+        espaco=ESPACO,
+        biblioteca=url_recurso("apexcharts.min.js", em_componente=True),
+        key=key,
+        default=None,
+    )
+    return (valor or {}).get('selecao')
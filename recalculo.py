@@ -0,0 +1,53 @@
+from typing import Callable, Dict, Iterable, Optional
+import streamlit as st
+from filtros import Selecao
+
+# Prefixo das chaves em st.session_state com o estado de cada página
+PREFIXO_ESTADO = "recalculo_"
+
+
+class Recalculo:
+    """
+    Estado de uma página entre os reruns da mesma sessão: os filtros atuais e as seleções da execução anterior.
+
+    A cada rerun, as seleções partem das anteriores (ver filtros.IndiceFiltros.selecionar). Os filtros
+    entram na identidade de cada seleção: os gráficos e somas feitos sobre ela (cache_graficos.em_cache
+    e agregacao.somar_por) são reaproveitados para os mesmos filtros. Os resultados não são guardados
+    aqui. Trocar de dataset recomeça as seleções.
+    """
+
+    def __init__(self, pagina: str, filtros: Dict[str, object], versao: Optional[str] = None):
+        self.filtros = dict(filtros)
+        self._estado = st.session_state.setdefault(PREFIXO_ESTADO + pagina, {})
+        # Seleções de outro dataset não servem de ponto de partida
+        if "selecoes" not in self._estado or self._estado.get("versao") != versao:
+            self._estado["selecoes"] = {}
+        self._estado["versao"] = versao
+
+    def filtros_de(self, dependencias: Iterable[str]) -> Dict[str, object]:
+        """
+        Filtros atuais restritos às colunas de que uma seleção depende.
+
+        Args:
+            dependencias (Iterable[str]): Colunas de filtro das quais a seleção depende
+
+        Returns:
+            Dict[str, object]: Valor de cada filtro ativo entre as dependências
+        """
+        return {c: self.filtros[c] for c in dependencias if c in self.filtros}
+
+    def selecionar(self, nome: str, selecionar: Callable[..., Selecao], *args) -> Selecao:
+        """
+        Seleciona as linhas com a função recebida, passando a ela a seleção anterior de mesmo nome.
+
+        Args:
+            nome (str): Nome da seleção na página (ex.: o agregado do cubo)
+            selecionar (Callable[..., Selecao]): Cubo.selecionar ou IndiceFiltros.selecionar, que aceitam anterior
+            *args: Argumentos da função (ex.: agregado e filtros)
+
+        Returns:
+            Selecao: Seleção atual, guardada para o próximo rerun
+        """
+        selecao = selecionar(*args, anterior=self._estado["selecoes"].get(nome))
+        self._estado["selecoes"][nome] = selecao
+        return selecao
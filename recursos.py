@@ -0,0 +1,133 @@
+import logging
+import os
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+import streamlit as st
+import streamlit.components.v1 as components
+
+logger = logging.getLogger(__name__)
+
+# Bibliotecas de front-end copiadas para o repositório, servidas pelo próprio Streamlit
+DIRETORIO_RECURSOS = Path(__file__).parent / "static"
+
+# Arquivo local e origem fixada na versão; `python recursos.py` baixa os que faltarem.
+# O static/apexcharts.min.js versionado é o dist/apexcharts.common.js da mesma versão, envolvido para
+# definir window.ApexCharts (ver o comentário no início do arquivo); fica na 3.x, publicada sob MIT
+ORIGENS: Dict[str, str] = {
+    "apexcharts.min.js": "https://cdn.jsdelivr.net/npm/apexcharts@3.37.1/dist/apexcharts.min.js",
+    "bootstrap.min.css": "https://cdn.jsdelivr.net/npm/bootstrap@4.2.1/dist/css/bootstrap.min.css",
+    "bootstrap-icons.min.css": "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.min.css",
+    # Fontes referenciadas pelo bootstrap-icons.min.css como ./fonts/...
+    "fonts/bootstrap-icons.woff2": "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/fonts/bootstrap-icons.woff2",
+    "fonts/bootstrap-icons.woff": "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/fonts/bootstrap-icons.woff",
+}
+
+# Com ANALISE_RECURSOS_LOCAIS=1 (servidor sem acesso à internet), um recurso ausente em static/ é um
+# erro, em vez de ser buscado na CDN
+RECURSOS_LOCAIS = os.environ.get("ANALISE_RECURSOS_LOCAIS") == "1"
+
+# O static serving do Streamlit (app/static) entrega .js e .css como text/plain com nosniff, e o navegador
+# se recusa a executá-los. A pasta é registrada como componente: a rota component/ usa o tipo correto e
+# Cache-Control public, então cada arquivo é baixado uma vez e reaproveitado por todos os iframes
+_componente = components.declare_component("recursos", path=str(DIRETORIO_RECURSOS))
+
+
+def url_recurso(arquivo: str, em_componente: bool = False) -> str:
+    """
+    Retorna o endereço de um recurso de front-end, relativo à página, para uso no HTML dos gráficos.
+
+    Enquanto o arquivo não estiver em static/, usa a origem na CDN, para que o dashboard continue
+    funcionando em uma cópia nova do repositório; a página mostra o aviso de avisar_recursos_ausentes.
+    Com RECURSOS_LOCAIS, o arquivo ausente é um erro.
+
+    Args:
+        arquivo (str): Caminho do arquivo em static/ (chave de ORIGENS)
+        em_componente (bool): Endereço visto de dentro de um componente (component/<nome>/index.html)
+
+    Returns:
+        str: URL relativa servida pelo Streamlit ou URL da CDN
+
+    Raises:
+        FileNotFoundError: Se o arquivo não estiver em static/ e RECURSOS_LOCAIS estiver ativo
+    """
+    if (DIRETORIO_RECURSOS / arquivo).is_file():
+        return f"{'..' if em_componente else 'component'}/{_componente.name}/{arquivo}"
+    if RECURSOS_LOCAIS:
+        raise FileNotFoundError(
+            f"Recurso {arquivo} ausente em {DIRETORIO_RECURSOS}. Rode `python recursos.py` em uma máquina "
+            f"com internet e copie a pasta static/ para o servidor."
+        )
+    logger.warning("Recurso %s ausente em %s; usando a CDN", arquivo, DIRETORIO_RECURSOS)
+    return ORIGENS[arquivo]
+
+
+def recursos_ausentes() -> List[str]:
+    """
+    Lista os arquivos de ORIGENS que ainda não estão em static/.
+
+    Returns:
+        List[str]: Arquivos ausentes, servidos pela CDN
+    """
+    return [arquivo for arquivo in ORIGENS if not (DIRETORIO_RECURSOS / arquivo).is_file()]
+
+
+def avisar_recursos_ausentes() -> None:
+    """Mostra na página um aviso quando algum recurso de front-end está vindo da CDN em vez de static/."""
+    ausentes = recursos_ausentes()
+    if ausentes:
+        st.warning(
+            f"Recursos de front-end ausentes em static/ ({', '.join(ausentes)}): os gráficos e ícones dependem "
+            f"da CDN e não funcionam sem internet. Rode `python recursos.py` para baixá-los.",
+            icon="⚠️",
+        )
+
+
+def baixar_recursos(sobrescrever: bool = False) -> List[str]:
+    """
+    Baixa para static/ os arquivos de ORIGENS, nas versões fixadas.
+
+    Args:
+        sobrescrever (bool): Baixa de novo os arquivos que já existem
+
+    Returns:
+        List[str]: Arquivos baixados
+    """
+    baixados = []
+    for arquivo, origem in ORIGENS.items():
+        destino = DIRETORIO_RECURSOS / arquivo
+        if destino.is_file() and not sobrescrever:
+            continue
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(origem, timeout=60) as resposta:
+            destino.write_bytes(resposta.read())
+        baixados.append(arquivo)
+    return baixados
+
+
+def script_apexcharts() -> str:
+    """
+    Tag do ApexCharts usada por todos os gráficos em HTML. Resolvida a cada gráfico, e não no import,
+    para que um recurso ausente (ver url_recurso) não impeça o import das páginas.
+
+    Returns:
+        str: Tag <script> com o endereço do ApexCharts
+    """
+    return f'<script src="{url_recurso("apexcharts.min.js")}"></script>'
+
+
+def links_estilos() -> str:
+    """
+    Folhas de estilo das páginas: ícones dos cards e Bootstrap.
+
+    Returns:
+        str: Tags <link> das folhas de estilo
+    """
+    return "".join(
+        f'<link rel="stylesheet" href="{url_recurso(arquivo)}">' for arquivo in ("bootstrap-icons.min.css", "bootstrap.min.css")
+    )
+
+
+if __name__ == "__main__":
+    for arquivo in baixar_recursos():
+        print(f"Baixado: static/{arquivo}")
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+# Pasta onde ficam as planilhas enviadas, o registro e os arquivos convertidos
+PASTA_DB = "db"
+ARQUIVO_REGISTRO = os.path.join(PASTA_DB, "registro.json")
+PASTA_PARTICOES = os.path.join(PASTA_DB, "particoes")
+
+# Versão do formato dos arquivos convertidos; entradas de outro formato são convertidas de novo
+FORMATO_ARTEFATOS = 7
+
+
+def calcular_hash(caminho: str, tamanho_bloco: int = 1 << 20) -> str:
+    """
+    Calcula o SHA-256 do conteúdo de um arquivo, lendo-o em blocos.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        tamanho_bloco (int): Quantidade de bytes lida por vez
+
+    Returns:
+        str: Hash hexadecimal do conteúdo
+    """
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b""):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def caminho_particao(chave: str, checksum: str) -> str:
+    """
+    Retorna o caminho do arquivo de uma partição mensal, endereçado pelo checksum do conteúdo.
+    Partições iguais em versões diferentes do dataset apontam para o mesmo arquivo.
+
+    Args:
+        chave (str): Mês da partição no formato AAAA-MM
+        checksum (str): Checksum das linhas da partição
+
+    Returns:
+        str: Caminho do arquivo Parquet da partição
+    """
+    return os.path.join(PASTA_PARTICOES, f"{chave}-{checksum}.parquet")
+
+
+def caminho_cubo(chave: str, checksum: str) -> str:
+    """
+    Retorna o caminho dos agregados pré-calculados de uma partição mensal (ver cubo.agregar).
+
+    Args:
+        chave (str): Mês da partição no formato AAAA-MM
+        checksum (str): Checksum das linhas da partição
+
+    Returns:
+        str: Caminho do arquivo Parquet dos agregados
+    """
+    return os.path.join(PASTA_PARTICOES, f"{chave}-{checksum}.cubo.parquet")
+
+
+def ler_registro() -> dict:
+    """
+    Lê o registro de datasets. Retorna um registro vazio se ainda não existir.
+
+    Returns:
+        dict: {'ativo': hash ou None, 'datasets': {hash: entrada}}
+    """
+    if not os.path.exists(ARQUIVO_REGISTRO):
+        return {"ativo": None, "datasets": {}}
+    with open(ARQUIVO_REGISTRO, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def gravar_registro(registro: dict) -> None:
+    """
+    Grava o registro de forma atômica (arquivo temporário + renomeação).
+
+    Args:
+        registro (dict): Registro completo
+    """
+    os.makedirs(PASTA_DB, exist_ok=True)
+    temporario = ARQUIVO_REGISTRO + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(registro, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, ARQUIVO_REGISTRO)
+
+
+def buscar_dataset(versao: str) -> Optional[dict]:
+    """
+    Retorna a entrada de uma versão se ela estiver registrada no formato atual
+    e os arquivos de suas partições e agregados existirem.
+
+    Args:
+        versao (str): Identificador da versão
+
+    Returns:
+        Optional[dict]: Entrada do registro ou None
+    """
+    entrada = ler_registro()["datasets"].get(versao)
+    if entrada is None or entrada.get("formato") != FORMATO_ARTEFATOS:
+        return None
+    arquivos = [particao[campo] for particao in entrada["particoes"].values() for campo in ("arquivo", "cubo")]
+    if all(os.path.exists(arquivo) for arquivo in arquivos):
+        return entrada
+    return None
+
+
+def adicionar_dataset(versao: str, arquivo: str, particoes: dict, metadados: Optional[dict] = None) -> None:
+    """
+    Registra uma versão convertida e a marca como dataset ativo.
+
+    Args:
+        versao (str): Identificador da versão
+        arquivo (str): Caminho da planilha de origem
+        particoes (dict): Partições mensais da versão, por chave AAAA-MM
+        metadados (Optional[dict]): Informações extras da conversão (ex.: memória)
+    """
+    registro = ler_registro()
+    registro["datasets"][versao] = {
+        "arquivo": arquivo,
+        "particoes": particoes,
+        "formato": FORMATO_ARTEFATOS,
+        "registrado_em": datetime.now().isoformat(timespec="seconds"),
+        **(metadados or {}),
+    }
+    registro["ativo"] = versao
+    gravar_registro(registro)
+
+
+def ativar_dataset(versao: str) -> None:
+    """
+    Aponta o dataset ativo para uma versão já registrada.
+
+    Args:
+        versao (str): Identificador da versão
+    """
+    registro = ler_registro()
+    if versao not in registro["datasets"]:
+        raise KeyError(f"Versão não registrada: {versao}")
+    registro["ativo"] = versao
+    gravar_registro(registro)
+
+
+def versao_ativa() -> Optional[str]:
+    """
+    Retorna o hash do dataset ativo, ou None se nenhuma planilha foi registrada.
+
+    Returns:
+        Optional[str]: Hash do dataset ativo
+    """
+    return ler_registro()["ativo"]
@@ -0,0 +1,111 @@
+import json
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Casas decimais dos valores enviados aos gráficos: os formatters exibem no máximo duas
+CASAS_DECIMAIS = 2
+# Payloads acima deste tamanho são registrados no log como aviso
+LIMITE_BYTES = 256 * 1024
+
+# Caracteres que encerrariam o <script> ou quebrariam o JavaScript quando o JSON é embutido no HTML.
+# Dentro de strings JSON, o escape \uXXXX é lido de volta como o mesmo caractere
+_ESCAPES = {ord('<'): '\\u003c', ord('>'): '\\u003e', ord('&'): '\\u0026', 0x2028: '\\u2028', 0x2029: '\\u2029'}
+
+
+def compactar(valor: Any, casas: Optional[int] = CASAS_DECIMAIS) -> Any:
+    """
+    Prepara um valor para JSON: arredonda os números, troca NaN e infinito por None e converte os
+    tipos do numpy e do pandas (escalares e arrays) para os equivalentes em Python.
+
+    Args:
+        valor (Any): Dados do gráfico (listas, dicionários, números, textos)
+        casas (Optional[int]): Casas decimais dos números não inteiros; None mantém a precisão
+
+    Returns:
+        Any: Valor com apenas tipos aceitos pelo json
+    """
+    if isinstance(valor, dict):
+        return {str(chave): compactar(item, casas) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [compactar(item, casas) for item in valor]
+    if isinstance(valor, np.ndarray) or (hasattr(valor, 'tolist') and not isinstance(valor, np.generic)):
+        # Arrays do numpy e Series/Index do pandas
+        return compactar(valor.tolist(), casas)
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float):
+        if not math.isfinite(valor):
+            return None
+        if casas is not None:
+            valor = round(valor, casas)
+        # 12.0 vira 12 no JSON
+        return int(valor) if valor.is_integer() and abs(valor) < 2 ** 53 else valor
+    return valor
+
+
+def para_json(valor: Any, casas: Optional[int] = CASAS_DECIMAIS) -> str:
+    """
+    Serializa dados de gráfico em JSON compacto, seguro para embutir em <script>.
+
+    Args:
+        valor (Any): Dados do gráfico
+        casas (Optional[int]): Casas decimais dos números não inteiros; None mantém a precisão
+
+    Returns:
+        str: JSON sem espaços, com os números arredondados e os caracteres especiais escapados
+    """
+    texto = json.dumps(compactar(valor, casas), ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+    return texto.translate(_ESCAPES)
+
+
+@dataclass(frozen=True)
+class TamanhoPayload:
+    """Tamanho do último payload enviado por um gráfico."""
+    grafico: str
+    bytes: int  # Tamanho do JSON enviado
+    bytes_sem_compactar: int  # Tamanho do mesmo JSON com a precisão completa, para comparação
+
+
+_tamanhos: Dict[str, TamanhoPayload] = {}
+_trava = threading.Lock()
+
+
+def registrar_payload(grafico: str, enviado: str, original: Any) -> TamanhoPayload:
+    """
+    Guarda o tamanho do payload de um gráfico e avisa no log quando passa de LIMITE_BYTES.
+
+    Args:
+        grafico (str): Nome do gráfico
+        enviado (str): JSON enviado ao navegador
+        original (Any): Dados antes da compactação
+
+    Returns:
+        TamanhoPayload: Tamanho registrado
+    """
+    tamanho = TamanhoPayload(
+        grafico,
+        len(enviado.encode('utf-8')),
+        len(json.dumps(compactar(original, None)).encode('utf-8'))
+    )
+    with _trava:
+        _tamanhos[grafico] = tamanho
+    if tamanho.bytes > LIMITE_BYTES:
+        logger.warning("Payload do gráfico %s com %d bytes (limite %d)", grafico, tamanho.bytes, LIMITE_BYTES)
+    return tamanho
+
+
+def tamanhos_payload() -> Dict[str, TamanhoPayload]:
+    """
+    Retorna o tamanho do último payload de cada gráfico, desde o início do processo.
+
+    Returns:
+        Dict[str, TamanhoPayload]: Tamanho por nome do gráfico
+    """
+    with _trava:
+        return dict(_tamanhos)
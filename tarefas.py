@@ -0,0 +1,219 @@
+import logging
+import os
+import queue
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Optional, Tuple
+import registro
+from ingestao import MODO_SUBSTITUIR, ResultadoIngestao, registrar_planilha, registrar_planilhas, salvar_upload
+
+logger = logging.getLogger(__name__)
+
+# Estados de uma tarefa de ingestão
+PENDENTE = "pendente"
+EXECUTANDO = "executando"
+CONCLUIDA = "concluida"
+FALHOU = "falhou"
+
+# Parte da barra de progresso reservada para salvar os arquivos; o restante é a conversão
+FRACAO_SALVAR = 0.1
+
+# Tarefas finalizadas mantidas até serem retiradas pela página; acima disso, saem as mais antigas
+MAX_FINALIZADAS = 32
+
+
+@dataclass
+class TarefaIngestao:
+    """Upload enfileirado para ingestão em segundo plano, consultado pela página enquanto executa."""
+    arquivos: List[Tuple[str, BinaryIO]]  # Nome e conteúdo de cada planilha enviada; vazio para planilhas já salvas
+    modo: str = MODO_SUBSTITUIR
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    estado: str = PENDENTE
+    progresso: float = 0.0
+    mensagem: str = "Aguardando na fila"
+    caminhos: List[str] = field(default_factory=list)
+    resultado: Optional[ResultadoIngestao] = None
+    erro: Optional[str] = None
+
+    @property
+    def finalizada(self) -> bool:
+        return self.estado in (CONCLUIDA, FALHOU)
+
+
+class FilaIngestao:
+    """
+    Executa as tarefas de ingestão uma de cada vez, em ordem de chegada, em uma thread de fundo.
+
+    Como as tarefas são serializadas, dois uploads nunca gravam na pasta db ao mesmo tempo.
+    Cada arquivo é gravado em um temporário e renomeado, e o dataset ativo só muda no registro
+    ao final da conversão: até lá, os dashboards continuam servindo a versão anterior.
+
+    Uma tarefa finalizada sai da fila quando a página a retira (ver retirar); das que nunca são
+    retiradas (ex.: sessão encerrada durante a ingestão), ficam só as MAX_FINALIZADAS mais recentes.
+    """
+
+    def __init__(self, pasta: str = registro.PASTA_DB):
+        self.pasta = pasta
+        self._fila: "queue.Queue[TarefaIngestao]" = queue.Queue()
+        self._tarefas: Dict[str, TarefaIngestao] = {}
+        self._finalizadas: List[str] = []  # Em ordem de término
+        self._trava = threading.Lock()
+        self._thread = threading.Thread(target=self._executar, name="fila-ingestao", daemon=True)
+        self._thread.start()
+
+    def enviar(self, arquivos: List[Tuple[str, BinaryIO]], modo: str = MODO_SUBSTITUIR) -> str:
+        """
+        Enfileira o upload de uma ou mais planilhas.
+
+        Args:
+            arquivos (List[Tuple[str, BinaryIO]]): Nome e conteúdo de cada planilha; só o nome do
+                arquivo é usado, sem as pastas
+            modo (str): MODO_SUBSTITUIR ou MODO_ANEXAR (ignorado com várias planilhas)
+
+        Returns:
+            str: Identificador da tarefa
+
+        Raises:
+            ValueError: Nome de arquivo vazio ou que não é um arquivo ("." ou "..")
+        """
+        tarefa = TarefaIngestao([(nome_arquivo(nome), conteudo) for nome, conteudo in arquivos], modo)
+        return self._enfileirar(tarefa)
+
+    def enviar_planilhas(self, caminhos: List[str]) -> str:
+        """
+        Enfileira o registro de planilhas já salvas (ex.: as da pasta db) como o dataset ativo.
+
+        Args:
+            caminhos (List[str]): Caminhos das planilhas
+
+        Returns:
+            str: Identificador da tarefa
+        """
+        return self._enfileirar(TarefaIngestao([], caminhos=list(caminhos)))
+
+    def _enfileirar(self, tarefa: TarefaIngestao) -> str:
+        with self._trava:
+            self._tarefas[tarefa.id] = tarefa
+        self._fila.put(tarefa)
+        return tarefa.id
+
+    def consultar(self, id_tarefa: str) -> Optional[TarefaIngestao]:
+        """
+        Retorna a tarefa com o estado e o progresso atuais.
+
+        Args:
+            id_tarefa (str): Identificador retornado por enviar
+
+        Returns:
+            Optional[TarefaIngestao]: A tarefa, ou None se não existir neste processo
+        """
+        with self._trava:
+            return self._tarefas.get(id_tarefa)
+
+    def retirar(self, id_tarefa: str) -> Optional[TarefaIngestao]:
+        """
+        Retira uma tarefa finalizada da fila, depois de exibido o resultado; tarefas em andamento ficam.
+
+        Args:
+            id_tarefa (str): Identificador retornado por enviar
+
+        Returns:
+            Optional[TarefaIngestao]: A tarefa, ou None se não existir neste processo
+        """
+        with self._trava:
+            tarefa = self._tarefas.get(id_tarefa)
+            if tarefa is not None and tarefa.finalizada:
+                del self._tarefas[id_tarefa]
+                if id_tarefa in self._finalizadas:
+                    self._finalizadas.remove(id_tarefa)
+            return tarefa
+
+    def posicao(self, id_tarefa: str) -> int:
+        """Quantidade de tarefas que ainda serão executadas antes desta."""
+        with self._trava:
+            pendentes = [t.id for t in self._tarefas.values() if not t.finalizada]
+        return pendentes.index(id_tarefa) if id_tarefa in pendentes else 0
+
+    def _executar(self) -> None:
+        while True:
+            tarefa = self._fila.get()
+            tarefa.estado = EXECUTANDO
+            try:
+                self._processar(tarefa)
+                tarefa.estado = CONCLUIDA
+                tarefa.mensagem = "Concluída"
+            except Exception as erro:
+                logger.exception("Falha na ingestão da tarefa %s", tarefa.id)
+                tarefa.estado = FALHOU
+                tarefa.erro = str(erro)
+                tarefa.mensagem = "Falhou"
+            finally:
+                # O conteúdo enviado não é mais necessário depois de salvo
+                tarefa.arquivos = []
+                self._finalizar(tarefa)
+                self._fila.task_done()
+
+    def _finalizar(self, tarefa: TarefaIngestao) -> None:
+        with self._trava:
+            if tarefa.id in self._tarefas:  # A página pode tê-la retirado assim que mudou de estado
+                self._finalizadas.append(tarefa.id)
+            while len(self._finalizadas) > MAX_FINALIZADAS:
+                self._tarefas.pop(self._finalizadas.pop(0), None)
+
+    def _processar(self, tarefa: TarefaIngestao) -> None:
+        os.makedirs(self.pasta, exist_ok=True)
+        hashes = []
+        for i, (nome, conteudo) in enumerate(tarefa.arquivos):
+            tarefa.mensagem = f"Salvando {nome}"
+            caminho = os.path.join(self.pasta, nome_arquivo(nome))
+            hashes.append(salvar_upload(conteudo, caminho))
+            tarefa.caminhos.append(caminho)
+            tarefa.progresso = FRACAO_SALVAR * (i + 1) / len(tarefa.arquivos)
+
+        def atualizar(fracao: float) -> None:
+            tarefa.progresso = FRACAO_SALVAR + (1 - FRACAO_SALVAR) * fracao
+
+        tarefa.mensagem = "Convertendo planilha" if len(tarefa.caminhos) == 1 else "Convertendo planilhas"
+        if len(tarefa.caminhos) == 1:
+            tarefa.resultado = registrar_planilha(tarefa.caminhos[0], hashes[0] if hashes else None, tarefa.modo, progresso=atualizar)
+        else:
+            tarefa.resultado = registrar_planilhas(tarefa.caminhos, progresso=atualizar)
+        tarefa.progresso = 1.0
+
+
+def nome_arquivo(nome: str) -> str:
+    """
+    Nome do arquivo enviado, sem pastas, para que ele só possa ser gravado dentro da pasta db.
+
+    Args:
+        nome (str): Nome informado pelo navegador
+
+    Returns:
+        str: Último componente do nome, com separadores de Windows ou de Unix
+
+    Raises:
+        ValueError: Nome vazio ou que não é um arquivo ("." ou "..")
+    """
+    base = os.path.basename(nome.replace("\\", "/")).strip()
+    if base in ("", ".", ".."):
+        raise ValueError(f"Nome de arquivo inválido: {nome!r}")
+    return base
+
+
+_fila: Optional[FilaIngestao] = None
+_trava = threading.Lock()
+
+
+def fila_ingestao() -> FilaIngestao:
+    """
+    Retorna a fila de ingestão do processo, criando-a no primeiro uso.
+
+    Returns:
+        FilaIngestao: Fila compartilhada por todas as sessões
+    """
+    global _fila
+    with _trava:
+        if _fila is None:
+            _fila = FilaIngestao()
+        return _fila
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from esquema import MEDIDAS, aplicar_esquema
+
+# Membros de cada dimensão nos dados de teste
+MEMBROS = {
+    'Vendedor': [f'Vend {i}' for i in range(12)],
+    'Marca': [f'Marca {i}' for i in range(15)],
+    'Região': ['Centro-Oeste', 'Nordeste', 'Norte', 'Sudeste', 'Sul'],
+    'Grupo': [f'Grupo {i}' for i in range(9)],
+    'Linha': [f'Linha {i}' for i in range(10)],
+    'Médico': [f'Dr {i}' for i in range(40)],
+    'Parceiro': [f'Parc {i}' for i in range(30)],
+    'Produto': [f'Prod {i}' for i in range(60)],
+}
+
+
+def gerar_vendas(linhas: int = 3000, semente: int = 0, anos=(2023, 2024)) -> pd.DataFrame:
+    """
+    Gera dados de vendas com as colunas e os tipos do dataset carregado (ver dados.ler_versao).
+
+    Args:
+        linhas (int): Número de linhas
+        semente (int): Semente dos valores aleatórios
+        anos (Sequence[int]): Anos dos períodos
+
+    Returns:
+        pd.DataFrame: Dados com o esquema compacto aplicado
+    """
+    rng = np.random.default_rng(semente)
+    periodos = pd.to_datetime([f'{ano}-{mes:02d}-01' for ano in anos for mes in range(1, 13)])
+    periodo = periodos[rng.integers(0, len(periodos), linhas)]
+    df = pd.DataFrame({'Período': periodo})
+    for dimensao, membros in MEMBROS.items():
+        df[dimensao] = rng.choice(membros, linhas)
+    df['Prec_Ven_Total'] = rng.uniform(100, 5000, linhas).round(2)
+    for medida in MEDIDAS[1:-1]:
+        df[medida] = (df['Prec_Ven_Total'] * rng.uniform(0.01, 0.2, linhas)).round(2)
+    df['R$_Marg_Contribuicao'] = df['Prec_Ven_Total'] - df[MEDIDAS[1:-1]].sum(axis=1)
+    df['Ano'] = df['Período'].dt.year
+    df['Mês_Num'] = df['Período'].dt.month
+    df['Trimestre'] = df['Período'].dt.quarter
+    df['Semana'] = df['Período'].dt.isocalendar().week.astype('int64')
+    return aplicar_esquema(df)
+
+
+@pytest.fixture
+def vendas() -> pd.DataFrame:
+    return gerar_vendas()
+
+
+def gerar_vendas_com_nulos() -> pd.DataFrame:
+    """Vendas com medidas nulas, como as de planilhas unidas sem alguma das colunas (ver dados.ajustar_tabela)."""
+    df = gerar_vendas(semente=1)
+    rng = np.random.default_rng(1)
+    for medida in ('Prec_Ven_Total', 'R$_Inc_Venda', 'R$_Frete'):
+        df.loc[rng.random(len(df)) < 0.2, medida] = np.nan
+    df['R$_Comissao'] = np.nan  # Medida ausente em todas as planilhas
+    return df
+
+
+@pytest.fixture
+def vendas_com_nulos() -> pd.DataFrame:
+    return gerar_vendas_com_nulos()
+
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+from agregacao import identidade, serie_mensal, somar_por, top_n
+from esquema import MEDIDAS
+from filtros import IndiceFiltros, Selecao, definir_attrs
+
+
+def _esperado(df: pd.DataFrame, dimensao: str) -> pd.DataFrame:
+    return df.groupby(dimensao, observed=True)[MEDIDAS].sum().reset_index()
+
+
+def _selecoes(df: pd.DataFrame):
+    """Os mesmos dados como DataFrame e como Selecao, de todas as linhas e de parte delas."""
+    linhas = np.flatnonzero(df['Ano'].to_numpy() == 2024).astype(np.int32)
+    return [
+        (df, df),
+        (Selecao(df), df),
+        (Selecao(df, linhas), df.take(linhas)),
+        (Selecao(df, np.empty(0, dtype=np.int32)), df.iloc[:0]),
+    ]
+
+
+@pytest.mark.parametrize('dimensao', ['Vendedor', 'Marca', 'Região', 'Ano', 'Período'])
+@pytest.mark.parametrize('fixture', ['vendas', 'vendas_com_nulos'])
+def test_somar_por_igual_ao_groupby(request, fixture, dimensao):
+    df = request.getfixturevalue(fixture)
+    for dados, linhas in _selecoes(df):
+        resultado = somar_por(dados, dimensao)
+        esperado = _esperado(linhas, dimensao)
+        pd.testing.assert_frame_equal(resultado, esperado, check_categorical=False, check_dtype=False)
+        assert not resultado[MEDIDAS].isna().any().any()
+
+
+def test_somar_por_memo_por_identidade(vendas):
+    dados = Selecao(vendas, None, identidade('v1', 'teste', {'Ano': 2024}))
+    assert somar_por(dados, 'Marca') is somar_por(dados, 'Marca')
+    # Sem identidade, nada é guardado
+    assert somar_por(vendas, 'Marca') is not somar_por(vendas, 'Marca')
+
+
+@pytest.mark.parametrize('derivar', [
+    lambda df: df[df['Ano'] == 2024],
+    lambda df: df.copy(deep=False),
+], ids=['filtrado', 'copia'])
+def test_somar_por_derivado_nao_usa_o_memo_do_pai(vendas, derivar):
+    pai = definir_attrs(vendas.copy(), identidade('v-pai', 'teste', {}))
+    do_pai = somar_por(pai, 'Marca')
+    assert somar_por(pai, 'Marca') is do_pai
+    # O pandas copia os attrs para o DataFrame derivado, mas a identidade só vale no próprio pai
+    filho = derivar(pai)
+    assert filho.attrs == pai.attrs
+    resultado = somar_por(filho, 'Marca')
+    assert resultado is not do_pai and resultado is not somar_por(filho, 'Marca')
+    pd.testing.assert_frame_equal(resultado, _esperado(filho, 'Marca'), check_categorical=False, check_dtype=False)
+
+
+def test_serie_mensal_rentabilidade(vendas_com_nulos):
+    serie = serie_mensal(vendas_com_nulos)
+    assert serie['Período'].is_monotonic_increasing
+    esperado = serie['R$_Marg_Contribuicao'] / serie['Prec_Ven_Total'] * 100
+    np.testing.assert_allclose(serie['Rentabilidade (%)'], esperado)
+
+
+@pytest.mark.parametrize('n', [0, 1, 5, 7, 12, 50])
+@pytest.mark.parametrize('fixture', ['vendas', 'vendas_com_nulos'])
+def test_top_n_igual_ao_nlargest(request, fixture, n):
+    agregado = somar_por(request.getfixturevalue(fixture), 'Vendedor')
+    top = top_n(agregado, 'Vendedor', 'Prec_Ven_Total', n)
+    esperado = agregado.nlargest(n, 'Prec_Ven_Total', keep='first')
+    assert top.rotulos == esperado['Vendedor'].astype(object).tolist()
+    np.testing.assert_allclose(top.valores, esperado['Prec_Ven_Total'])
+    assert top.resto == pytest.approx(agregado.drop(esperado.index)['Prec_Ven_Total'].sum())
+
+
+def test_top_n_empates_e_nulos():
+    agregado = pd.DataFrame({'Marca': list('abcdef'), 'Prec_Ven_Total': [5.0, np.nan, 7.0, 5.0, np.nan, 5.0]})
+    top = top_n(agregado, 'Marca', 'Prec_Ven_Total', 3)
+    # Empate desfeito pela ordem dos membros; nulos fora dos maiores e do resto
+    assert top.rotulos == ['c', 'a', 'd']
+    assert top.resto == 5.0
+    assert top_n(agregado, 'Marca', 'Prec_Ven_Total', 3, total=30.0).resto == pytest.approx(13.0)
+    assert top.dataframe('Outros')['Marca'].tolist() == ['c', 'a', 'd', 'Outros']
+
+
+def test_top_n_sobre_selecao_com_nulos(vendas_com_nulos):
+    indice = IndiceFiltros(vendas_com_nulos, ['Ano'])
+    agregado = somar_por(indice.selecionar({'Ano': 2023}), 'Marca')
+    top = top_n(agregado, 'Marca', 'Prec_Ven_Total', 7)
+    assert len(top.rotulos) == 7
+    assert np.isfinite(top.valores).all()
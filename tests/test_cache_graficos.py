@@ -0,0 +1,154 @@
+import pandas as pd
+import pytest
+import cache_graficos
+import graficos
+from agregacao import identidade
+from cache_graficos import CacheGraficos, em_cache
+from filtros import definir_attrs
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Cache do processo novo a cada teste, para não misturar contadores nem entradas."""
+    novo = CacheGraficos()
+    monkeypatch.setattr(cache_graficos, '_cache', novo)
+    return novo
+
+
+def _dados(versao: str = 'v1', **filtros) -> pd.DataFrame:
+    return definir_attrs(pd.DataFrame({'Prec_Ven_Total': [1.0, 2.0]}), identidade(versao, 'teste', filtros))
+
+
+def test_descarta_os_usados_ha_mais_tempo():
+    cache = CacheGraficos(max_entradas=2)
+    cache.guardar('a', 'A')
+    cache.guardar('b', 'B')
+    assert cache.obter('a') == (True, 'A')  # 'a' passa a ser o usado mais recentemente
+    cache.guardar('c', 'C')
+    assert cache.obter('b') == (False, None)
+    assert cache.obter('a') == (True, 'A')
+    assert cache.obter('c') == (True, 'C')
+    assert cache.estatisticas().descartes == 1
+
+
+def test_descarta_pelo_total_de_bytes():
+    cache = CacheGraficos(max_bytes=10)
+    cache.guardar('a', 'x' * 4)
+    cache.guardar('b', 'y' * 4)
+    cache.guardar('c', 'z' * 4)
+    estatisticas = cache.estatisticas()
+    assert (estatisticas.entradas, estatisticas.bytes, estatisticas.descartes) == (2, 8, 1)
+    assert not cache.obter('a')[0]
+    # Regravar a mesma chave troca o tamanho, sem contar duas vezes
+    cache.guardar('b', 'y' * 2)
+    assert cache.estatisticas().bytes == 6
+
+
+def test_nao_guarda_valor_maior_que_o_orcamento():
+    cache = CacheGraficos(max_bytes=10)
+    cache.guardar('a', 'x' * 4)
+    cache.guardar('grande', 'x' * 11)
+    assert cache.obter('grande') == (False, None)
+    # O valor grande não expulsou os demais
+    assert cache.obter('a') == (True, 'x' * 4)
+    assert cache.estatisticas().descartes == 0
+
+
+def test_tamanho_de_textos_bytes_e_objetos():
+    cache = CacheGraficos()
+    cache.guardar('texto', 'ção')
+    assert cache.estatisticas().bytes == len('ção'.encode('utf-8'))
+    cache.guardar('bytes', b'12345')
+    cache.guardar('figura', {'data': [1, 2, 3]})
+    assert cache.estatisticas().bytes > len('ção'.encode('utf-8')) + 5
+
+
+def test_configurar_reduz_o_orcamento():
+    cache = CacheGraficos()
+    for i in range(5):
+        cache.guardar(i, str(i))
+    cache.configurar(max_entradas=2)
+    assert [cache.obter(i)[0] for i in range(5)] == [False, False, False, True, True]
+    cache.configurar(max_bytes=1)
+    estatisticas = cache.estatisticas()
+    assert (estatisticas.entradas, estatisticas.descartes) == (1, 4)
+
+
+def test_estatisticas_e_limpar():
+    cache = CacheGraficos()
+    cache.guardar('a', 'A')
+    cache.obter('a')
+    cache.obter('a')
+    cache.obter('b')
+    estatisticas = cache.estatisticas()
+    assert (estatisticas.acertos, estatisticas.falhas) == (2, 1)
+    assert estatisticas.taxa_acertos == pytest.approx(2 / 3)
+    cache.limpar()
+    assert cache.estatisticas() == cache_graficos.EstatisticasCache(0, 0, 0, 0, 0)
+    assert cache.estatisticas().taxa_acertos == 0.0
+
+
+def test_em_cache_pela_identidade_dos_dados(cache):
+    chamadas = []
+
+    @em_cache
+    def grafico(dados, titulo, cor='azul'):
+        chamadas.append(titulo)
+        return f"{titulo}:{cor}:{dados['Prec_Ven_Total'].sum()}"
+
+    assert grafico(_dados(Ano=2024), 'Vendas') == 'Vendas:azul:3.0'
+    # Mesma identidade, outro DataFrame: o conteúdo não é comparado
+    assert grafico(_dados(Ano=2024), 'Vendas') == 'Vendas:azul:3.0'
+    assert len(chamadas) == 1
+    grafico(_dados(Ano=2023), 'Vendas')
+    grafico(_dados('v2', Ano=2024), 'Vendas')
+    grafico(_dados(Ano=2024), 'Vendas', cor='verde')
+    assert len(chamadas) == 4
+    assert cache.estatisticas().acertos == 1
+
+
+def test_em_cache_sem_identidade_ou_argumento_sem_hash(cache):
+    chamadas = []
+
+    @em_cache
+    def grafico(dados, container=None):
+        chamadas.append(container)
+        return len(dados)
+
+    sem_identidade = pd.DataFrame({'Prec_Ven_Total': [1.0]})
+    grafico(sem_identidade)
+    grafico(sem_identidade)
+    grafico(_dados(), container=[])
+    grafico(_dados(), container=[])
+    assert len(chamadas) == 4
+    assert cache.estatisticas().entradas == 0
+
+
+def test_em_cache_ignora_identidade_herdada_pelo_filho(cache):
+    @em_cache
+    def grafico(dados):
+        return dados['Prec_Ven_Total'].sum()
+
+    pai = _dados('v-pai')
+    assert grafico(pai) == 3.0
+    # O filtro herda os attrs do pai, mas não pode receber o gráfico guardado para o pai
+    filho = pai[pai['Prec_Ven_Total'] > 1.0]
+    assert grafico(filho) == 2.0
+    assert grafico(pai.copy(deep=False)) == 3.0
+    assert (cache.estatisticas().acertos, cache.estatisticas().entradas) == (0, 1)
+
+
+@pytest.mark.parametrize('criar', [
+    lambda df: graficos.criar_grafico_apex_tops(df, 'Marca', 'Top Marcas'),
+    graficos.criar_grafico_top_5_vendedores,
+], ids=['apex_tops', 'top_5_vendedores'])
+def test_aviso_fora_do_cache(cache, monkeypatch, vendas, criar):
+    avisos = []
+    monkeypatch.setattr(graficos.st, 'warning', avisos.append)
+    # Sem a coluna, o aviso aparece em toda chamada, e não só na primeira
+    assert criar(_dados()) == criar(_dados()) == ""
+    assert len(avisos) == 2
+    # Com a coluna, o HTML vem do cache a partir da segunda chamada
+    definir_attrs(vendas, identidade('v1', 'teste', {}))
+    assert criar(vendas) is criar(vendas)
+    assert cache.estatisticas().acertos == 1 and len(avisos) == 2
@@ -0,0 +1,110 @@
+import uuid
+from typing import Optional
+import numpy as np
+import pandas as pd
+import pytest
+from agregacao import ATRIBUTO_CHAVE, serie_mensal, somar_por
+from conftest import gerar_vendas, gerar_vendas_com_nulos
+from cubo import AGREGADO_BASE, AGREGADO_SERIE, COLUNAS_FILTRO, Cubo, agregar, consolidar
+from esquema import MEDIDAS
+
+FILTROS = [
+    {},
+    {'Ano': 2024},
+    {'Ano': 2023, 'Mês': 'Março'},
+    {'Região': 'Sul', 'Marca': 'Marca 3'},
+    {'Ano': 2024, 'Mês': 'Dezembro', 'Região': 'Norte', 'Marca': 'Marca 1'},
+    {'Ano': 2030},
+]
+
+
+def _filtrar(df: pd.DataFrame, filtros: dict) -> pd.DataFrame:
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, valor in filtros.items():
+        mascara &= (df[coluna] == valor).to_numpy()
+    return df[mascara]
+
+
+def _lote(df: pd.DataFrame) -> pd.DataFrame:
+    """As linhas como chegam da planilha na ingestão: dimensões em texto e sem o nome do mês (derivado na carga)."""
+    categoricas = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    return df.drop(columns='Mês').astype({c: object for c in categoricas if c != 'Mês'})
+
+
+def _cubo(df: pd.DataFrame, versao: Optional[str] = None) -> Cubo:
+    # Agregado em dois lotes e consolidado, como na ingestão de uma partição. Cada cubo tem a sua
+    # versão, como os datasets registrados: o memo de somar_por é pela identidade das seleções
+    versao = versao or uuid.uuid4().hex
+    lote = _lote(df)
+    metade = len(lote) // 2
+    return Cubo(consolidar([agregar(lote.iloc[:metade]), agregar(lote.iloc[metade:])]), versao)
+
+
+@pytest.fixture(scope='module', params=[gerar_vendas, gerar_vendas_com_nulos], ids=['vendas', 'vendas_com_nulos'])
+def dados_e_cubo(request):
+    dados = request.param()
+    return dados, _cubo(dados)
+
+
+@pytest.mark.parametrize('filtros', FILTROS)
+def test_agregado_base_soma_igual_as_linhas(dados_e_cubo, filtros):
+    dados, cubo = dados_e_cubo
+    selecao = cubo.selecionar(AGREGADO_BASE, filtros)
+    linhas = _filtrar(dados, filtros)
+    np.testing.assert_allclose(selecao[MEDIDAS].sum().to_numpy(), linhas[MEDIDAS].sum().to_numpy())
+    assert selecao['Linhas'].sum() == len(linhas)
+
+
+@pytest.mark.parametrize('dimensao', ['Vendedor', 'Médico', 'Linha'])
+@pytest.mark.parametrize('filtros', FILTROS[:5])
+def test_agregado_da_dimensao_igual_ao_groupby(dados_e_cubo, dimensao, filtros):
+    dados, cubo = dados_e_cubo
+    agregado = somar_por(cubo.selecionar(dimensao, filtros), dimensao)
+    esperado = _filtrar(dados, filtros).groupby(dimensao, observed=True)[MEDIDAS].sum()
+    agregado = agregado.set_index(agregado[dimensao].astype(str))[MEDIDAS].sort_index()
+    esperado.index = esperado.index.astype(str)
+    pd.testing.assert_frame_equal(agregado, esperado.sort_index(), check_names=False, check_index_type=False)
+
+
+@pytest.mark.parametrize('filtros', FILTROS[:4])
+def test_serie_mensal_igual_as_linhas(dados_e_cubo, filtros):
+    dados, cubo = dados_e_cubo
+    serie = serie_mensal(cubo.selecionar(AGREGADO_SERIE, filtros))
+    linhas = _filtrar(dados, filtros)
+    esperado = linhas.groupby(linhas['Período'].dt.to_period('M').dt.to_timestamp())['Prec_Ven_Total'].sum()
+    np.testing.assert_allclose(serie['Prec_Ven_Total'], esperado.to_numpy())
+    assert list(serie['Período']) == list(esperado.index)
+
+
+def test_identidade_da_selecao(vendas):
+    cubo = _cubo(vendas, 'v1')
+    chave = cubo.selecionar(AGREGADO_BASE, {'Ano': 2024}).attrs[ATRIBUTO_CHAVE]
+    assert chave == cubo.selecionar(AGREGADO_BASE, {'Ano': 2024}).attrs[ATRIBUTO_CHAVE]
+    assert chave != cubo.selecionar(AGREGADO_BASE, {'Ano': 2023}).attrs[ATRIBUTO_CHAVE]
+    assert chave != cubo.selecionar('Vendedor', {'Ano': 2024}).attrs[ATRIBUTO_CHAVE]
+    assert chave != _cubo(vendas, 'v2').selecionar(AGREGADO_BASE, {'Ano': 2024}).attrs[ATRIBUTO_CHAVE]
+
+
+def test_selecao_parte_da_anterior(vendas):
+    cubo = _cubo(vendas)
+    base = cubo.selecionar(AGREGADO_BASE, {'Ano': 2024})
+    refinada = cubo.selecionar(AGREGADO_BASE, {'Ano': 2024, 'Região': 'Sul'}, anterior=base)
+    direta = cubo.selecionar(AGREGADO_BASE, {'Ano': 2024, 'Região': 'Sul'})
+    np.testing.assert_array_equal(np.sort(refinada.linhas), np.sort(direta.linhas))
+    assert refinada.attrs == direta.attrs
+
+
+def test_dimensao_inexistente_e_cubo_vazio(vendas):
+    assert _cubo(vendas).selecionar('Produto', {'Ano': 2024}).empty
+    vazio = Cubo(pd.DataFrame())
+    assert vazio.selecionar(AGREGADO_BASE, {'Ano': 2024}).empty
+    assert vazio.facetas.colunas == []
+
+
+def test_facetas_contam_as_linhas(vendas):
+    facetas = _cubo(vendas).facetas
+    assert facetas.colunas == COLUNAS_FILTRO
+    esperado = _filtrar(vendas, {'Ano': 2024, 'Região': 'Sul'})['Mês'].value_counts()
+    opcoes = facetas.opcoes('Mês', {'Ano': 2024, 'Região': 'Sul'})
+    assert opcoes == {mes: int(esperado[mes]) for mes in esperado.index if esperado[mes] > 0}
+    assert list(opcoes) == [mes for mes in vendas['Mês'].cat.categories if mes in opcoes]
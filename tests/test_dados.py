@@ -0,0 +1,89 @@
+import os
+import pytest
+import dados
+import registro
+import tarefas
+
+
+@pytest.fixture
+def pasta_db(tmp_path, monkeypatch):
+    """Registro e partições em uma pasta temporária, sem planilhas para registrar."""
+    monkeypatch.setattr(registro, "PASTA_DB", str(tmp_path))
+    monkeypatch.setattr(registro, "ARQUIVO_REGISTRO", str(tmp_path / "registro.json"))
+    monkeypatch.setattr(dados, "planilhas_padrao", lambda: [])
+    dados._versao_registrada.cache_clear()
+    yield tmp_path
+    dados._versao_registrada.cache_clear()
+
+
+def _registrar(pasta, versao: str) -> None:
+    arquivos = {}
+    for campo in ("arquivo", "cubo"):
+        arquivos[campo] = str(pasta / f"{versao}.{campo}.parquet")
+        open(arquivos[campo], "wb").close()
+    registro.adicionar_dataset(versao, "planilha.xlsx", {"2024-01": arquivos})
+
+
+def test_versao_ativa_relida_so_quando_o_registro_muda(pasta_db, monkeypatch):
+    leituras = []
+    ler_registro = registro.ler_registro
+    monkeypatch.setattr(registro, "ler_registro", lambda: leituras.append(1) or ler_registro())
+
+    assert dados.versao_ativa() is None
+    _registrar(pasta_db, "v1")
+    assert dados.versao_ativa() == "v1"
+    lidas = len(leituras)
+    assert dados.versao_ativa() == dados.versao_ativa() == "v1"
+    assert len(leituras) == lidas
+
+    _registrar(pasta_db, "v2")
+    assert dados.versao_ativa() == "v2"
+    registro.ativar_dataset("v1")
+    assert dados.versao_ativa() == "v1"
+
+
+def test_versao_ativa_com_registro_ilegivel_ou_particao_ausente(pasta_db):
+    _registrar(pasta_db, "v1")
+    os.remove(pasta_db / "v1.cubo.parquet")
+    registro.ativar_dataset("v1")
+    assert dados.versao_ativa() is None
+
+    (pasta_db / "registro.json").write_text("{\"ativo\": ", encoding="utf-8")
+    assert dados.versao_ativa() is None
+
+
+class FilaFalsa:
+    """Fila que só guarda as tarefas enviadas, sem convertê-las."""
+
+    def __init__(self):
+        self.enviadas = {}
+
+    def enviar_planilhas(self, caminhos):
+        id_tarefa = str(len(self.enviadas))
+        self.enviadas[id_tarefa] = tarefas.TarefaIngestao([], caminhos=list(caminhos))
+        return id_tarefa
+
+    def consultar(self, id_tarefa):
+        return self.enviadas.get(id_tarefa)
+
+    def retirar(self, id_tarefa):
+        return self.enviadas.get(id_tarefa)
+
+
+def test_versao_ativa_envia_as_planilhas_da_pasta_db_a_fila(pasta_db, monkeypatch):
+    fila = FilaFalsa()
+    monkeypatch.setattr(tarefas, "fila_ingestao", lambda: fila)
+    monkeypatch.setattr(dados, "planilhas_padrao", lambda: ["db/2023.xlsx", "db/2024.xlsx"])
+    monkeypatch.setattr(dados, "_tarefa_registro", None)
+
+    # A página não espera a conversão, e os reruns seguintes acompanham a mesma tarefa
+    assert dados.versao_ativa() is None
+    assert dados.versao_ativa() is None
+    assert len(fila.enviadas) == 1
+    assert dados.tarefa_registro().caminhos == ["db/2023.xlsx", "db/2024.xlsx"]
+
+    _registrar(pasta_db, "v1")
+    assert dados.versao_ativa() == "v1"
+    assert len(fila.enviadas) == 1
+    # Com o dataset disponível, a tarefa sai da fila
+    assert dados.tarefa_registro() is None
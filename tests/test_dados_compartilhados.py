@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+import streamlit as st
+import chats
+import grafico_vendedor
+import graficos
+from agregacao import serie_mensal, somar_por
+from indicadores import calcular_indicadores
+from minigraficos import tendencias_indicadores
+
+# Cada gráfico (e cálculo dos cards) recebendo o dataset compartilhado; os que desenham direto na
+# página recebem o próprio st como contêiner
+GRAFICOS = {
+    'chats.top_5_vendedores': chats.criar_grafico_top_5_vendedores,
+    'chats.rentabilidade_vendedores': chats.criar_grafico_rentabilidade_vendedores,
+    'chats.top_5_medicos': chats.criar_grafico_top_5_medicos,
+    'chats.top_5_parceiros': chats.criar_grafico_top_5_parceiros,
+    'chats.por_regiao_pie': chats.criar_grafico_por_regiao_pie,
+    'chats.por_regiao_pie_rentabilidade': chats.criar_grafico_por_regiao_pie_rentabilidade,
+    'chats.por_regiao': chats.criar_grafico_por_regiao,
+    'chats.evolucao_vendas_rentabilidade': chats.criar_grafico_evolucao_vendas_rentabilidade,
+    'chats.top_marcas': lambda df: chats.criar_grafico_top_marcas(df, st),
+    'graficos.evolucao_vendas_apexcharts': lambda df: graficos.criar_grafico_evolucao_vendas_apexcharts(df, st),
+    'graficos.distribuicao_grupo': lambda df: graficos.criar_grafico_distribuicao_grupo(df, st),
+    'graficos.top_marcas': lambda df: graficos.criar_grafico_top_marcas(df, st),
+    'graficos.top_linha': lambda df: graficos.criar_grafico_top_linha(df, st),
+    'graficos.top_grupo': lambda df: graficos.criar_grafico_top_grupo(df, st),
+    'graficos.mini_evolucao_vendas': lambda df: graficos.criar_mini_grafico_evolucao_vendas(df, st),
+    'graficos.vendas_por_vendedor': lambda df: graficos.criar_grafico_vendas_por_vendedor(df, st),
+    'graficos.apex_tops': lambda df: graficos.criar_grafico_apex_tops(df, 'Marca', 'Top Marcas'),
+    'graficos.top_5_vendedores': graficos.criar_grafico_top_5_vendedores,
+    'graficos.distribuicao_vendedor': lambda df: graficos.criar_grafico_distribuicao_vendedor(df, st),
+    'graficos.distribuicao_medicos': lambda df: graficos.criar_grafico_distribuicao_medicos(df, st),
+    'grafico_vendedor.evolucao_vendas': grafico_vendedor.criar_grafico_evolucao_vendas,
+    'grafico_vendedor.top_marcas': lambda df: grafico_vendedor.criar_grafico_top_marcas(df, 'Marca'),
+    'grafico_vendedor.top_grupos': grafico_vendedor.criar_grafico_top_grupos,
+    'grafico_vendedor.distribuicao_grupo': lambda df: grafico_vendedor.criar_grafico_distribuicao_grupo(df, 'Grupo'),
+    'grafico_vendedor.vendas_por_vendedor': grafico_vendedor.criar_grafico_vendas_por_vendedor,
+    'grafico_vendedor.vendas_menos_incentivo': grafico_vendedor.criar_grafico_vendas_menos_incentivo,
+    'indicadores': calcular_indicadores,
+    'tendencias': lambda df: tendencias_indicadores(serie_mensal(df)),
+    'somar_por': lambda df: somar_por(df, 'Marca'),
+}
+
+
+@pytest.mark.parametrize('copy_on_write', [False, True], ids=['sem_cow', 'com_cow'])
+@pytest.mark.parametrize('nome', list(GRAFICOS))
+def test_grafico_nao_altera_dataset(vendas, nome, copy_on_write):
+    original = vendas.copy(deep=True)
+    with pd.option_context('mode.copy_on_write', copy_on_write):
+        GRAFICOS[nome](vendas)
+    pd.testing.assert_frame_equal(vendas, original)
+    assert vendas.attrs == original.attrs
@@ -0,0 +1,88 @@
+import itertools
+import numpy as np
+import pandas as pd
+import pytest
+from filtros import ATRIBUTO_DONO, IndiceFiltros, Selecao
+
+COLUNAS = ['Vendedor', 'Ano', 'Mês', 'Região', 'Marca']
+
+# Combinações de filtros, incluindo valores sem linhas e ausentes dos dados
+FILTROS = [
+    {},
+    {'Ano': 2024},
+    {'Ano': 2023, 'Mês': 'Março'},
+    {'Região': 'Sul', 'Marca': 'Marca 3'},
+    {'Vendedor': 'Vend 5', 'Ano': 2024, 'Mês': 'Dezembro', 'Região': 'Norte', 'Marca': 'Marca 1'},
+    {'Ano': 2030},
+    {'Marca': 'Marca inexistente', 'Ano': 2024},
+]
+
+
+def _mascara(df: pd.DataFrame, filtros: dict) -> np.ndarray:
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, valor in filtros.items():
+        mascara &= (df[coluna] == valor).to_numpy()
+    return np.flatnonzero(mascara)
+
+
+@pytest.fixture
+def indice(vendas):
+    return IndiceFiltros(vendas, COLUNAS)
+
+
+@pytest.mark.parametrize('filtros', FILTROS)
+def test_selecionar_igual_a_mascara(vendas, indice, filtros):
+    selecao = indice.selecionar(filtros, {'origem': 'teste'})
+    esperado = _mascara(vendas, filtros)
+    linhas = np.arange(len(vendas)) if selecao.linhas is None else selecao.linhas
+    np.testing.assert_array_equal(np.sort(linhas), esperado)
+    assert len(selecao) == len(esperado)
+    assert selecao.attrs == {'origem': 'teste'}
+    assert selecao.filtros == filtros
+    pd.testing.assert_frame_equal(selecao.dataframe().sort_index(), vendas.take(esperado))
+
+
+@pytest.mark.parametrize('anterior, atual', list(itertools.permutations(FILTROS[:5], 2)))
+def test_selecionar_a_partir_da_anterior(vendas, indice, anterior, atual):
+    selecao = indice.selecionar(atual, anterior=indice.selecionar(anterior))
+    linhas = np.arange(len(vendas)) if selecao.linhas is None else selecao.linhas
+    np.testing.assert_array_equal(np.sort(linhas), _mascara(vendas, atual))
+
+
+def test_mesmos_filtros_reaproveitam_as_linhas(indice):
+    anterior = indice.selecionar({'Ano': 2024, 'Região': 'Sul'})
+    atual = indice.selecionar({'Região': 'Sul', 'Ano': 2024}, anterior=anterior)
+    assert atual.linhas is anterior.linhas
+
+
+def test_selecao_de_outros_dados_nao_e_reaproveitada(vendas, indice):
+    outros = IndiceFiltros(vendas.iloc[::-1].reset_index(drop=True), COLUNAS)
+    anterior = outros.selecionar({'Ano': 2024})
+    atual = indice.selecionar({'Ano': 2024, 'Região': 'Sul'}, anterior=anterior)
+    np.testing.assert_array_equal(np.sort(atual.linhas), _mascara(vendas, {'Ano': 2024, 'Região': 'Sul'}))
+
+
+def test_linhas_em_ordem_crescente_sem_nulos(vendas):
+    dados = vendas.copy()
+    dados.loc[::7, 'Região'] = None
+    indice = IndiceFiltros(dados, ['Região'])
+    for regiao in dados['Região'].dropna().unique():
+        linhas = indice.linhas('Região', regiao)
+        assert (np.diff(linhas) > 0).all()
+        np.testing.assert_array_equal(linhas, _mascara(dados, {'Região': regiao}))
+    assert len(indice.linhas('Região', 'Exterior')) == 0
+
+
+def test_coluna_sem_indice(indice):
+    with pytest.raises(KeyError, match='Coluna sem índice de filtro'):
+        indice.selecionar({'Produto': 'Prod 1'})
+
+
+def test_selecao_como_dataframe(vendas):
+    linhas = np.array([5, 2, 9], dtype=np.int32)
+    selecao = Selecao(vendas, linhas, {'chave': 1})
+    pd.testing.assert_series_equal(selecao['Marca'], vendas['Marca'].take(linhas))
+    assert list(selecao.columns) == list(vendas.columns)
+    assert not selecao.empty and Selecao(vendas, linhas[:0]).empty
+    df = selecao.dataframe(['Ano'])
+    assert df.attrs['chave'] == 1 and df.attrs[ATRIBUTO_DONO]() is df
@@ -0,0 +1,113 @@
+import logging
+import sys
+import types
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from openpyxl import Workbook
+import registro
+from conftest import gerar_vendas
+from esquema import DIMENSOES, MEDIDAS
+from ingestao import ABA_DADOS, converter_planilha, preparar_dados, registrar_planilhas
+
+
+@pytest.fixture
+def pasta_particoes(tmp_path, monkeypatch):
+    monkeypatch.setattr(registro, "PASTA_PARTICOES", str(tmp_path / "particoes"))
+    return tmp_path
+
+
+def _planilha(pasta, linhas: int = 6, nome: str = "vendas.xlsx", anos=(2023, 2024), **alteracoes) -> str:
+    """Grava uma aba DADOS com as colunas da planilha original; alteracoes troca células por (coluna, linha de dados)."""
+    df = gerar_vendas(linhas, anos=anos)[['Período', *DIMENSOES, *MEDIDAS]].astype(object)
+    df['Código'] = pd.Series(range(linhas), dtype=object)
+    for (coluna, linha), valor in alteracoes.get('celulas', {}).items():
+        df.at[linha, coluna] = valor
+    wb = Workbook()
+    aba = wb.active
+    aba.title = ABA_DADOS
+    aba.append(list(df.columns))
+    for linha in df.itertuples(index=False):
+        aba.append([valor.to_pydatetime() if hasattr(valor, 'to_pydatetime') else valor for valor in linha])
+    caminho = str(pasta / nome)
+    wb.save(caminho)
+    return caminho
+
+
+def _ler(particoes: dict):
+    return pq.ParquetDataset([p["arquivo"] for p in particoes.values()]).read().to_pandas()
+
+
+def test_texto_depois_do_primeiro_lote_vira_coluna_de_texto(pasta_particoes):
+    caminho = _planilha(pasta_particoes, celulas={('Código', 4): 'A-17'})
+    dados = _ler(converter_planilha(caminho, tamanho_lote=2))
+    assert dados['Código'].dtype == object
+    assert sorted(dados['Código']) == sorted(['0', '1', '2', '3', 'A-17', '5'])
+
+
+def test_texto_em_medida_aponta_coluna_e_linha(pasta_particoes):
+    caminho = _planilha(pasta_particoes, celulas={('R$_Frete', 4): 'n/d'})
+    with pytest.raises(ValueError, match=r"'R\$_Frete', linha 6 .*'n/d'"):
+        converter_planilha(caminho, tamanho_lote=2)
+    # Nenhuma partição temporária fica para trás
+    assert not [n for n in (pasta_particoes / "particoes").iterdir() if n.name.endswith(".tmp")]
+
+
+def test_celulas_com_espacos_contam_como_vazias(pasta_particoes):
+    caminho = _planilha(pasta_particoes, celulas={('R$_Frete', 4): '  '})
+    dados = _ler(converter_planilha(caminho, tamanho_lote=2))
+    assert dados['R$_Frete'].isna().sum() == 1
+
+
+def test_memoria_medida_na_tabela_gravada(pasta_particoes):
+    caminho = _planilha(pasta_particoes, linhas=30)
+    particoes = converter_planilha(caminho)
+    for particao in particoes.values():
+        gravada = pq.read_table(particao["arquivo"])
+        assert particao["depois_mb"] == pytest.approx(gravada.nbytes / 1024 ** 2, abs=1e-3)
+        assert particao["antes_mb"] > particao["depois_mb"]
+
+
+def test_periodos_invalidos_descartados_com_aviso(caplog):
+    df = pd.DataFrame({'Período': ['05/01/2024', 'sem data', None, '10/02/2024'], 'Prec_Ven_Total': [1.0, 2.0, 3.0, 4.0]},
+                      index=[2, 3, 4, 5])
+    with caplog.at_level(logging.WARNING, logger='ingestao'):
+        resultado = preparar_dados(df)
+    assert resultado.index.tolist() == [2, 5]
+    assert resultado['Mês_Num'].tolist() == [1, 2]
+    assert "2 linha(s)" in caplog.text and "linhas 3, 4" in caplog.text
+
+
+def test_sem_coluna_periodo():
+    with pytest.raises(ValueError, match="'Período'"):
+        preparar_dados(pd.DataFrame({'Prec_Ven_Total': [1.0]}))
+
+
+def test_planilhas_convertidas_sem_executar_o_main(pasta_particoes, monkeypatch):
+    monkeypatch.setattr(registro, "PASTA_DB", str(pasta_particoes))
+    monkeypatch.setattr(registro, "ARQUIVO_REGISTRO", str(pasta_particoes / "registro.json"))
+    # Como o Streamlit, que instala o script da página como __main__: os processos de conversão não o executam
+    pagina = pasta_particoes / "pagina.py"
+    pagina.write_text("raise SystemExit('página executada')")
+    principal = types.ModuleType("__main__")
+    principal.__file__ = str(pagina)
+    monkeypatch.setitem(sys.modules, "__main__", principal)
+
+    caminhos = [_planilha(pasta_particoes, 30, "vendas v09.xlsx", anos=(2023, 2024)),
+                _planilha(pasta_particoes, 30, "vendas v10.xlsx", anos=(2024,))]
+    resultado = registrar_planilhas(caminhos, processos=2)
+    particoes = registro.buscar_dataset(resultado.versao)["particoes"]
+    assert resultado.convertida and sys.modules["__main__"] is principal
+    # Os meses da planilha mais nova vêm dela; os demais, da mais antiga
+    meses_v10 = {f"{p:%Y-%m}" for p in gerar_vendas(30, anos=(2024,))['Período']}
+    assert {chave for chave, p in particoes.items() if p["planilha"] == "vendas v10.xlsx"} == meses_v10
+    assert {f"{p:%Y-%m}" for p in gerar_vendas(30)['Período']} | meses_v10 == set(particoes)
+
+
+def test_erro_nos_dados_volta_do_processo_de_conversao(pasta_particoes, monkeypatch):
+    monkeypatch.setattr(registro, "PASTA_DB", str(pasta_particoes))
+    monkeypatch.setattr(registro, "ARQUIVO_REGISTRO", str(pasta_particoes / "registro.json"))
+    caminhos = [_planilha(pasta_particoes, 6, "vendas v09.xlsx"),
+                _planilha(pasta_particoes, 6, "vendas v10.xlsx", celulas={('R$_Frete', 4): 'n/d'})]
+    with pytest.raises(ValueError, match=r"'R\$_Frete', linha 6"):
+        registrar_planilhas(caminhos)
@@ -0,0 +1,64 @@
+import json
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+import serializacao
+from serializacao import compactar, para_json, registrar_payload
+
+
+@pytest.mark.parametrize('texto', [
+    '</script><script>alert(1)</script>',
+    'A & B <b>',
+    'linha\u2028separada\u2029parágrafo',
+    '<!-- comentário -->',
+])
+def test_para_json_escapa_caracteres_do_html(texto):
+    resultado = para_json({'rotulo': texto, texto: [texto]})
+    for caractere in '<>&\u2028\u2029':
+        assert caractere not in resultado
+    assert json.loads(resultado) == {'rotulo': texto, texto: [texto]}
+
+
+def test_para_json_mantem_acentos_e_sem_espacos():
+    assert para_json({'Região': 'São Paulo', 'Mês': ['Março']}) == '{"Região":"São Paulo","Mês":["Março"]}'
+
+
+def test_para_json_nulos_no_lugar_de_nan_e_infinito():
+    valores = [1.0, np.nan, np.inf, -np.inf, np.float32('nan'), None]
+    assert para_json(valores) == '[1,null,null,null,null,null]'
+    assert para_json(pd.Series([np.nan, 2.5])) == '[null,2.5]'
+
+
+def test_compactar_tipos_do_numpy_e_do_pandas():
+    valor = {
+        np.int64(3): np.int32(7),
+        'array': np.array([1.234, 2.0]),
+        'serie': pd.Series([1, 2], dtype='int64'),
+        'indice': pd.Index(['a', 'b']),
+        'bool': np.bool_(True),
+        'tupla': (np.float64(0.005), 12.0),
+    }
+    resultado = compactar(valor)
+    assert resultado == {'3': 7, 'array': [1.23, 2], 'serie': [1, 2], 'indice': ['a', 'b'], 'bool': True, 'tupla': [0.01, 12]}
+    assert type(resultado['3']) is int and type(resultado['array'][1]) is int
+    json.dumps(resultado, allow_nan=False)
+
+
+def test_casas_decimais():
+    assert para_json([1234.5678, 0.001]) == '[1234.57,0]'
+    assert para_json([1234.5678], casas=None) == '[1234.5678]'
+    # Inteiros grandes demais para o float continuam float
+    assert compactar(2.0 ** 60) == 2.0 ** 60
+
+
+def test_registrar_payload(monkeypatch, caplog):
+    monkeypatch.setattr(serializacao, 'LIMITE_BYTES', 10)
+    original = {'valores': [1.23456789] * 3}
+    enviado = para_json(original)
+    with caplog.at_level(logging.WARNING, logger='serializacao'):
+        tamanho = registrar_payload('teste', enviado, original)
+    assert tamanho.bytes == len(enviado.encode('utf-8'))
+    assert tamanho.bytes < tamanho.bytes_sem_compactar
+    assert serializacao.tamanhos_payload()['teste'] == tamanho
+    assert 'teste' in caplog.text
@@ -0,0 +1,51 @@
+import io
+import pytest
+import tarefas
+from tarefas import FALHOU, FilaIngestao, nome_arquivo
+
+
+@pytest.mark.parametrize('nome, esperado', [
+    ('vendas.xlsx', 'vendas.xlsx'),
+    ('../../etc/vendas.xlsx', 'vendas.xlsx'),
+    ('/tmp/vendas.xlsm', 'vendas.xlsm'),
+    ('C:\\Users\\ana\\vendas.xlsx', 'vendas.xlsx'),
+])
+def test_nome_arquivo_sem_pastas(nome, esperado):
+    assert nome_arquivo(nome) == esperado
+
+
+@pytest.mark.parametrize('nome', ['', '  ', '.', '..', 'db/..', 'pasta/'])
+def test_nome_arquivo_invalido(nome):
+    with pytest.raises(ValueError, match='Nome de arquivo inválido'):
+        nome_arquivo(nome)
+
+
+def _enviar(fila, nome='vendas.xlsx'):
+    # Conteúdo que não é planilha: a tarefa falha logo depois de salvar o arquivo
+    return fila.enviar([(nome, io.BytesIO(b'sem planilha'))])
+
+
+def test_upload_gravado_so_dentro_da_pasta(tmp_path):
+    fila = FilaIngestao(str(tmp_path / 'db'))
+    with pytest.raises(ValueError):
+        _enviar(fila, '..')
+    id_tarefa = _enviar(fila, '../fora.xlsx')
+    fila._fila.join()
+    assert fila.consultar(id_tarefa).caminhos == [str(tmp_path / 'db' / 'fora.xlsx')]
+    assert not (tmp_path / 'fora.xlsx').exists()
+
+
+def test_tarefas_finalizadas_saem_da_fila(tmp_path, monkeypatch):
+    monkeypatch.setattr(tarefas, 'MAX_FINALIZADAS', 2)
+    fila = FilaIngestao(str(tmp_path))
+    ids = [_enviar(fila) for _ in range(4)]
+    fila._fila.join()
+
+    # Das que nunca foram retiradas, ficam só as mais recentes
+    assert [fila.consultar(i) is not None for i in ids] == [False, False, True, True]
+
+    tarefa = fila.retirar(ids[2])
+    assert tarefa.estado == FALHOU
+    assert fila.consultar(ids[2]) is None
+    assert fila.retirar(ids[2]) is None
+    assert fila.consultar(ids[3]) is not None
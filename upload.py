@@ -1,23 +1,96 @@
 import streamlit as st
 import os
-import pandas as pd
+from ingestao import MODO_ANEXAR, MODO_SUBSTITUIR, previa
+from registro import buscar_dataset
+from tarefas import CONCLUIDA, FALHOU, fila_ingestao
 
 # Definir o caminho da pasta onde os arquivos serão salvos
 save_folder = "db"
 if not os.path.exists(save_folder):
     os.makedirs(save_folder)
 
-# Upload do arquivo
-uploaded_file = st.sidebar.file_uploader("Upload da planilha análise.xlsm", type=["xlsx", "xlsm"])
+# Upload de uma ou mais planilhas (ex.: uma por ano); várias planilhas formam um único dataset
+uploaded_files = st.sidebar.file_uploader(
+    "Upload da planilha análise.xlsm", type=["xlsx", "xlsm"], accept_multiple_files=True
+)
 
-if uploaded_file is not None:
-    # Salvar o arquivo na pasta 'db'
-    save_path = os.path.join(save_folder, uploaded_file.name)
-    with open(save_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
-    st.success(f"Arquivo salvo com sucesso em: {save_path}")
+# Anexar: os meses da planilha substituem ou complementam os do dataset ativo, e os demais são mantidos.
+# Com várias planilhas, o dataset é sempre substituído pela junção delas
+modo = st.sidebar.radio(
+    "Modo de carga",
+    [MODO_SUBSTITUIR, MODO_ANEXAR],
+    format_func={MODO_SUBSTITUIR: "Substituir o dataset", MODO_ANEXAR: "Anexar meses ao dataset ativo"}.get
+)
 
-    # Carregar a aba "DADOS" e exibir as primeiras linhas
-    df = pd.read_excel(save_path, sheet_name="DADOS")
+# Intervalo, em segundos, da consulta ao andamento da ingestão
+INTERVALO_CONSULTA = 1
+
+if uploaded_files:
+    # O uploader devolve os mesmos arquivos a cada rerun; só um conjunto novo vira tarefa
+    ids_arquivos = tuple(f.file_id for f in uploaded_files)
+    if st.session_state.get("arquivos_enviados") != ids_arquivos:
+        st.session_state["arquivos_enviados"] = ids_arquivos
+        # Salvar na pasta 'db' e registrar pelo hash do conteúdo em segundo plano, um upload por vez.
+        # Meses repetidos entre planilhas ficam com a versão mais nova
+        try:
+            st.session_state["tarefa_ingestao"] = fila_ingestao().enviar([(f.name, f) for f in uploaded_files], modo)
+        except ValueError as erro:
+            st.error(f"Erro ao processar a planilha: {erro}")
+
+
+def exibir_resultado(tarefa):
+    for caminho in tarefa.caminhos:
+        st.success(f"Arquivo salvo com sucesso em: {caminho}")
+    resultado = tarefa.resultado
+    versao = resultado.versao
+    if resultado.convertida:
+        st.success(f"Planilha registrada como dataset ativo ({versao[:12]}).")
+        st.caption(
+            f"Meses novos ou alterados: {', '.join(resultado.alteradas) or 'nenhum'} · "
+            f"meses reaproveitados: {len(resultado.mantidas)}"
+        )
+    else:
+        st.info(f"Planilha idêntica já registrada ({versao[:12]}); conversão reaproveitada.")
+
+    # Memória que cada sessão dos dashboards ocupa com e sem o esquema compacto
+    memoria = buscar_dataset(versao).get("memoria")
+    if memoria:
+        st.caption(
+            f"Memória do dataset: {memoria['antes_mb']} MB sem esquema → "
+            f"{memoria['depois_mb']} MB com esquema (-{memoria['reducao_pct']}%)"
+        )
+
+    # Exibir apenas as primeiras linhas do primeiro lote convertido
     st.write("Visualizando as primeiras linhas da aba 'DADOS':")
-    st.dataframe(df.head())
\ No newline at end of file
+    st.dataframe(previa(versao))
+
+
+tarefa = fila_ingestao().consultar(st.session_state.get("tarefa_ingestao", ""))
+
+
+# Enquanto a tarefa não termina, só este trecho é reexecutado, a cada INTERVALO_CONSULTA segundos
+@st.fragment(run_every=INTERVALO_CONSULTA if tarefa is not None and not tarefa.finalizada else None)
+def acompanhar_ingestao():
+    tarefa = fila_ingestao().consultar(st.session_state.get("tarefa_ingestao", ""))
+    if tarefa is not None and not tarefa.finalizada:
+        posicao = fila_ingestao().posicao(tarefa.id)
+        texto = f"Aguardando {posicao} upload(s) na fila" if posicao else tarefa.mensagem
+        st.progress(tarefa.progresso, text=texto)
+        st.caption("Os dashboards continuam com o dataset anterior até o fim da ingestão.")
+    elif tarefa is not None:
+        # A tarefa terminou: sai da fila e fica só nesta sessão, e a página inteira é reexecutada
+        # para parar a consulta periódica
+        st.session_state["tarefa_finalizada"] = fila_ingestao().retirar(tarefa.id)
+        del st.session_state["tarefa_ingestao"]
+        st.rerun()
+    else:
+        tarefa = st.session_state.get("tarefa_finalizada")
+        if tarefa is None:
+            return
+        if tarefa.estado == FALHOU:
+            st.error(f"Erro ao processar a planilha: {tarefa.erro}")
+        elif tarefa.estado == CONCLUIDA:
+            exibir_resultado(tarefa)
+
+
+acompanhar_ingestao()